@@ -0,0 +1,44 @@
+"""Export benchmark.
+
+Run from the repository root with ``python -m benchmarks.bench_export``. Each synthetic file is parsed, then written back
+with ``GedcomParser.export_to`` to a buffered file. The throughput in MB/s and the time per record should stay flat as
+the file grows, showing that the export is linear in the size of the file. Pass ``--format json`` to benchmark the JSON
+export instead of the GEDCOM one.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.pygedcom import GedcomParser
+from .generator import generate
+
+SIZES = [2_000, 8_000, 32_000, 128_000]
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument("--format", choices=["gedcom", "json"], default="gedcom", help="the format to export to")
+    options = arguments.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'individuals':>12} {'records':>10} {'MB':>10} {'seconds':>10} {'MB/s':>10} {'us/record':>10}")
+        for size in SIZES:
+            path = os.path.join(directory, f"{size}.ged")
+            generate(path, size)
+            parser = GedcomParser(path)
+            parser.parse()
+            records = len(parser.individuals) + len(parser.families)
+            output = os.path.join(directory, f"{size}.out")
+            start = time.perf_counter()
+            with open(output, "w", encoding="utf-8") as f:
+                parser.export_to(f, format=options.format)
+            elapsed = time.perf_counter() - start
+            megabytes = os.path.getsize(output) / 1e6
+            print(
+                f"{size:>12} {records:>10} {megabytes:>10.1f} {elapsed:>10.3f} {megabytes / elapsed:>10.1f} "
+                f"{elapsed / records * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Memory benchmark of the parsed tree.
+
+Run from the repository root with ``python -m benchmarks.bench_memory``. A synthetic file of about one million lines is
+parsed and the memory still allocated afterwards is divided by the number of elements of the tree.
+"""
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from src.pygedcom import GedcomParser
+from .generator import generate
+
+INDIVIDUALS = 120_000
+
+
+def count_elements(element) -> int:
+    """Count an element and all its sub elements."""
+    return 1 + sum(count_elements(sub_element) for sub_element in element.get_sub_elements())
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "memory.ged")
+        lines = generate(path, INDIVIDUALS)
+        parser = GedcomParser(path)
+        gc.collect()
+        tracemalloc.start()
+        parser.parse()
+        gc.collect()
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    records = [parser.head] + parser.individuals + parser.families
+    elements = sum(count_elements(record) for record in records)
+    print(f"lines: {lines}, elements: {elements}")
+    print(f"allocated: {allocated / 2**20:.1f} MiB, bytes per element: {allocated / elements:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Parse time benchmark.
+
+Run from the repository root with ``python -m benchmarks.bench_parse``. The time per line should stay flat as the
+file grows, showing that parsing is linear in the size of the file. Pass ``--mmap`` to benchmark the memory-mapped
+parsing mode, or ``--workers N`` to parse with N processes.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.pygedcom import GedcomParser
+from .generator import generate
+
+SIZES = [2_000, 4_000, 8_000, 16_000, 32_000, 64_000]
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument("--mmap", action="store_true", help="parse the files with use_mmap=True")
+    arguments.add_argument("--workers", type=int, default=1, help="number of processes parsing each file")
+    options = arguments.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'individuals':>12} {'lines':>10} {'seconds':>10} {'us/line':>10}")
+        for size in SIZES:
+            path = os.path.join(directory, f"{size}.ged")
+            lines = generate(path, size)
+            parser = GedcomParser(path, use_mmap=options.mmap)
+            start = time.perf_counter()
+            parser.parse(workers=options.workers)
+            elapsed = time.perf_counter() - start
+            print(f"{size:>12} {lines:>10} {elapsed:>10.3f} {elapsed / lines * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
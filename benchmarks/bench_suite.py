@@ -0,0 +1,110 @@
+"""Benchmark suite of the main GedcomParser operations on realistic files.
+
+Run from the repository root with ``python -m benchmarks.bench_suite``. For each size, a realistic synthetic file is
+generated (see ``generator.generate_realistic``), then every operation is timed, and run a second time under
+tracemalloc to report its peak memory. Pass ``--lines`` to choose the sizes, e.g. ``--lines 10000 5000000``.
+"""
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from src.pygedcom import GedcomParser
+from .generator import generate_realistic
+
+LINES = [10_000, 100_000, 1_000_000]
+
+# The number of individuals the lookups and removals are run on.
+SAMPLES = 1_000
+
+
+def parsed(path: str) -> GedcomParser:
+    """Parse a file."""
+    parser = GedcomParser(path)
+    parser.parse()
+    return parser
+
+
+def operations(path: str) -> list:
+    """Get the benchmarked operations, as (name, setup, operation) tuples.
+
+    The setup is not measured, its result is passed to the operation.
+    """
+
+    def sample(parser: GedcomParser) -> list:
+        return random.Random(0).sample(parser.individuals, min(SAMPLES, len(parser.individuals)))
+
+    def find(parser: GedcomParser):
+        for individual in sample(parser):
+            parser.find_individual(individual.get_xref())
+        for family in random.Random(0).sample(parser.families, min(SAMPLES, len(parser.families))):
+            parser.find_family(family.get_xref())
+
+    def relatives(parser: GedcomParser):
+        for individual in sample(parser):
+            parser.get_parents(individual)
+            parser.get_children(individual)
+
+    def remove(parser: GedcomParser):
+        for individual in sample(parser):
+            parser.remove_individual(individual.get_xref())
+
+    def export(format: str):
+        def operation(parser: GedcomParser):
+            with open(os.devnull, "w", encoding="utf-8") as f:
+                parser.export_to(f, format=format)
+
+        return operation
+
+    return [
+        ("verify", lambda: GedcomParser(path), GedcomParser.verify),
+        ("parse", lambda: GedcomParser(path), GedcomParser.parse),
+        (f"find_individual/find_family x{SAMPLES}", lambda: parsed(path), find),
+        (f"get_parents/get_children x{SAMPLES}", lambda: parsed(path), relatives),
+        (f"remove_individual x{SAMPLES}", lambda: parsed(path), remove),
+        ("export gedcom", lambda: parsed(path), export("gedcom")),
+        ("export json", lambda: parsed(path), export("json")),
+    ]
+
+
+def measure(setup, operation) -> tuple:
+    """Measure the time of an operation, then its peak memory in a second run under tracemalloc.
+
+    :return: The time in seconds and the peak memory in bytes.
+    :rtype: tuple
+    """
+    argument = setup()
+    gc.collect()
+    start = time.perf_counter()
+    operation(argument)
+    elapsed = time.perf_counter() - start
+    argument = setup()
+    gc.collect()
+    tracemalloc.start()
+    operation(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument("--lines", type=int, nargs="+", default=LINES, help="sizes of the generated files")
+    options = arguments.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for lines in options.lines:
+            path = os.path.join(directory, f"{lines}.ged")
+            written = generate_realistic(path, lines)
+            print(f"{written} lines, {os.path.getsize(path) / 1e6:.1f} MB")
+            print(f"{'operation':>34} {'seconds':>10} {'peak MiB':>10}")
+            for name, setup, operation in operations(path):
+                elapsed, peak = measure(setup, operation)
+                print(f"{name:>34} {elapsed:>10.3f} {peak / 2**20:>10.1f}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import random
+
+FIRST_NAMES = ["John", "Jane", "Mark", "Mary", "Paul", "Anne", "Louis", "Rose", "Peter", "Emma"]
+LAST_NAMES = ["Smith", "Doe", "Martin", "Bernard", "Dubois", "Moreau", "Laurent", "Simon", "Michel", "Garcia"]
+MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+PLACES = ["Paris, France", "Lyon, France", "New York City, New York, USA", "Chicago, Illinois, USA"]
+
+
+def generate(path: str, individuals: int, seed: int = 0) -> int:
+    """Generate a synthetic GEDCOM file.
+
+    Individuals are grouped two by two in families, each family having the next individual as a child.
+
+    :param path: The path of the file to write.
+    :type path: str
+    :param individuals: The number of individuals to generate.
+    :type individuals: int
+    :param seed: The seed of the random generator. Defaults to 0.
+    :type seed: int, optional
+    :return: The number of lines written.
+    :rtype: int
+    """
+    rng = random.Random(seed)
+    lines = ["0 HEAD", "1 GEDC", "2 VERS 5.5.1", "2 FORM LINEAGE-LINKED", "1 CHAR UTF-8"]
+    for i in range(1, individuals + 1):
+        lines.append(f"0 @I{i}@ INDI")
+        lines.append(f"1 NAME {rng.choice(FIRST_NAMES)} /{rng.choice(LAST_NAMES)}/")
+        lines.append(f"1 SEX {'M' if i % 2 else 'F'}")
+        lines.append("1 BIRT")
+        lines.append(f"2 DATE {rng.randint(1, 28)} {rng.choice(MONTHS)} {rng.randint(1700, 2000)}")
+        lines.append(f"2 PLAC {rng.choice(PLACES)}")
+        lines.append(f"1 FAMS @F{(i + 1) // 2}@")
+    for f in range(1, individuals // 2 + 1):
+        lines.append(f"0 @F{f}@ FAM")
+        lines.append(f"1 HUSB @I{2 * f - 1}@")
+        lines.append(f"1 WIFE @I{2 * f}@")
+        if 2 * f + 1 <= individuals:
+            lines.append(f"1 CHIL @I{2 * f + 1}@")
+    lines.append("0 TRLR")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    return len(lines)
+
+
+# Places with their latitude and longitude, as written under MAP.
+MAPPED_PLACES = [
+    ("Paris, Ile-de-France, France", "N48.8566", "E2.3522"),
+    ("Lyon, Auvergne-Rhone-Alpes, France", "N45.7640", "E4.8357"),
+    ("New York City, New York, USA", "N40.7128", "W74.0060"),
+    ("Chicago, Illinois, USA", "N41.8781", "W87.6298"),
+    ("Quebec, Quebec, Canada", "N46.8139", "W71.2080"),
+    ("Napoli, Campania, Italia", "N40.8518", "E14.2681"),
+]
+
+
+class RealisticGenerator:
+    """Generator of realistic synthetic GEDCOM files, see generate_realistic.
+
+    Families are generated generation by generation: each child may marry a new individual from outside the tree,
+    founding a family of the next generation. Records are written as soon as they are complete, so files of millions
+    of lines are generated without keeping them in memory.
+
+    :param file: The text file object to write to.
+    :type file: TextIO
+    :param lines: The number of lines to write, approximately.
+    :type lines: int
+    :param seed: The seed of the random generator.
+    :type seed: int
+    """
+
+    def __init__(self, file, lines: int, seed: int):
+        self.file = file
+        self.target = lines
+        self.rng = random.Random(seed)
+        self.written = 0
+        self.individuals = 0
+        self.families = 0
+        self.sources = max(5, lines // 2000)
+        self.objects = max(5, lines // 1000)
+        self.notes = max(5, lines // 1000)
+
+    def write(self, lines: list):
+        """Write lines to the file."""
+        self.file.write("\n".join(lines) + "\n")
+        self.written += len(lines)
+
+    def date(self, year: int) -> str:
+        """Get a date around a year, with the qualifiers and partial dates found in real files."""
+        day, month = self.rng.randint(1, 28), self.rng.choice(MONTHS)
+        kind = self.rng.random()
+        if kind < 0.55:
+            return f"{day} {month} {year}"
+        if kind < 0.65:
+            return f"{month} {year}"
+        if kind < 0.75:
+            return f"{year}"
+        if kind < 0.85:
+            return f"{self.rng.choice(['ABT', 'CAL', 'EST'])} {year}"
+        if kind < 0.9:
+            return f"{self.rng.choice(['BEF', 'AFT'])} {day} {month} {year}"
+        if kind < 0.95:
+            return f"BET {year} AND {year + self.rng.randint(1, 5)}"
+        return f"FROM {month} {year} TO {year + self.rng.randint(1, 3)}"
+
+    def event(self, tag: str, year: int) -> list:
+        """Get the lines of an event with a date, a place with a map and a source citation."""
+        place, latitude, longitude = self.rng.choice(MAPPED_PLACES)
+        lines = [f"1 {tag}", f"2 DATE {self.date(year)}", f"2 PLAC {place}"]
+        if self.rng.random() < 0.5:
+            lines += ["3 MAP", f"4 LATI {latitude}", f"4 LONG {longitude}"]
+        if self.rng.random() < 0.4:
+            lines += [f"2 SOUR @S{self.rng.randint(1, self.sources)}@", f"3 PAGE p. {self.rng.randint(1, 400)}"]
+        return lines
+
+    def individual(self, sex: str, birth_year: int, last_name: str, famc: int = None, fams: int = None) -> int:
+        """Write an individual and return its number."""
+        self.individuals += 1
+        lines = [
+            f"0 @I{self.individuals}@ INDI",
+            f"1 NAME {self.rng.choice(FIRST_NAMES)} /{last_name}/",
+            f"1 SEX {sex}",
+        ]
+        lines += self.event("BIRT", birth_year)
+        if birth_year < 1950 and self.rng.random() < 0.7:
+            lines += self.event("DEAT", birth_year + self.rng.randint(1, 90))
+        if famc is not None:
+            lines.append(f"1 FAMC @F{famc}@")
+        if fams is not None:
+            lines.append(f"1 FAMS @F{fams}@")
+        if self.rng.random() < 0.1:
+            lines.append(f"1 OBJE @O{self.rng.randint(1, self.objects)}@")
+        if self.rng.random() < 0.1:
+            lines.append(f"1 NOTE @N{self.rng.randint(1, self.notes)}@")
+        self.write(lines)
+        return self.individuals
+
+    def family(self, family: int, husband: int, wife: int, year: int, last_name: str) -> list:
+        """Write a family and its children, and return the families the children found."""
+        children, founded = [], []
+        count = self.rng.choice([0, 1, 2, 2, 3, 3, 4, 5, 6]) if self.written < self.target else 0
+        for _ in range(count):
+            birth_year = year + self.rng.randint(1, 20)
+            sex = self.rng.choice("MF")
+            fams = None
+            if self.rng.random() < 0.6:
+                self.families += 1
+                fams = self.families
+            child = self.individual(sex, birth_year, last_name, famc=family, fams=fams)
+            children.append(child)
+            if fams is not None:
+                spouse_sex = "F" if sex == "M" else "M"
+                spouse_birth_year = birth_year + self.rng.randint(-5, 5)
+                spouse = self.individual(spouse_sex, spouse_birth_year, self.rng.choice(LAST_NAMES), fams=fams)
+                husband_child, wife_child = (child, spouse) if sex == "M" else (spouse, child)
+                name = last_name if sex == "M" else self.rng.choice(LAST_NAMES)
+                founded.append((fams, husband_child, wife_child, birth_year + self.rng.randint(18, 35), name))
+        lines = [f"0 @F{family}@ FAM", f"1 HUSB @I{husband}@", f"1 WIFE @I{wife}@"]
+        lines += self.event("MARR", year)
+        lines += [f"1 CHIL @I{child}@" for child in children]
+        if self.rng.random() < 0.05:
+            lines.append(f"1 OBJE @O{self.rng.randint(1, self.objects)}@")
+        self.write(lines)
+        return founded
+
+    def founders(self) -> tuple:
+        """Write a couple founding a new tree and return their family."""
+        self.families += 1
+        year = self.rng.randint(1600, 1800)
+        last_name = self.rng.choice(LAST_NAMES)
+        husband = self.individual("M", year, last_name, fams=self.families)
+        wife = self.individual("F", year + self.rng.randint(-5, 5), self.rng.choice(LAST_NAMES), fams=self.families)
+        return self.families, husband, wife, year + self.rng.randint(18, 35), last_name
+
+    def generate(self):
+        """Write the whole file."""
+        self.write(["0 HEAD", "1 GEDC", "2 VERS 5.5.1", "2 FORM LINEAGE-LINKED", "1 CHAR UTF-8"])
+        for source in range(1, self.sources + 1):
+            self.write(
+                [
+                    f"0 @S{source}@ SOUR",
+                    f"1 TITL Parish register {source}",
+                    f"1 AUTH Parish of {self.rng.choice(MAPPED_PLACES)[0]}",
+                    f"1 PUBL {self.rng.randint(1850, 2000)}",
+                ]
+            )
+        for note in range(1, self.notes + 1):
+            lines = [f"0 @N{note}@ NOTE Family story {note}, as told by"]
+            for _ in range(self.rng.randint(1, 4)):
+                lines.append(f"1 CONC  {self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}.")
+                lines.append(f"1 CONT Written down in {self.rng.randint(1850, 2000)}.")
+            self.write(lines)
+        for media in range(1, self.objects + 1):
+            self.write([f"0 @O{media}@ OBJE", f"1 FILE photos/photo{media}.jpg", "2 FORM jpg", f"2 TITL Photo {media}"])
+        generation = []
+        while self.written < self.target or generation:
+            if not generation:
+                generation = [self.founders()]
+            next_generation = []
+            for family in generation:
+                next_generation += self.family(*family)
+            generation = next_generation
+        self.write(["0 TRLR"])
+
+
+def generate_realistic(path: str, lines: int, seed: int = 0) -> int:
+    """Generate a realistic synthetic GEDCOM file of about the given number of lines.
+
+    The file has multi-generation families, dates with qualifiers and ranges, places with maps, sources cited by
+    events, notes with CONT and CONC lines, and media objects. The same seed always generates the same file.
+
+    :param path: The path of the file to write.
+    :type path: str
+    :param lines: The number of lines to write, approximately. The last generation is completed after it is reached.
+    :type lines: int
+    :param seed: The seed of the random generator. Defaults to 0.
+    :type seed: int, optional
+    :return: The number of lines written.
+    :rtype: int
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        generator = RealisticGenerator(file, lines, seed)
+        generator.generate()
+    return generator.written
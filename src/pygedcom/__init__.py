@@ -1 +1,2 @@
 from .gedcom_parser import GedcomParser
+from .parse_stats import GedcomParseStats
@@ -1,3 +1,8 @@
+import io
+import marshal
+import sys
+
+
 class GedcomElement:
     """Class for representing a Gedcom element.
 
@@ -5,14 +10,25 @@ class GedcomElement:
     :type level: int
     :param tag: The tag of the Gedcom element.
     :type tag: str
-    :param sub_elements: The sub elements of the Gedcom element.
-    :type sub_elements: list
-    :param value: The value of the Gedcom element. Defaults to None.
-    :type value: str, optional
+    :param sub_elements: The lines of the sub elements, or their bytes packed by pack_sub_elements, which are only
+        unpacked when the sub elements are first accessed.
+    :type sub_elements: list or bytes
+    :param value: The value of the Gedcom element, as bytes if it is decoded lazily. Defaults to None.
+    :type value: str or bytes, optional
     :return: The Gedcom element.
     :rtype: GedcomElement
     """
 
+    # Elements are created by the million: slots avoid a __dict__ per element, and elements without sub elements
+    # store None instead of an empty list. The parent is used to find the root element when an element changes.
+    __slots__ = ("__level", "__tag", "__value", "__sub_elements", "__parent")
+
+    # The slots declared by each subclass, see __subclass_slots.
+    __SUBCLASS_SLOTS = {}
+
+    # The exported attributes of each class, see __export_fields.
+    __EXPORT_FIELDS = {}
+
     def __init__(
         self,
         level: int,
@@ -24,34 +40,85 @@ class GedcomElement:
         self.__level = level
         self.__tag = tag
         self.__value = value
-        self.__sub_elements = []
-        if sub_elements != []:
-            current_parsed_line = self.__parse_line(sub_elements[0])
-            element_lines = []
-            level = current_parsed_line["level"]
-            for line in sub_elements[1:]:
-                tmp_parsed_line = self.__parse_line(line)
-                if tmp_parsed_line["level"] > level:
-                    element_lines.append(line)
-                else:
-                    self.__sub_elements.append(
-                        GedcomElement(
-                            current_parsed_line["level"],
-                            current_parsed_line["tag"],
-                            element_lines,
-                            value=current_parsed_line["value"],
-                        )
-                    )
-                    current_parsed_line = tmp_parsed_line
-                    element_lines = []
-            self.__sub_elements.append(
-                GedcomElement(
-                    current_parsed_line["level"],
-                    current_parsed_line["tag"],
-                    element_lines,
-                    value=current_parsed_line["value"],
-                )
-            )
+        self.__sub_elements = None
+        self.__parent = None
+        if sub_elements.__class__ is bytes:
+            self.__sub_elements = sub_elements
+        elif sub_elements != []:
+            self.__build_sub_elements(sub_elements)
+
+    def __build_sub_elements(self, sub_elements: list):
+        """Build the tree of sub elements in a single pass.
+
+        Each line is tokenized exactly once, then attached to its parent using a stack of the currently open elements.
+
+        :param sub_elements: The lines of the sub elements, or their already tokenized (level, tag, value) tuples.
+        :type sub_elements: list
+        """
+        stack = [self]
+        for sub_element in sub_elements:
+            if isinstance(sub_element, str):
+                parsed_line = self.__parse_line(sub_element)
+                level, tag, value = parsed_line["level"], parsed_line["tag"], parsed_line["value"]
+            else:
+                level, tag, value = sub_element
+            while len(stack) > 1 and stack[-1].__level >= level:
+                stack.pop()
+            element = stack[-1].__new_sub_element(level, tag, [], value)
+            element.__parent = stack[-1]
+            if stack[-1].__sub_elements is None:
+                stack[-1].__sub_elements = [element]
+            else:
+                stack[-1].__sub_elements.append(element)
+            stack.append(element)
+
+    def __new_sub_element(self, level: int, tag: str, sub_elements: list, value: str) -> "GedcomElement":
+        """Create a sub element of the class given by get_sub_element_class for its tag.
+
+        Typed sub elements compute their properties on first access, once all their own sub elements are built.
+
+        :return: The new sub element, without parent.
+        :rtype: GedcomElement
+        """
+        return self.get_sub_element_class(tag)(level, tag, sub_elements, value)
+
+    @classmethod
+    def get_sub_element_class(cls, tag: str) -> type:
+        """Get the class of the sub elements with a tag. Subclasses return more specific classes for the tags they type.
+
+        :param tag: The tag of the sub element.
+        :type tag: str
+        :return: The class of the sub element, a subclass of GedcomElement.
+        :rtype: type
+        """
+        return GedcomElement
+
+    def __unpack_sub_elements(self):
+        """Build the sub elements from their packed bytes, see pack_sub_elements."""
+        packed = self.__sub_elements
+        # Elements without sub elements store None, whether they were packed or not.
+        self.__sub_elements = None
+        self.__build_sub_elements(marshal.loads(packed))
+
+    def pack_sub_elements(self) -> bytes:
+        """Pack the lines of the sub elements as bytes.
+
+        The bytes can be passed as the sub elements of a new element, which only builds them when they are first
+        accessed. The sub elements are rebuilt with the classes given by get_sub_element_class.
+
+        :return: The packed sub elements.
+        :rtype: bytes
+        """
+        if self.__sub_elements.__class__ is bytes:
+            return self.__sub_elements
+        lines = []
+        stack = list(reversed(self.get_sub_elements()))
+        while stack:
+            element = stack.pop()
+            lines.append((element.__level, element.__tag, element.__value))
+            if element.__sub_elements is not None:
+                stack.extend(reversed(element.get_sub_elements()))
+        return marshal.dumps(lines)
 
     def __parse_line(self, line: str) -> dict:
         """Parse a line of a Gedcom file.
@@ -61,19 +128,29 @@ class GedcomElement:
         :return: The parsed line.
         :rtype: dict
         """
-        chars = line.split(" ")
-        level = int(chars.pop(0))
-        xref = chars.pop(0) if chars[0].startswith("@") else None
-        tag = chars.pop(0)
-        value = " ".join(chars) if chars != [] else ""
+        chars = line.split(" ", 2)
+        level = int(chars[0])
+        xref = None
+        if chars[1].startswith("@"):
+            xref = chars[1]
+            chars = chars[2].split(" ", 1)
+        else:
+            chars = chars[1:]
+        tag = sys.intern(chars[0])
+        value = chars[1] if len(chars) > 1 else ""
         return {"level": level, "xref": xref, "tag": tag, "value": value}
 
     def get_sub_elements(self):
         """Get the sub elements of the Gedcom element.
 
-        :return: The sub elements of the Gedcom element.
+        :return: The list of the sub elements of the Gedcom element, created when an element without sub elements is
+            first asked for it.
         :rtype: list
         """
+        if self.__sub_elements.__class__ is bytes:
+            self.__unpack_sub_elements()
+        if self.__sub_elements is None:
+            self.__sub_elements = []
         return self.__sub_elements
 
     def add_sub_element(self, level, tag, sub_elements, value=None):
@@ -88,7 +165,41 @@ class GedcomElement:
         :param value: The value of the sub element. Defaults to None.
         :type value: str, optional
         """
-        self.__sub_elements.append(GedcomElement(level, tag, sub_elements, value))
+        if self.__sub_elements.__class__ is bytes:
+            self.__unpack_sub_elements()
+        if self.__sub_elements is None:
+            self.__sub_elements = []
+        element = self.__new_sub_element(level, tag, sub_elements, value)
+        element.__parent = self
+        self.__sub_elements.append(element)
+        self.__invalidate()
+
+    def cast_sub_element(self, element: "GedcomElement", element_class: type) -> "GedcomElement":
+        """Replace a sub element by an element of a more specific class, with the same level, tag, value and sub elements.
+
+        Sub elements built from lines already have the class given by get_sub_element_class, so only the ones appended
+        directly to the sub elements are replaced.
+
+        :param element: The sub element to replace.
+        :type element: GedcomElement
+        :param element_class: The class of the new sub element, a subclass of GedcomElement.
+        :type element_class: type
+        :return: The new sub element, or the sub element itself if it already is of that class.
+        :rtype: GedcomElement
+        """
+        if isinstance(element, element_class):
+            return element
+        typed_element = element_class.__new__(element_class)
+        typed_element.__level = element.__level
+        typed_element.__tag = element.__tag
+        typed_element.__value = element.__value
+        typed_element.__sub_elements = element.__sub_elements
+        typed_element.__parent = self
+        for sub_element in typed_element.get_sub_elements():
+            sub_element.__parent = typed_element
+        sub_elements = self.get_sub_elements()
+        sub_elements[sub_elements.index(element)] = typed_element
+        return typed_element
 
     def remove_sub_element(self, element):
         """Remove a sub element from the Gedcom element.
@@ -96,7 +207,19 @@ class GedcomElement:
         :param element: The sub element to remove.
         :type element: GedcomElement
         """
-        self.__sub_elements.remove(element)
+        self.get_sub_elements().remove(element)
+        element.__parent = None
+        self.__invalidate()
+
+    def __invalidate(self):
+        """Clear the cached serializations of the root element containing this element, after it changed."""
+        element = self
+        while element.__parent is not None:
+            element = element.__parent
+        element.clear_serialization_cache()
+
+    def clear_serialization_cache(self):
+        """Clear the cached serializations of the element. Only root elements cache their serializations."""
 
     def find_sub_element(self, tag: str) -> list:
         """Find a sub element by tag.
@@ -106,6 +229,10 @@ class GedcomElement:
         :return: The sub element found.
         :rtype: list
         """
+        if self.__sub_elements.__class__ is bytes:
+            self.__unpack_sub_elements()
+        if self.__sub_elements is None:
+            return []
         return [element for element in self.__sub_elements if element.get_tag() == tag]
 
     def get_level(self) -> int:
@@ -127,9 +254,13 @@ class GedcomElement:
     def get_value(self) -> str:
         """Get the value of the Gedcom element.
 
+        Values read as bytes from a memory-mapped UTF-8 file are decoded on first access.
+
         :return: The value of the Gedcom element.
         :rtype: str
         """
+        if self.__value.__class__ is bytes:
+            self.__value = self.__value.decode("utf-8", "replace")
         return self.__value
 
     def set_value(self, value: str):
@@ -139,6 +270,53 @@ class GedcomElement:
         :type value: str
         """
         self.__value = value
+        self.__invalidate()
+
+    @classmethod
+    def __subclass_slots(cls) -> list:
+        """Get the attribute names of the slots declared by the subclasses of GedcomElement, down to this class.
+
+        :return: The mangled attribute names of the slots.
+        :rtype: list
+        """
+        if cls not in GedcomElement.__SUBCLASS_SLOTS:
+            names = []
+            for klass in cls.__mro__:
+                if klass is GedcomElement:
+                    break
+                for name in klass.__dict__.get("__slots__", ()):
+                    names.append(f"_{klass.__name__.lstrip('_')}{name}" if name.startswith("__") else name)
+            GedcomElement.__SUBCLASS_SLOTS[cls] = names
+        return GedcomElement.__SUBCLASS_SLOTS[cls]
+
+    def __getstate__(self) -> tuple:
+        """Get the state of the Gedcom element, used to pickle it.
+
+        :return: The level, tag, value and sub elements, then a dictionary of the subclass slots that are set, or None.
+        :rtype: tuple
+        """
+        extra = None
+        for name in self.__subclass_slots():
+            if hasattr(self, name):
+                if extra is None:
+                    extra = {}
+                extra[name] = getattr(self, name)
+        return (self.__level, self.__tag, self.__value, self.__sub_elements, extra)
+
+    def __setstate__(self, state: tuple):
+        """Restore the state of the Gedcom element, used to unpickle it.
+
+        :param state: The state returned by __getstate__.
+        :type state: tuple
+        """
+        self.__level, self.__tag, self.__value, self.__sub_elements, extra = state
+        self.__parent = None
+        if self.__sub_elements.__class__ is list:
+            for sub_element in self.__sub_elements:
+                sub_element.__parent = self
+        if extra is not None:
+            for name, value in extra.items():
+                setattr(self, name, value)
 
     def __str__(self) -> str:
         """Get the string representation of the Gedcom element.
@@ -146,7 +324,7 @@ class GedcomElement:
         :return: The string representation of the Gedcom element.
         :rtype: str
         """
-        return "Level: " + str(self.__level) + ", Tag: " + str(self.__tag) + ", Value: " + str(self.__value)
+        return "Level: " + str(self.__level) + ", Tag: " + str(self.__tag) + ", Value: " + str(self.get_value())
 
     def __repr__(self) -> str:
         """Get the string representation of the Gedcom element.
@@ -170,13 +348,56 @@ class GedcomElement:
             gedcom.append(self.get_value())
         return f"{' '.join([str(x) for x in gedcom])}\n"
 
+    def write_gedcom(self, fp):
+        """Write the Gedcom lines of the element and of all its sub elements to a file object.
+
+        The tree is walked without recursion and the lines are written with a single call, so the output is never built
+        as one string.
+
+        :param fp: The text file object to write to.
+        :type fp: TextIO
+        """
+        lines = [self.get_gedcom()]
+        stack = list(reversed(self.get_sub_elements()))
+        while stack:
+            element = stack.pop()
+            value = element.get_value()
+            if value:
+                lines.append(f"{element.__level} {element.__tag} {value}\n")
+            else:
+                lines.append(f"{element.__level} {element.__tag}\n")
+            if element.__sub_elements is not None:
+                stack.extend(reversed(element.get_sub_elements()))
+        fp.writelines(lines)
+
     def extract_gedcom(self) -> str:
         """Extract the Gedcom element.
 
         :return: The extracted Gedcom element.
         :rtype: str
         """
-        return f"{self.get_gedcom()}{''.join([element.extract_gedcom() for element in self.get_sub_elements()])}"
+        buffer = io.StringIO()
+        self.write_gedcom(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def __export_fields(cls) -> list:
+        """Get the exported attributes of the class, resolved once per class.
+
+        The exported attributes are the attributes of the class starting with __export_, in alphabetical order.
+
+        :return: A list of (export key, attribute name, getter) tuples.
+        :rtype: list
+        """
+        if cls not in GedcomElement.__EXPORT_FIELDS:
+            fields = []
+            prefix = f"_{cls.__name__}__export_"
+            for attr in dir(cls):
+                if attr.startswith(prefix):
+                    export_key = attr.replace(prefix, "")
+                    fields.append((export_key, attr, getattr(cls, "get_" + export_key, None)))
+            GedcomElement.__EXPORT_FIELDS[cls] = fields
+        return GedcomElement.__EXPORT_FIELDS[cls]
 
     def export(self) -> dict:
         """Export the Gedcom element.
@@ -186,13 +407,16 @@ class GedcomElement:
         """
 
         export_dict = {}
-        prefix = f"_{self.__class__.__name__}__export_"
-        for attr in dir(self):
-            if attr.startswith(prefix):
-                export_key = attr.replace(prefix, "")
+        for export_key, attr, getter in self.__export_fields():
+            try:
                 export_value = getattr(self, attr)
-                if isinstance(export_value, GedcomElement):
-                    export_dict[export_key] = export_value.export()
-                else:
-                    export_dict[export_key] = export_value
+            except AttributeError:
+                continue
+            if export_value is None and getter is not None:
+                # Lazy properties are None until their getter computes them.
+                export_value = getter(self)
+            if isinstance(export_value, GedcomElement):
+                export_dict[export_key] = export_value.export()
+            else:
+                export_dict[export_key] = export_value
         return export_dict
@@ -17,15 +17,64 @@ class GedcomFamily(GedcomRootElement):
     :rtype: GedcomFamily
     """
 
+    __slots__ = (
+        "__export_husband",
+        "__export_wife",
+        "__export_children",
+        "__export_married",
+        "__export_marriage",
+        "__export_media",
+        "__family_index",
+    )
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the family."""
         super().__init__(level, xref, tag, sub_elements)
-        self.__export_husband = self.__find_husband()
-        self.__export_wife = self.__find_wife()
-        self.__export_children = self.__find_children()
-        self.__export_married = self.__find_are_married()
-        self.__export_marriage = self.__find_marriage()
-        self.__export_media = self.__find_media()
+        # The properties are computed on first access, see the getters.
+        self.__export_husband = None
+        self.__export_wife = None
+        self.__export_children = None
+        self.__export_married = None
+        self.__export_marriage = None
+        self.__export_media = None
+        self.__family_index = None
+
+    @classmethod
+    def get_sub_element_class(cls, tag: str) -> type:
+        """Get the class of the sub elements with a tag. The marriage is a GedcomCommonEvent.
+
+        :param tag: The tag of the sub element.
+        :type tag: str
+        :return: The class of the sub element.
+        :rtype: type
+        """
+        if tag == "MARR":
+            return GedcomCommonEvent
+        return super().get_sub_element_class(tag)
+
+    def set_family_index(self, family_index):
+        """Set the family index to notify when the parents or children of the family change.
+
+        :param family_index: The family index, or None to stop notifying.
+        :type family_index: GedcomFamilyIndex
+        """
+        self.__family_index = family_index
+
+    def __update_family_index(self):
+        """Re-index the family after its parents or children changed."""
+        if self.__family_index is not None:
+            self.__family_index.update_family(self)
+
+    def __getstate__(self) -> tuple:
+        """Get the state of the family, used to pickle it. The family index is not pickled.
+
+        :return: The state of the family.
+        :rtype: tuple
+        """
+        level, tag, value, sub_elements, extra = super().__getstate__()
+        if extra is not None and "_GedcomFamily__family_index" in extra:
+            extra["_GedcomFamily__family_index"] = None
+        return (level, tag, value, sub_elements, extra)
 
     def __find_marriage(self) -> GedcomCommonEvent:
         """Find the marriage of the family.
@@ -34,9 +83,9 @@ class GedcomFamily(GedcomRootElement):
         :rtype: GedcomCommonEvent
         """
         if self.find_sub_element("MARR") != []:
-            marriage = self.find_sub_element("MARR")[0]
-            marriage.__class__ = GedcomCommonEvent
+            marriage = self.cast_sub_element(self.find_sub_element("MARR")[0], GedcomCommonEvent)
             marriage.init_properties()
+            self.count_event(marriage)
             return marriage
         else:
             return GedcomCommonEvent.empty()
@@ -98,6 +147,8 @@ class GedcomFamily(GedcomRootElement):
         :return: The husband of the family.
         :rtype: str
         """
+        if self.__export_husband is None:
+            self.__export_husband = self.__find_husband()
         return self.__export_husband
 
     def get_wife(self) -> str:
@@ -106,6 +157,8 @@ class GedcomFamily(GedcomRootElement):
         :return: The wife of the family.
         :rtype: str
         """
+        if self.__export_wife is None:
+            self.__export_wife = self.__find_wife()
         return self.__export_wife
 
     def get_children(self) -> list:
@@ -114,6 +167,8 @@ class GedcomFamily(GedcomRootElement):
         :return: The children of the family.
         :rtype: list
         """
+        if self.__export_children is None:
+            self.__export_children = self.__find_children()
         return self.__export_children
 
     def get_parents(self) -> list:
@@ -122,7 +177,7 @@ class GedcomFamily(GedcomRootElement):
         :return: The parents of the family.
         :rtype: list
         """
-        return [self.__export_husband, self.__export_wife]
+        return [self.get_husband(), self.get_wife()]
 
     def get_married(self) -> bool:
         """Get if the family is married.
@@ -130,6 +185,8 @@ class GedcomFamily(GedcomRootElement):
         :return: True if the family is married, False otherwise.
         :rtype: bool
         """
+        if self.__export_married is None:
+            self.__export_married = self.__find_are_married()
         return self.__export_married
 
     def get_marriage(self) -> GedcomCommonEvent:
@@ -138,6 +195,8 @@ class GedcomFamily(GedcomRootElement):
         :return: The marriage of the family.
         :rtype: GedcomCommonEvent
         """
+        if self.__export_marriage is None:
+            self.__export_marriage = self.__find_marriage()
         return self.__export_marriage
 
     def get_media(self) -> list:
@@ -146,6 +205,8 @@ class GedcomFamily(GedcomRootElement):
         :return: The media of the family.
         :rtype: list
         """
+        if self.__export_media is None:
+            self.__export_media = self.__find_media()
         return self.__export_media
 
     def set_husband(self, xref: str):
@@ -160,6 +221,7 @@ class GedcomFamily(GedcomRootElement):
             husband_element[0].set_value(self.__export_husband)
         else:
             self.add_sub_element(1, "HUSB", [], value=self.__export_husband)
+        self.__update_family_index()
 
     def set_wife(self, xref: str):
         """Set the wife of the family.
@@ -173,6 +235,7 @@ class GedcomFamily(GedcomRootElement):
             wife_element[0].set_value(self.__export_wife)
         else:
             self.add_sub_element(1, "WIFE", [], value=self.__export_wife)
+        self.__update_family_index()
 
     def set_children(self, children: list):
         """Set the children of the family.
@@ -185,6 +248,7 @@ class GedcomFamily(GedcomRootElement):
             self.remove_sub_element(child)
         for child in self.__export_children:
             self.add_sub_element(1, "CHIL", [], value=child)
+        self.__update_family_index()
 
     def add_child(self, child_xref: str):
         """Add a child to the family. If child already exists, do nothing.
@@ -192,9 +256,10 @@ class GedcomFamily(GedcomRootElement):
         :param child_xref: The xref of the child to add.
         :type child_xref: str
         """
-        if child_xref not in self.__export_children:
+        if child_xref not in self.get_children():
             self.__export_children.append(child_xref)
             self.add_sub_element(1, "CHIL", [], value=child_xref)
+            self.__update_family_index()
 
     def remove_child(self, child_xref: str):
         """Remove a child from the family. If child does not exist, do nothing.
@@ -205,7 +270,8 @@ class GedcomFamily(GedcomRootElement):
         for child in self.find_sub_element("CHIL"):
             if child.get_value() == child_xref:
                 self.remove_sub_element(child)
-        self.__export_children.remove(child_xref) if child_xref in self.__export_children else None
+        self.__export_children.remove(child_xref) if child_xref in self.get_children() else None
+        self.__update_family_index()
 
     def remove_parent(self, parent_xref: str):
         """Remove a parent from the family. If parent does not exist, do nothing.
@@ -217,7 +283,30 @@ class GedcomFamily(GedcomRootElement):
             if self.find_sub_element(parent) != []:
                 if self.find_sub_element(parent)[0].get_value() == parent_xref:
                     self.remove_sub_element(self.find_sub_element(parent)[0])
-        if self.__export_husband == parent_xref:
+        if self.get_husband() == parent_xref:
+            self.__export_husband = ""
+        if self.get_wife() == parent_xref:
+            self.__export_wife = ""
+        self.__update_family_index()
+
+    def remove_members(self, xrefs: set):
+        """Remove parents and children from the family in a single pass, re-indexing the family once.
+
+        :param xrefs: The xrefs of the parents and children to remove. The ones not in the family are ignored.
+        :type xrefs: set
+        """
+        removed = [
+            element
+            for element in self.get_sub_elements()
+            if element.get_tag() in ("HUSB", "WIFE", "CHIL") and element.get_value() in xrefs
+        ]
+        if removed == []:
+            return
+        for element in removed:
+            self.remove_sub_element(element)
+        if self.get_husband() in xrefs:
             self.__export_husband = ""
-        if self.__export_wife == parent_xref:
+        if self.get_wife() in xrefs:
             self.__export_wife = ""
+        self.__export_children = [child for child in self.get_children() if child not in xrefs]
+        self.__update_family_index()
@@ -17,16 +17,66 @@ class GedcomIndividual(GedcomRootElement):
     :rtype: GedcomIndividual
     """
 
+    __slots__ = (
+        "__export_name",
+        "__export_first_name",
+        "__export_last_name",
+        "__export_birth",
+        "__export_death",
+        "__export_sex",
+        "__export_media",
+        "__name_index",
+    )
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the individual."""
         super().__init__(level, xref, tag, sub_elements)
-        self.__export_name = self.__find_name()
-        self.__export_first_name = self.__find_first_name()
-        self.__export_last_name = self.__find_last_name()
-        self.__export_birth = self.__init_birth()
-        self.__export_death = self.__init_death()
-        self.__export_sex = self.__find_sex()
-        self.__export_media = self.__find_media()
+        # The properties are computed on first access, see the getters.
+        self.__export_name = None
+        self.__export_first_name = None
+        self.__export_last_name = None
+        self.__export_birth = None
+        self.__export_death = None
+        self.__export_sex = None
+        self.__export_media = None
+        self.__name_index = None
+
+    @classmethod
+    def get_sub_element_class(cls, tag: str) -> type:
+        """Get the class of the sub elements with a tag. The birth and death are GedcomCommonEvent.
+
+        :param tag: The tag of the sub element.
+        :type tag: str
+        :return: The class of the sub element.
+        :rtype: type
+        """
+        if tag == "BIRT" or tag == "DEAT":
+            return GedcomCommonEvent
+        return super().get_sub_element_class(tag)
+
+    def set_name_index(self, name_index):
+        """Set the name index to notify when the name of the individual changes.
+
+        :param name_index: The name index, or None to stop notifying.
+        :type name_index: GedcomNameIndex
+        """
+        self.__name_index = name_index
+
+    def __update_name_index(self):
+        """Re-index the individual after its name changed."""
+        if self.__name_index is not None:
+            self.__name_index.update_individual(self)
+
+    def __getstate__(self) -> tuple:
+        """Get the state of the individual, used to pickle it. The name index is not pickled.
+
+        :return: The state of the individual.
+        :rtype: tuple
+        """
+        level, tag, value, sub_elements, extra = super().__getstate__()
+        if extra is not None and "_GedcomIndividual__name_index" in extra:
+            extra["_GedcomIndividual__name_index"] = None
+        return (level, tag, value, sub_elements, extra)
 
     def __find_name(self):
         """Find the name of the individual.
@@ -45,15 +95,16 @@ class GedcomIndividual(GedcomRootElement):
         :return: The first name of the individual.
         :rtype: str
         """
-        return self.__export_name.split("/")[0].split(" ")[0].strip()
+        return self.get_name().split("/")[0].split(" ")[0].strip()
 
     def __find_last_name(self):
         """Find the last name of the individual.
 
-        :return: The last name of the individual.
+        :return: The last name of the individual, or "" if the name has no /last name/.
         :rtype: str
         """
-        return self.__export_name.split("/")[-2].strip() if self.__export_name else ""
+        parts = self.get_name().split("/")
+        return parts[-2].strip() if len(parts) > 2 else ""
 
     def __init_birth(self) -> GedcomCommonEvent:
         """Initialize the birth of the individual.
@@ -62,9 +113,9 @@ class GedcomIndividual(GedcomRootElement):
         :rtype: GedcomCommonEvent
         """
         if self.find_sub_element("BIRT") != []:
-            birth = self.find_sub_element("BIRT")[0]
-            birth.__class__ = GedcomCommonEvent
+            birth = self.cast_sub_element(self.find_sub_element("BIRT")[0], GedcomCommonEvent)
             birth.init_properties()
+            self.count_event(birth)
             return birth
         else:
             return GedcomCommonEvent.empty()
@@ -76,9 +127,9 @@ class GedcomIndividual(GedcomRootElement):
         :rtype: GedcomCommonEvent
         """
         if self.find_sub_element("DEAT") != []:
-            death = self.find_sub_element("DEAT")[0]
-            death.__class__ = GedcomCommonEvent
+            death = self.cast_sub_element(self.find_sub_element("DEAT")[0], GedcomCommonEvent)
             death.init_properties()
+            self.count_event(death)
             return death
         else:
             return GedcomCommonEvent.empty()
@@ -105,6 +156,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The name of the individual.
         :rtype: str
         """
+        if self.__export_name is None:
+            self.__export_name = self.__find_name()
         return self.__export_name
 
     def get_birth(self) -> GedcomCommonEvent:
@@ -113,6 +166,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The birth of the individual.
         :rtype: GedcomCommonEvent
         """
+        if self.__export_birth is None:
+            self.__export_birth = self.__init_birth()
         return self.__export_birth
 
     def get_death(self) -> GedcomCommonEvent:
@@ -121,6 +176,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The death of the individual.
         :rtype: GedcomCommonEvent
         """
+        if self.__export_death is None:
+            self.__export_death = self.__init_death()
         return self.__export_death
 
     def get_first_name(self) -> str:
@@ -129,6 +186,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The first name of the individual.
         :rtype: str
         """
+        if self.__export_first_name is None:
+            self.__export_first_name = self.__find_first_name()
         return self.__export_first_name
 
     def get_last_name(self) -> str:
@@ -137,6 +196,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The last name of the individual.
         :rtype: str
         """
+        if self.__export_last_name is None:
+            self.__export_last_name = self.__find_last_name()
         return self.__export_last_name
 
     def get_sex(self) -> str:
@@ -145,6 +206,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The sex of the individual
         :rtype: str
         """
+        if self.__export_sex is None:
+            self.__export_sex = self.__find_sex()
         return self.__export_sex
 
     def get_media(self) -> list:
@@ -153,6 +216,8 @@ class GedcomIndividual(GedcomRootElement):
         :return: The media of the individual
         :rtype: list
         """
+        if self.__export_media is None:
+            self.__export_media = self.__find_media()
         return self.__export_media
 
     def set_first_name(self, first_name: str):
@@ -161,13 +226,14 @@ class GedcomIndividual(GedcomRootElement):
         :param first_name: The first name of the individual.
         :type first_name: str
         """
+        self.__export_name = f"{first_name} /{self.get_last_name()}/"
         self.__export_first_name = first_name
-        self.__export_name = f"{first_name} /{self.__export_last_name}/"
         name_element = self.find_sub_element("NAME")
         if name_element != []:
             name_element[0].set_value(self.__export_name)
         else:
             self.add_sub_element(1, "NAME", [], value=self.__export_name)
+        self.__update_name_index()
 
     def set_last_name(self, last_name: str):
         """Set the last name of the individual.
@@ -175,13 +241,14 @@ class GedcomIndividual(GedcomRootElement):
         :param last_name: The last name of the individual.
         :type last_name: str
         """
+        self.__export_name = f"{self.get_first_name()} /{last_name}/"
         self.__export_last_name = last_name
-        self.__export_name = f"{self.__export_first_name} /{last_name}/"
         name_element = self.find_sub_element("NAME")
         if name_element != []:
             name_element[0].set_value(self.__export_name)
         else:
             self.add_sub_element(1, "NAME", [], value=self.__export_name)
+        self.__update_name_index()
 
     def set_sex(self, sex_value: str):
         """Set the sex of the individual. This is not changing family relations.
@@ -207,10 +274,24 @@ class GedcomIndividual(GedcomRootElement):
                 if fam.get_value() == family_xref:
                     self.remove_sub_element(fam)
 
+    def remove_families(self, family_xrefs: set):
+        """Remove several families from the individual in a single pass.
+
+        :param family_xrefs: The family xrefs to remove.
+        :type family_xrefs: set
+        """
+        removed = [
+            element
+            for element in self.get_sub_elements()
+            if element.get_tag() in ("FAMC", "FAMS") and element.get_value() in family_xrefs
+        ]
+        for element in removed:
+            self.remove_sub_element(element)
+
     def __str__(self):
         """Get the string representation of the individual.
 
         :return: The string representation of the individual.
         :rtype: str
         """
-        return self.__export_first_name + " " + self.__export_last_name
+        return self.get_first_name() + " " + self.get_last_name()
@@ -18,6 +18,8 @@ class GedcomNote(GedcomRootElement):
     :rtype: GedcomNote
     """
 
+    __slots__ = ()
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the Gedcom note."""
         super().__init__(level, xref, tag, sub_elements)
@@ -16,6 +16,8 @@ class GedcomObject(GedcomRootElement):
     :rtype: GedcomObject
     """
 
+    __slots__ = ("__export_file", "__export_format")
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the Gedcom object."""
         super().__init__(level, xref, tag, sub_elements)
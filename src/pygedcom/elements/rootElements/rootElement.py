@@ -16,10 +16,64 @@ class GedcomRootElement(GedcomElement):
     :rtype: RootGedcomElement
     """
 
+    __slots__ = ("__xref", "__serializations", "__stats")
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the rootElement."""
         super().__init__(level, tag, sub_elements)
         self.__xref = xref
+        self.__serializations = None
+        self.__stats = None
+
+    def set_stats(self, stats):
+        """Set the stats counting the dates and places parsed for the root element.
+
+        :param stats: The stats of the parser owning the root element, or None to stop counting.
+        :type stats: GedcomParseStats
+        """
+        self.__stats = stats
+
+    def count_event(self, event):
+        """Count the date and place of an event of the root element in its stats, after they were parsed.
+
+        :param event: The event whose properties were just initialized.
+        :type event: GedcomCommonEvent
+        """
+        if self.__stats is not None:
+            self.__stats.count_event(event)
+
+    def get_serialization(self, key: str, serialize):
+        """Get a serialization of the root element, cached until the element or one of its sub elements changes.
+
+        :param key: The name of the serialization in the cache.
+        :type key: str
+        :param serialize: The function computing the serialization from the root element, called on a cache miss.
+        :type serialize: Callable
+        :return: The serialization of the root element.
+        :rtype: Any
+        """
+        if self.__serializations is None:
+            self.__serializations = {}
+        if key not in self.__serializations:
+            self.__serializations[key] = serialize(self)
+        return self.__serializations[key]
+
+    def clear_serialization_cache(self):
+        """Clear the cached serializations of the root element."""
+        self.__serializations = None
+
+    def __getstate__(self) -> tuple:
+        """Get the state of the root element, used to pickle it. The cached serializations and the stats are not pickled.
+
+        :return: The state of the root element.
+        :rtype: tuple
+        """
+        level, tag, value, sub_elements, extra = super().__getstate__()
+        if extra is not None:
+            for name in ("_GedcomRootElement__serializations", "_GedcomRootElement__stats"):
+                if name in extra:
+                    extra[name] = None
+        return (level, tag, value, sub_elements, extra)
 
     def get_xref(self) -> str:
         """Get the xref of the root element.
@@ -17,16 +17,27 @@ class GedcomSource(GedcomRootElement):
     :rtype: GedcomSource
     """
 
+    __slots__ = (
+        "__export_quality",
+        "__export_title",
+        "__export_type",
+        "__export_repo",
+        "__export_object",
+        "__export_media_type",
+        "__export_note",
+    )
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the Gedcom source."""
         super().__init__(level, xref, tag, sub_elements)
-        self.__export_quality = self.__find_quality()
-        self.__export_title = self.__find_title()
-        self.__export_type = self.__find_type()
-        self.__export_repo = self.__find_repo()
-        self.__export_object = self.__find_object()
-        self.__export_media_type = self.__find_media_type()
-        self.__export_note = self.__find_note()
+        # The properties are computed on first access, see the getters.
+        self.__export_quality = None
+        self.__export_title = None
+        self.__export_type = None
+        self.__export_repo = None
+        self.__export_object = None
+        self.__export_media_type = None
+        self.__export_note = None
 
     def __find_quality(self) -> str:
         """Find the quality of the Gedcom source.
@@ -117,6 +128,8 @@ class GedcomSource(GedcomRootElement):
         :return: The quality of the Gedcom source.
         :rtype: str
         """
+        if self.__export_quality is None:
+            self.__export_quality = self.__find_quality()
         return self.__export_quality
 
     def get_title(self) -> str:
@@ -125,6 +138,8 @@ class GedcomSource(GedcomRootElement):
         :return: The title of the Gedcom source.
         :rtype: str
         """
+        if self.__export_title is None:
+            self.__export_title = self.__find_title()
         return self.__export_title
 
     def get_type(self) -> str:
@@ -133,6 +148,8 @@ class GedcomSource(GedcomRootElement):
         :return: The type of the Gedcom source.
         :rtype: str
         """
+        if self.__export_type is None:
+            self.__export_type = self.__find_type()
         return self.__export_type
 
     def get_object(self) -> str:
@@ -141,6 +158,8 @@ class GedcomSource(GedcomRootElement):
         :return: The object of the Gedcom source.
         :rtype: str
         """
+        if self.__export_object is None:
+            self.__export_object = self.__find_object()
         return self.__export_object
 
     def get_repo(self) -> str:
@@ -149,6 +168,8 @@ class GedcomSource(GedcomRootElement):
         :return: The repository of the Gedcom source.
         :rtype: str
         """
+        if self.__export_repo is None:
+            self.__export_repo = self.__find_repo()
         return self.__export_repo
 
     def get_media_type(self) -> str:
@@ -157,6 +178,8 @@ class GedcomSource(GedcomRootElement):
         :return: The media type of the Gedcom source.
         :rtype: str
         """
+        if self.__export_media_type is None:
+            self.__export_media_type = self.__find_media_type()
         return self.__export_media_type
 
     def get_note(self) -> str:
@@ -165,4 +188,6 @@ class GedcomSource(GedcomRootElement):
         :return: The note of the Gedcom source.
         :rtype: str
         """
+        if self.__export_note is None:
+            self.__export_note = self.__find_note()
         return self.__export_note
@@ -18,6 +18,8 @@ class GedcomSubmitter(GedcomRootElement):
     :rtype: GedcomSubmitter
     """
 
+    __slots__ = ()
+
     def __init__(self, level: int, xref: str, tag: str, sub_elements: list):
         """Initialize the Gedcom submitter."""
         super().__init__(level, xref, tag, sub_elements)
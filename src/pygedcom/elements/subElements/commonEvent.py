@@ -18,6 +18,8 @@ class GedcomCommonEvent(GedcomElement):
     :rtype: GedcomCommonEvent
     """
 
+    __slots__ = ("__export_date", "__export_place", "__export_media")
+
     def __init__(
         self,
         level: int,
@@ -25,9 +27,24 @@ class GedcomCommonEvent(GedcomElement):
         sub_elements: list,
         value: str = None,
     ):
-        """Initialize the common event."""
+        """Initialize the common event. Its properties are computed on first access."""
         super().__init__(level, tag, sub_elements, value=value)
-        self.init_properties()
+        self.__export_date = None
+
+    @classmethod
+    def get_sub_element_class(cls, tag: str) -> type:
+        """Get the class of the sub elements with a tag. Dates and places are GedcomDate and GedcomPlace.
+
+        :param tag: The tag of the sub element.
+        :type tag: str
+        :return: The class of the sub element.
+        :rtype: type
+        """
+        if tag == "DATE":
+            return GedcomDate
+        if tag == "PLAC":
+            return GedcomPlace
+        return super().get_sub_element_class(tag)
 
     def init_properties(self):
         """Initialize the properties of the common event."""
@@ -35,6 +52,11 @@ class GedcomCommonEvent(GedcomElement):
         self.__export_place = self.__find_place()
         self.__export_media = self.__find_media()
 
+    def __init_properties_once(self):
+        """Initialize the properties on first access, they are not computed when the element is created."""
+        if self.__export_date is None:
+            self.init_properties()
+
     def __find_place(self) -> GedcomPlace:
         """Find the place of the common event.
 
@@ -42,8 +64,7 @@ class GedcomCommonEvent(GedcomElement):
         :rtype: GedcomPlace
         """
         if self.find_sub_element("PLAC") != []:
-            place = self.find_sub_element("PLAC")[0]
-            place.__class__ = GedcomPlace
+            place = self.cast_sub_element(self.find_sub_element("PLAC")[0], GedcomPlace)
             place.init_properties()
             return place
         else:
@@ -56,8 +77,7 @@ class GedcomCommonEvent(GedcomElement):
         :rtype: GedcomDate
         """
         if self.find_sub_element("DATE") != []:
-            date = self.find_sub_element("DATE")[0]
-            date.__class__ = GedcomDate
+            date = self.cast_sub_element(self.find_sub_element("DATE")[0], GedcomDate)
             date.init_properties()
             return date
         else:
@@ -77,6 +97,7 @@ class GedcomCommonEvent(GedcomElement):
         :return: The date of the common event.
         :rtype: GedcomDate
         """
+        self.__init_properties_once()
         return self.__export_date
 
     def get_place(self) -> GedcomPlace:
@@ -85,6 +106,7 @@ class GedcomCommonEvent(GedcomElement):
         :return: The place of the common event.
         :rtype: GedcomPlace
         """
+        self.__init_properties_once()
         return self.__export_place
 
     def get_media(self) -> list:
@@ -93,8 +115,18 @@ class GedcomCommonEvent(GedcomElement):
         :return: The media of the common event.
         :rtype: list
         """
+        self.__init_properties_once()
         return self.__export_media
 
+    def export(self) -> dict:
+        """Export the common event, initializing its properties if needed.
+
+        :return: The exported common event.
+        :rtype: dict
+        """
+        self.__init_properties_once()
+        return super().export()
+
     @classmethod
     def empty(cls):
         """Return an empty common event.
@@ -110,6 +142,7 @@ class GedcomCommonEvent(GedcomElement):
         :return: The string representation of the common event.
         :rtype: str
         """
+        self.__init_properties_once()
         return f"{self.__export_date} {self.__export_place}"
 
     def __repr__(self):
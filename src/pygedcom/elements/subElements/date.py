@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+
 from ..element import GedcomElement
 
 
@@ -17,6 +19,16 @@ class GedcomDate(GedcomElement):
     :rtype: GedcomDate
     """
 
+    __slots__ = (
+        "__export_tag",
+        "__export_day",
+        "__export_month",
+        "__export_year",
+        "__export_day1",
+        "__export_month1",
+        "__export_year1",
+    )
+
     def __init__(
         self,
         level: int,
@@ -24,18 +36,84 @@ class GedcomDate(GedcomElement):
         sub_elements: list,
         value: str = None,
     ):
-        """Initialize the Gedcom date element."""
+        """Initialize the Gedcom date element. Its properties are computed on first access."""
         super().__init__(level, tag, sub_elements, value=value)
-        self.init_properties()
+        self.__export_day = None
+
+    # A date is an optional day and month followed by a year, e.g. "1 JAN 1900", "JAN 1900" or "1900".
+    __DATE = r"(?:(?:(\d{1,2}) )?([A-Z]{3}) )?(\d{4})"
+
+    # A date value is a date with an optional qualifier, a range (BET ... AND ..., FROM ... TO ...), and an optional
+    # phrase in parentheses, as used by INT.
+    __DATE_VALUE = re.compile(
+        rf"^(?:(ABT|BEF|AFT|CAL|EST|INT|TO|FROM|BET) +)?{__DATE}(?: +(AND|TO) +{__DATE})?(?: +\(.*\))?$"
+    )
+
+    __QUALIFIERS = ("ABT", "BEF", "AFT", "CAL", "EST", "INT", "TO", "FROM", "BET")
+
+    __MONTHS = {
+        "JAN": 1,
+        "FEB": 2,
+        "MAR": 3,
+        "APR": 4,
+        "MAY": 5,
+        "JUN": 6,
+        "JUL": 7,
+        "AUG": 8,
+        "SEP": 9,
+        "OCT": 10,
+        "NOV": 11,
+        "DEC": 12,
+    }
+
+    # How many years an approximate date (ABT, CAL, EST) may be off.
+    __APPROXIMATION_YEARS = 5
+
+    # The keys of the dates before and after every other date, used for open ranges (BEF, AFT, FROM, TO).
+    MIN_KEY = 0
+    MAX_KEY = 99991231
 
     def init_properties(self):
         """Initialize the properties of the Gedcom date element."""
         self.__parse_value()
 
+    def __init_properties_once(self):
+        """Initialize the properties on first access, they are not computed when the element is created."""
+        if self.__export_day is None:
+            self.init_properties()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def __parse_date_value(value: str) -> tuple:
+        """Parse a date value. Files repeat the same dates a lot, so the results are cached.
+
+        :param value: The date value to parse.
+        :type value: str
+        :return: The qualifier or None, the (day, month, year) of the date, and the (day, month, year) of the end of the
+            range or None if the value is not a range. Parts of the dates that cannot be parsed are empty strings.
+        :rtype: tuple
+        """
+        value = value.strip()
+        match = GedcomDate.__DATE_VALUE.match(value)
+        if match is None:
+            qualifier = value.split(" ", 1)[0]
+            if qualifier not in GedcomDate.__QUALIFIERS:
+                return None, ("", "", ""), None
+            return qualifier, ("", "", ""), ("", "", "") if qualifier == "BET" else None
+        qualifier, day, month, year, separator, day1, month1, year1 = match.groups()
+        if separator is not None and (qualifier, separator) not in (("BET", "AND"), ("FROM", "TO")):
+            return qualifier, ("", "", ""), None
+        if separator is None and qualifier == "BET":
+            return qualifier, ("", "", ""), ("", "", "")
+        date = (day or "", month or "", year)
+        if separator is None:
+            return qualifier, date, None
+        return qualifier, date, (day1 or "", month1 or "", year1)
+
     def __parse_value(self):
         """Parse the value of the Gedcom date element. This function initializes the following properties:
 
-        - __export_tag
+        - __export_tag, if the date has a qualifier
         - __export_day
         - __export_month
         - __export_year
@@ -46,111 +124,69 @@ class GedcomDate(GedcomElement):
         - __export_month1
         - __export_year1
         """
-        if self.get_value().startswith("ABT"):
-            self.__export_tag = "ABT"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[4:])
-        elif self.get_value().startswith("BEF"):
-            self.__export_tag = "BEF"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[4:])
-        elif self.get_value().startswith("AFT"):
-            self.__export_tag = "AFT"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[4:])
-        elif self.get_value().startswith("CAL"):
-            self.__export_tag = "CAL"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[4:])
-        elif self.get_value().startswith("EST"):
-            self.__export_tag = "EST"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[4:])
-        elif self.get_value().startswith("INT"):
-            self.__export_tag = "INT"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[4:])
-        elif self.get_value().startswith("TO"):
-            self.__export_tag = "TO"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[3:])
-        elif self.get_value().startswith("FROM"):
-            self.__export_tag = "FROM"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[5:])
-        elif self.get_value().startswith("BET"):
-            self.__export_tag = "BET"
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value()[4:])
-            (
-                self.__export_day1,
-                self.__export_month1,
-                self.__export_year1,
-            ) = self.__parse_date(self.get_value().split("AND")[1][1:])
-        else:
-            (
-                self.__export_day,
-                self.__export_month,
-                self.__export_year,
-            ) = self.__parse_date(self.get_value())
-
-    def __parse_date(self, date_string: str) -> tuple:
-        """Parse the date string of the Gedcom date element.
-
-        :param date_string: The date string of the Gedcom date element.
-        :type date_string: str
-        :return: The day, month and year of the Gedcom date element.
-        :rtype: tuple
-        """
-        day = month = year = ""
-        date_string = date_string.strip()
-
-        # Match DD MMM YYYY format
-        match = re.match(r"^(\d{1,2}) ([A-Z]{3}) (\d{4})$", date_string)
-        if match:
-            day, month, year = match.groups()
-            month = month.upper()
+        qualifier, date, end_date = self.__parse_date_value(self.get_value() or "")
+        if qualifier is not None:
+            self.__export_tag = qualifier
+        self.__export_day, self.__export_month, self.__export_year = date
+        if end_date is not None:
+            self.__export_day1, self.__export_month1, self.__export_year1 = end_date
 
-        # Match MMM YYYY format
-        if not match:
-            match = re.match(r"^([A-Z]{3}) (\d{4})$", date_string)
-            if match:
-                month, year = match.groups()
+    def __date_key_range(self, day: str, month: str, year: str) -> tuple:
+        """Get the range of keys of a date, which spans a whole month or year when the day or month is missing.
 
-        # Match YYYY format
-        if not match:
-            match = re.match(r"^(\d{4})$", date_string)
-            if match:
-                (year,) = match.groups()
-
-        return day, month, year
+        :return: The earliest and latest keys, or None if the date has no year.
+        :rtype: tuple
+        """
+        if not year:
+            return None
+        key = int(year) * 10000
+        if month not in self.__MONTHS:
+            return key + 101, key + 1231
+        key += self.__MONTHS[month] * 100
+        if not day:
+            return key + 1, key + 31
+        return key + int(day), key + int(day)
+
+    def get_key_range(self) -> tuple:
+        """Get the range of dates the Gedcom date element may refer to, as comparable integer keys.
+
+        A key is the integer YYYYMMDD. Approximate dates (ABT, CAL, EST) are widened by a few years, open dates (BEF,
+        AFT, FROM, TO) extend to MIN_KEY or MAX_KEY, and ranges (BET ... AND ..., FROM ... TO ...) span both dates.
+
+        :return: The earliest and latest keys, or None if the date has no year.
+        :rtype: tuple
+        """
+        self.__init_properties_once()
+        key_range = self.__date_key_range(self.__export_day, self.__export_month, self.__export_year)
+        if key_range is None:
+            return None
+        earliest, latest = key_range
+        qualifier = getattr(self, "_GedcomDate__export_tag", None)
+        if qualifier in ("ABT", "CAL", "EST"):
+            earliest -= self.__APPROXIMATION_YEARS * 10000
+            latest += self.__APPROXIMATION_YEARS * 10000
+        elif qualifier in ("BEF", "TO"):
+            earliest = self.MIN_KEY
+        elif qualifier in ("AFT", "FROM", "BET"):
+            end_range = None
+            if hasattr(self, "_GedcomDate__export_year1"):
+                end_range = self.__date_key_range(self.__export_day1, self.__export_month1, self.__export_year1)
+            if end_range is not None:
+                latest = end_range[1]
+            elif qualifier == "BET":
+                return None
+            else:
+                latest = self.MAX_KEY
+        return earliest, latest
+
+    def export(self) -> dict:
+        """Export the Gedcom date element, initializing its properties if needed.
+
+        :return: The exported Gedcom date element.
+        :rtype: dict
+        """
+        self.__init_properties_once()
+        return super().export()
 
     @classmethod
     def empty(cls):
@@ -167,6 +203,7 @@ class GedcomDate(GedcomElement):
         :return: The string representation of the Gedcom date element.
         :rtype: str
         """
+        self.__init_properties_once()
         results = [self.__export_tag] if hasattr(self, "__export_tag") else []
         if self.__export_day:
             results.append(self.__export_day)
@@ -16,6 +16,8 @@ class GedcomMap(GedcomElement):
     :rtype: GedcomMap
     """
 
+    __slots__ = ("__export_latitude", "__export_longitude")
+
     def __init__(
         self,
         level: int,
@@ -23,15 +25,20 @@ class GedcomMap(GedcomElement):
         sub_elements: list,
         value: str = None,
     ):
-        """Initialize the Gedcom map element."""
+        """Initialize the Gedcom map element. Its properties are computed on first access."""
         super().__init__(level, tag, sub_elements, value=value)
-        self.init_properties()
+        self.__export_latitude = None
 
     def init_properties(self):
         """Initialize the properties of the Gedcom map element."""
         self.__export_latitude = self.__find_latitude()
         self.__export_longitude = self.__find_longitude()
 
+    def __init_properties_once(self):
+        """Initialize the properties on first access, they are not computed when the element is created."""
+        if self.__export_latitude is None:
+            self.init_properties()
+
     def __find_latitude(self) -> str:
         """Find the latitude of the Gedcom map element.
 
@@ -60,6 +67,7 @@ class GedcomMap(GedcomElement):
         :return: The latitude of the Gedcom map element.
         :rtype: str
         """
+        self.__init_properties_once()
         return self.__export_latitude
 
     def get_longitude(self) -> str:
@@ -68,8 +76,18 @@ class GedcomMap(GedcomElement):
         :return: The longitude of the Gedcom map element.
         :rtype: str
         """
+        self.__init_properties_once()
         return self.__export_longitude
 
+    def export(self) -> dict:
+        """Export the Gedcom map element, initializing its properties if needed.
+
+        :return: The exported Gedcom map element.
+        :rtype: dict
+        """
+        self.__init_properties_once()
+        return super().export()
+
     @classmethod
     def empty(cls):
         """Return an empty Gedcom map element.
@@ -85,6 +103,7 @@ class GedcomMap(GedcomElement):
         :return: The string representation of the Gedcom map element.
         :rtype: str
         """
+        self.__init_properties_once()
         return f"Map: {self.__export_latitude}, {self.__export_longitude}"
 
     def __repr__(self) -> str:
@@ -17,6 +17,8 @@ class GedcomPlace(GedcomElement):
     :rtype: GedcomPlace
     """
 
+    __slots__ = ("__export_place_infos", "__export_map")
+
     def __init__(
         self,
         level: int,
@@ -24,15 +26,33 @@ class GedcomPlace(GedcomElement):
         sub_elements: list,
         value: str = None,
     ):
-        """Initialize the place."""
+        """Initialize the place. Its properties are computed on first access."""
         super().__init__(level, tag, sub_elements, value=value)
-        self.init_properties()
+        self.__export_place_infos = None
+
+    @classmethod
+    def get_sub_element_class(cls, tag: str) -> type:
+        """Get the class of the sub elements with a tag. The map of the place is a GedcomMap.
+
+        :param tag: The tag of the sub element.
+        :type tag: str
+        :return: The class of the sub element.
+        :rtype: type
+        """
+        if tag == "MAP":
+            return GedcomMap
+        return super().get_sub_element_class(tag)
 
     def init_properties(self):
         """Initialize the properties of the place. Which are location and map."""
         self.__export_place_infos = self.__parse_value()
         self.__export_map = self.__find_map()
 
+    def __init_properties_once(self):
+        """Initialize the properties on first access, they are not computed when the element is created."""
+        if self.__export_place_infos is None:
+            self.init_properties()
+
     def __find_map(self) -> GedcomMap:
         """Find the map of the place.
 
@@ -41,8 +61,7 @@ class GedcomPlace(GedcomElement):
         """
         map_elements = self.find_sub_element("MAP")
         if map_elements != []:
-            map = map_elements[0]
-            map.__class__ = GedcomMap
+            map = self.cast_sub_element(map_elements[0], GedcomMap)
             map.init_properties()
             return map
         return GedcomMap.empty()
@@ -61,6 +80,7 @@ class GedcomPlace(GedcomElement):
         :return: The place infos.
         :rtype: list
         """
+        self.__init_properties_once()
         return self.__export_place_infos
 
     def get_export_map(self) -> GedcomMap:
@@ -69,8 +89,18 @@ class GedcomPlace(GedcomElement):
         :return: The map of the place.
         :rtype: GedcomMap
         """
+        self.__init_properties_once()
         return self.__export_map
 
+    def export(self) -> dict:
+        """Export the place, initializing its properties if needed.
+
+        :return: The exported place.
+        :rtype: dict
+        """
+        self.__init_properties_once()
+        return super().export()
+
     @classmethod
     def empty(cls):
         """Return an empty place.
@@ -86,6 +116,7 @@ class GedcomPlace(GedcomElement):
         :return: The string representation of the place.
         :rtype: str
         """
+        self.__init_properties_once()
         return " ".join(self.__export_place_infos)
 
     def __repr__(self) -> str:
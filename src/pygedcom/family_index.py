@@ -0,0 +1,140 @@
+from .elements.rootElements.family import GedcomFamily
+
+
+class GedcomFamilyIndex:
+    """Index of the families by the xrefs of their parents and children.
+
+    The index remembers the members each family was indexed with, so that a family can be re-indexed in time
+    proportional to its size when its members change. An individual is usually in a handful of families, so they are
+    kept in small lists rather than sets.
+
+    :return: The family index.
+    :rtype: GedcomFamilyIndex
+    """
+
+    def __init__(self):
+        """Initialize an empty family index."""
+        self.__parent_families = {}
+        self.__child_families = {}
+        self.__members = {}
+        self.__version = 0
+
+    def __link(self, index: dict, xref: str, family: GedcomFamily):
+        """Add a family to the families of an xref."""
+        families = index.get(xref)
+        if families is None:
+            index[xref] = [family]
+        elif family not in families:
+            families.append(family)
+
+    def __unlink(self, index: dict, xref: str, family: GedcomFamily):
+        """Remove a family from the families of an xref."""
+        families = index.get(xref)
+        if families is not None and family in families:
+            families.remove(family)
+            if not families:
+                del index[xref]
+
+    def add_family(self, family: GedcomFamily, members: tuple = None):
+        """Index a family by its current parents and children.
+
+        :param family: The family to index.
+        :type family: GedcomFamily
+        :param members: The parents and children of the family, as returned by get_members, if they are already known.
+            Default is None, reading them from the family.
+        :type members: tuple, optional
+        """
+        if members is None:
+            members = (family.get_parents(), family.get_children())
+        parents = tuple(parent for parent in members[0] if parent)
+        children = tuple(members[1])
+        self.__members[family] = (parents, children)
+        self.__version += 1
+        for parent in parents:
+            self.__link(self.__parent_families, parent, family)
+        for child in children:
+            self.__link(self.__child_families, child, family)
+        family.set_family_index(self)
+
+    def remove_family(self, family: GedcomFamily):
+        """Remove a family from the index. Nothing is done if the family is not indexed.
+
+        :param family: The family to remove.
+        :type family: GedcomFamily
+        """
+        if family not in self.__members:
+            return
+        parents, children = self.__members.pop(family)
+        self.__version += 1
+        for parent in parents:
+            self.__unlink(self.__parent_families, parent, family)
+        for child in children:
+            self.__unlink(self.__child_families, child, family)
+        family.set_family_index(None)
+
+    def update_family(self, family: GedcomFamily):
+        """Re-index a family after its parents or children changed.
+
+        :param family: The family to re-index.
+        :type family: GedcomFamily
+        """
+        self.remove_family(family)
+        self.add_family(family)
+
+    def get_version(self) -> int:
+        """Get the version of the index, which changes whenever a family is added, removed or re-indexed.
+
+        :return: The version of the index.
+        :rtype: int
+        """
+        return self.__version
+
+    def get_members(self, family: GedcomFamily) -> tuple:
+        """Get the parents and children a family is indexed with.
+
+        :param family: The indexed family.
+        :type family: GedcomFamily
+        :return: The xrefs of the parents and the xrefs of the children.
+        :rtype: tuple
+        """
+        return self.__members[family]
+
+    def get_parent_families(self, xref: str) -> list:
+        """Get the families in which an individual is a parent.
+
+        :param xref: The xref of the individual.
+        :type xref: str
+        :return: A list of GedcomFamily objects.
+        :rtype: list
+        """
+        return list(self.__parent_families.get(xref, ()))
+
+    def get_child_families(self, xref: str) -> list:
+        """Get the families in which an individual is a child.
+
+        :param xref: The xref of the individual.
+        :type xref: str
+        :return: A list of GedcomFamily objects.
+        :rtype: list
+        """
+        return list(self.__child_families.get(xref, ()))
+
+    def get_parents(self, xref: str) -> list:
+        """Get the parents of an individual in all the families in which it is a child.
+
+        :param xref: The xref of the individual.
+        :type xref: str
+        :return: The xrefs of the parents.
+        :rtype: list
+        """
+        return [parent for family in self.__child_families.get(xref, ()) for parent in self.__members[family][0]]
+
+    def get_children(self, xref: str) -> list:
+        """Get the children of an individual in all the families in which it is a parent.
+
+        :param xref: The xref of the individual.
+        :type xref: str
+        :return: The xrefs of the children.
+        :rtype: list
+        """
+        return [child for family in self.__parent_families.get(xref, ()) for child in self.__members[family][1]]
@@ -1,4 +1,19 @@
+import bisect
+import codecs
+import contextlib
+import gc
+import hashlib
+import io
+import marshal
 import json
+import mmap
+import os
+import re
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
 
 from .elements.rootElements.rootElement import GedcomRootElement
 from .elements.rootElements.family import GedcomFamily
@@ -10,6 +25,28 @@ from .elements.rootElements.source import GedcomSource
 from .elements.rootElements.submitter import GedcomSubmitter
 from .elements.rootElements.note import GedcomNote
 from .elements.element import GedcomElement
+from .elements.subElements.date import GedcomDate
+from .family_index import GedcomFamilyIndex
+from .name_index import GedcomNameIndex
+from .parse_stats import GedcomParseStats
+from .relationship import GedcomAncestors, get_relationship_name
+
+
+def _parse_chunk(path: str, start: int, end: int, encoding: str) -> list:
+    """Parse the records of a byte range of a GEDCOM file. This runs in the worker processes of GedcomParser.parse.
+
+    :param path: The path to the GEDCOM file.
+    :type path: str
+    :param start: The offset of the first level 0 line of the range.
+    :type start: int
+    :param end: The offset where the range ends.
+    :type end: int
+    :param encoding: The encoding of the file, resolved once by the parser running the workers.
+    :type encoding: str
+    :return: The root elements of the range, in file order.
+    :rtype: list
+    """
+    return list(GedcomParser(path, encoding=encoding).iter_records(start, end))
 
 
 class GedcomParser:
@@ -20,12 +57,86 @@ class GedcomParser:
 
     :param path: The path to the GEDCOM file.
     :type path: str
+    :param use_mmap: If True, :meth:`parse` memory-maps the file and tokenizes it as bytes. Default is False.
+    :type use_mmap: bool
+    :param stats: The stats collecting timings and counters while parsing and exporting. Default is None, collecting
+        nothing.
+    :type stats: GedcomParseStats, optional
+    :param encoding: The Python codec to decode the file with. Default is None, detecting it from the byte order mark
+        and the HEAD.CHAR line, and decoding the file as latin1 if it cannot be decoded with the detected codec.
+    :type encoding: str, optional
     :return: The GEDCOM parser.
     :rtype: GedcomParser
     """
 
-    def __init__(self, path: str):
+    # The supported level 0 records: the collection they are stored in and their class.
+    __ROOT_ELEMENTS = {
+        "HEAD": ("head", GedcomHead),
+        "SUBM": ("submitters", GedcomSubmitter),
+        "INDI": ("individuals", GedcomIndividual),
+        "FAM": ("families", GedcomFamily),
+        "OBJE": ("objects", GedcomObject),
+        "NOTE": ("notes", GedcomNote),
+        "REPO": ("repositories", GedcomRepository),
+        "SOUR": ("sources", GedcomSource),
+    }
+
+    # The Python codecs matching the values of the HEAD.CHAR line. ANSEL has no Python codec, latin1 keeps its bytes.
+    __CHAR_ENCODINGS = {
+        "UTF-8": "utf-8",
+        "UTF8": "utf-8",
+        "UNICODE": "utf-16",
+        "ASCII": "utf-8",
+        "ANSI": "cp1252",
+        "IBMPC": "cp437",
+        "MACINTOSH": "mac_roman",
+        "ANSEL": "latin1",
+    }
+
+    # The encodings whose values are kept as bytes by the memory-mapped parsing, and decoded on first access.
+    __LAZY_ENCODINGS = {"utf-8", "utf-8-sig"}
+
+    # The number of bytes read at the beginning of the file to detect its encoding.
+    __ENCODING_SAMPLE_SIZE = 4096
+
+    # The size of the largest file whose content verify keeps for parse, larger files are streamed by verify.
+    __CONTENT_CACHE_SIZE = 8 << 20
+
+    # The number of bytes decoded at once when checking that a file can be decoded with its encoding.
+    __DECODE_CHUNK_SIZE = 1 << 20
+
+    # The collections of root elements, in the order they are exported after the head.
+    __EXPORT_COLLECTIONS = ("submitters", "individuals", "families", "objects", "notes", "repositories", "sources")
+
+    # The syntax of the xref of a record, checked by verify.
+    __XREF = re.compile(r"@[^@\s]+@")
+
+    # The root elements that can be added by add_many: their class, their collection and their name in error messages.
+    __ADDABLE_ELEMENTS = (
+        (GedcomIndividual, "individuals", "Individual"),
+        (GedcomFamily, "families", "Family"),
+        (GedcomSource, "sources", "Source"),
+        (GedcomObject, "objects", "Object"),
+        (GedcomRepository, "repositories", "Repository"),
+    )
+
+    # The number of individuals whose ancestors are kept between relationship queries.
+    __ANCESTORS_CACHE_SIZE = 4096
+
+    # The format of the snapshots, to be changed whenever their content changes.
+    __SNAPSHOT_FORMAT = "PYGEDCOM-SNAPSHOT-1"
+
+    # The events that can be searched by date: the collection of their records and the getter of the event.
+    __DATED_EVENTS = {
+        "BIRT": ("individuals", GedcomIndividual.get_birth),
+        "DEAT": ("individuals", GedcomIndividual.get_death),
+        "MARR": ("families", GedcomFamily.get_marriage),
+    }
+
+    def __init__(self, path: str, use_mmap: bool = False, stats: GedcomParseStats = None, encoding: str = None):
         self.path = path
+        self.use_mmap = use_mmap
+        self.stats = stats
         self.head = None
         self.individuals = []
         self.families = []
@@ -35,23 +146,227 @@ class GedcomParser:
         self.submitters = []
         self.notes = []
         self.isTRLR = False
+        self.__xref_indexes = self.__new_xref_indexes()
+        self.__family_index = GedcomFamilyIndex()
+        self.__date_indexes = {}
+        self.__ancestors = {}
+        self.__ancestors_version = None
+        self.__name_index = None
+        self.__raw_records = None
+        self.__given_encoding = encoding
+        self.__encoding = encoding
+        self.__encoding_signature = None
+        self.__content = None
+        self.__content_signature = None
+        self.__raw_tags = {}
+
+    def __new_xref_indexes(self) -> dict:
+        """Create the empty xref indexes, one per root element collection.
+
+        :return: A dictionary mapping each collection name to a dictionary of its elements by xref.
+        :rtype: dict
+        """
+        return {
+            "individuals": {},
+            "families": {},
+            "sources": {},
+            "objects": {},
+            "repositories": {},
+            "submitters": {},
+            "notes": {},
+        }
 
-    def __open(self) -> str:
-        """Open the GEDCOM file and return the content.
+    def __detect_encoding(self, head: bytes) -> str:
+        """Detect the encoding of the GEDCOM file from its first bytes.
 
+        The byte order mark is used if there is one, then the value of the HEAD.CHAR line. Files with neither are read
+        as UTF-8.
+
+        :param head: The first bytes of the file.
+        :type head: bytes
+        :return: The name of the Python codec to decode the file with.
+        :rtype: str
+        """
+        if head.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        if head.startswith(codecs.BOM_UTF16_LE) or head.startswith(codecs.BOM_UTF16_BE):
+            return "utf-16"
+        if head[:1] == b"\x00":
+            return "utf-16-be"
+        if head[1:2] == b"\x00":
+            return "utf-16-le"
+        char = re.search(rb"^1 CHAR[ \t]+(\S+)", head, re.MULTILINE)
+        if char is not None:
+            return self.__CHAR_ENCODINGS.get(char.group(1).decode("ascii", "replace").upper(), "utf-8")
+        return "utf-8"
+
+    def __open(self, keep: bool = False) -> str:
+        """Read and decode the GEDCOM file, with its line breaks normalized to LF.
+
+        A file that cannot be decoded with its detected encoding is decoded as latin1. The encoding is kept until the
+        file changes on disk, so it is only detected once by :meth:`verify` and :meth:`parse`. The content kept by the
+        previous call is reused, without opening the file, if the file did not change since.
+
+        :param keep: If True, the content is kept for the next call, as :meth:`verify` does for :meth:`parse`.
+            Default is False, releasing it.
+        :type keep: bool
+        :return: The content of the GEDCOM file.
+        :rtype: str
+        """
+        content, self.__content = self.__content, None
+        if content is not None:
+            stat = os.stat(self.path)
+            if (stat.st_size, stat.st_mtime_ns) != self.__content_signature:
+                content = None
+        if content is None:
+            with open(self.path, "rb") as file:
+                signature = self.__get_signature(file)
+                content = self.__decode(file.read(), signature)
+            self.__content_signature = signature
+        if keep:
+            self.__content = content
+        return content
+
+    def __decode(self, raw: bytes, signature: tuple) -> str:
+        """Decode the bytes of the GEDCOM file, with its line breaks normalized to LF.
+
+        :param raw: The bytes of the file.
+        :type raw: bytes
+        :param signature: The signature of the file, see __get_signature.
+        :type signature: tuple
         :return: The content of the GEDCOM file.
         :rtype: str
         """
-        supported_encodings = ["utf-8", "utf-16", "latin1", "ansi"]
-        for encoding in supported_encodings:
+        encoding = self.__get_known_encoding(signature)
+        if encoding is not None:
+            content = raw.decode(encoding)
+        else:
+            encoding = self.__detect_encoding(raw[: self.__ENCODING_SAMPLE_SIZE])
             try:
-                with open(self.path, "r", encoding=encoding) as file:
-                    return file.read()
+                content = raw.decode(encoding)
             except UnicodeDecodeError:
-                continue
-        raise ValueError(
-            f"Could not open file {self.path} with supported encodings ({', '.join(supported_encodings)})."
-        )
+                encoding = "latin1"
+                content = raw.decode(encoding)
+            self.__encoding = encoding
+            self.__encoding_signature = signature
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    def __get_signature(self, file) -> tuple:
+        """Get the size and modification time of an open file, which change when the file changes on disk.
+
+        :param file: The open file.
+        :type file: BinaryIO
+        :return: The size and the modification time in nanoseconds.
+        :rtype: tuple
+        """
+        stat = os.fstat(file.fileno())
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def __get_known_encoding(self, signature: tuple) -> str:
+        """Get the encoding given to the parser, or the encoding resolved for the file if it did not change since.
+
+        :param signature: The signature of the file, see __get_signature.
+        :type signature: tuple
+        :return: The name of the Python codec, or None if the encoding of the file must be resolved.
+        :rtype: str
+        """
+        if self.__given_encoding is not None:
+            return self.__given_encoding
+        if self.__encoding_signature == signature:
+            return self.__encoding
+        return None
+
+    def __can_decode(self, file, encoding: str) -> bool:
+        """Check if a file opened in binary mode can be decoded with an encoding, reading it by chunks.
+
+        :param file: The file, read from its current position to its end.
+        :type file: BinaryIO
+        :param encoding: The name of the Python codec.
+        :type encoding: str
+        :return: True if the whole file can be decoded, False otherwise.
+        :rtype: bool
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            for chunk in iter(lambda: file.read(self.__DECODE_CHUNK_SIZE), b""):
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def __resolve_encoding(self, file) -> str:
+        """Get the encoding of the GEDCOM file as :meth:`parse` decodes it, from the file opened in binary mode.
+
+        The encoding is detected from the first bytes, then the whole file is checked to decode with it. Like
+        :meth:`parse`, a file that cannot be decoded with its detected encoding is decoded as latin1.
+
+        :param file: The GEDCOM file opened in binary mode, left at its beginning.
+        :type file: BinaryIO
+        :return: The name of the Python codec to decode the file with.
+        :rtype: str
+        """
+        signature = self.__get_signature(file)
+        encoding = self.__get_known_encoding(signature)
+        if encoding is None:
+            encoding = self.__detect_encoding(file.read(self.__ENCODING_SAMPLE_SIZE))
+            file.seek(0)
+            if not self.__can_decode(file, encoding):
+                encoding = "latin1"
+            file.seek(0)
+            self.__encoding = encoding
+            self.__encoding_signature = signature
+        return encoding
+
+    def __get_file_encoding(self) -> str:
+        """Get the encoding of the GEDCOM file as :meth:`parse` decodes it, see __resolve_encoding.
+
+        :return: The name of the Python codec to decode the file with.
+        :rtype: str
+        """
+        with open(self.path, "rb") as file:
+            return self.__resolve_encoding(file)
+
+    def __is_byte_splittable(self) -> bool:
+        """Check if the lines of the GEDCOM file can be split on its bytes, which is needed to map it or cut it in ranges.
+
+        :return: False if the file is empty or encoded in UTF-16, True otherwise.
+        :rtype: bool
+        """
+        return os.path.getsize(self.path) > 0 and not self.__get_file_encoding().startswith("utf-16")
+
+    def __open_stream(self, errors: str = "strict"):
+        """Open the GEDCOM file for reading line by line.
+
+        :param errors: How decoding errors are handled, see :func:`open`. Default is "strict".
+        :type errors: str
+        :return: The file opened in text mode with its detected encoding.
+        :rtype: TextIO
+        """
+        file = open(self.path, "rb")
+        return io.TextIOWrapper(file, encoding=self.__resolve_encoding(file), errors=errors)
+
+    def __iter_mapped_lines(self) -> Iterator[bytes]:
+        """Memory-map the GEDCOM file and iterate over its lines as bytes.
+
+        The lines are sliced from the mapping, so the file is paged in by the operating system instead of being read
+        and decoded at once. Like :meth:`parse`, a carriage return alone also ends a line.
+
+        :return: A generator of the lines of the file, without their line break.
+        :rtype: Iterator[bytes]
+        """
+        with open(self.path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped[: len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                    mapped.seek(len(codecs.BOM_UTF8))
+                for line in iter(mapped.readline, b""):
+                    line = line.rstrip(b"\r\n")
+                    if b"\r" in line:
+                        yield from line.split(b"\r")
+                    else:
+                        yield line
 
     def __parse_line(self, line: str) -> dict:
         """Parse a line of a GEDCOM file.
@@ -61,123 +376,340 @@ class GedcomParser:
         :return: A dictionary with the level, the xref, the tag and the value.
         :rtype: dict
         """
-        chars = line.split(" ")
-        level = int(chars.pop(0))
-        xref = chars.pop(0) if chars[0].startswith("@") else None
-        tag = chars.pop(0)
-        value = " ".join(chars) if chars != [] else ""
+        chars = line.split(" ", 2)
+        level = int(chars[0])
+        xref = None
+        if chars[1].startswith("@"):
+            xref = chars[1]
+            chars = chars[2].split(" ", 1)
+        else:
+            chars = chars[1:]
+        tag = sys.intern(chars[0])
+        value = chars[1] if len(chars) > 1 else ""
         return {"level": level, "xref": xref, "tag": tag, "value": value}
 
-    def verify(self) -> dict:
-        """Verify the file is a valid GEDCOM file. This only checks the level of each line, not the content.
+    def __parse_raw_line(self, line: bytes) -> dict:
+        """Parse a line of a memory-mapped GEDCOM file directly from its bytes.
+
+        Each distinct tag is decoded once. For UTF-8 files the value is kept as bytes and only decoded when it is
+        first read with :meth:`GedcomElement.get_value`.
+
+        :param line: The line to parse.
+        :type line: bytes
+        :return: A dictionary with the level, the xref, the tag and the value.
+        :rtype: dict
+        """
+        chars = line.split(b" ", 2)
+        level = int(chars[0])
+        xref = None
+        if chars[1].startswith(b"@"):
+            xref = chars[1].decode(self.__encoding)
+            chars = chars[2].split(b" ", 1)
+        else:
+            chars = chars[1:]
+        tag = self.__raw_tags.get(chars[0])
+        if tag is None:
+            tag = self.__raw_tags[chars[0]] = chars[0].decode(self.__encoding)
+        value = chars[1] if len(chars) > 1 else ""
+        if value and self.__encoding not in self.__LAZY_ENCODINGS:
+            value = value.decode(self.__encoding)
+        return {"level": level, "xref": xref, "tag": tag, "value": value}
 
-        :return: A dictionary with the status and the message.
+    def verify(self, max_errors: int = 100) -> dict:
+        """Verify the file is a valid GEDCOM file. This checks the syntax of each line, not the content.
+
+        Files up to 8 MiB are read and decoded at once, and their content is kept until the next :meth:`parse` or
+        :meth:`reparse`, so that verifying then parsing reads them once. Larger files are streamed line by line, so
+        that they can be checked with little memory, and :meth:`parse` reads them again. Their encoding is then
+        checked with an extra pass over the file, and is kept for :meth:`parse`.
+        The errors are:
+            - a level that is not a number, or that is more than one deeper than the previous line.
+            - a line without tag.
+            - a record xref that is not of the form @XREF@.
+            - a record xref already used by a previous record.
+        A file that does not end with a TRLR record is reported as a warning, as many files omit it.
+
+        :param max_errors: The number of errors after which the verification stops. Default is 100.
+        :type max_errors: int
+        :return: A dictionary with the status, the message of the first error, and the errors and warnings as
+            dictionaries with their line number and message.
         :rtype: dict
         """
-        file = self.__open()
-        lines = file.split("\n")
+        errors = []
+        warnings = []
+        xrefs = {}
         current_level = 0
         current_line = 0
-        for line in lines:
-            current_line += 1
-            if line != "":
-                # Check if the level is valid
-                parsed_line = self.__parse_line(line)
-                if parsed_line["level"] > current_level + 1:
-                    return {
-                        "status": "error",
-                        "message": "Invalid level on line " + str(current_line) + ": " + line,
-                    }
-                current_level = parsed_line["level"]
-        return {"status": "ok", "message": ""}
+        last_tag = None
+
+        def add_error(message: str):
+            errors.append({"line": current_line, "message": message + " on line " + str(current_line) + ": " + line})
+
+        if os.path.getsize(self.path) <= self.__CONTENT_CACHE_SIZE:
+            lines = self.__open(keep=True).split("\n")
+            if lines[-1] == "":
+                lines.pop()
+            file = contextlib.nullcontext(lines)
+        else:
+            file = self.__open_stream(errors="replace")
+        with file as lines:
+            for line in lines:
+                current_line += 1
+                line = line.rstrip("\n")
+                if line == "":
+                    continue
+                level, _, rest = line.partition(" ")
+                if not (level.isascii() and level.isdigit()):
+                    add_error("Invalid level number")
+                else:
+                    level = int(level)
+                    if level > current_level + 1:
+                        add_error("Invalid level")
+                    current_level = level
+                    if rest.startswith("@"):
+                        xref, _, rest = rest.partition(" ")
+                        if self.__XREF.fullmatch(xref) is None:
+                            add_error("Invalid xref")
+                        elif level == 0 and xref in xrefs:
+                            add_error("Duplicate xref " + xref + " of line " + str(xrefs[xref]))
+                        elif level == 0:
+                            xrefs[xref] = current_line
+                    tag = rest.partition(" ")[0]
+                    if tag == "":
+                        add_error("Missing tag")
+                    elif level == 0:
+                        last_tag = tag
+                if len(errors) >= max_errors:
+                    break
+            else:
+                if last_tag != "TRLR":
+                    warnings.append({"line": current_line, "message": "Missing TRLR record at the end of the file"})
+        return {
+            "status": "error" if errors else "ok",
+            "message": errors[0]["message"] if errors else "",
+            "errors": errors,
+            "warnings": warnings,
+        }
+
+    def __build_root_element(self, parsed_line: dict, element_lines: list) -> GedcomRootElement:
+        """Build the typed root element matching the tag of the parsed line.
+
+        :param parsed_line: The parsed line.
+        :type parsed_line: dict
+        :param element_lines: The tokenized (level, tag, value) lines of the element.
+        :type element_lines: list
+        :return: The root element, or None if the tag is not a supported record.
+        :rtype: GedcomRootElement
+        """
+        if parsed_line["tag"] not in self.__ROOT_ELEMENTS:
+            return None
+        element_class = self.__ROOT_ELEMENTS[parsed_line["tag"]][1]
+        return element_class(
+            parsed_line["level"],
+            parsed_line["xref"] if parsed_line["tag"] != "HEAD" else "",  # No xref for HEAD
+            parsed_line["tag"],
+            element_lines,
+        )
 
     def __create_element(self, parsed_line: dict, element_lines: list):
         """Create an element based on the parsed line and the element lines.
 
         :param parsed_line: The parsed line.
         :type parsed_line: dict
-        :param element_lines: The lines of the element.
+        :param element_lines: The tokenized (level, tag, value) lines of the element.
         :type element_lines: list
         """
-        if parsed_line["tag"] == "INDI":
-            self.individuals.append(
-                GedcomIndividual(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "FAM":
-            self.families.append(
-                GedcomFamily(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "HEAD":
-            self.head = GedcomHead(
-                parsed_line["level"],
-                "",  # No xref for HEAD
-                parsed_line["tag"],
-                element_lines,
-            )
-        elif parsed_line["tag"] == "SOUR":
-            self.sources.append(
-                GedcomSource(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "REPO":
-            self.repositories.append(
-                GedcomRepository(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "OBJE":
-            self.objects.append(
-                GedcomObject(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "TRLR":
+        if parsed_line["tag"] == "TRLR":
             self.isTRLR = True
-        elif parsed_line["tag"] == "SUBM":
-            self.submitters.append(
-                GedcomSubmitter(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
-        elif parsed_line["tag"] == "NOTE":
-            self.notes.append(
-                GedcomNote(
-                    parsed_line["level"],
-                    parsed_line["xref"],
-                    parsed_line["tag"],
-                    element_lines,
-                )
-            )
+        elif parsed_line["tag"] in self.__ROOT_ELEMENTS:
+            self.__store_root_element(self.__build_root_element(parsed_line, element_lines))
+
+    def __create_elements_with_stats(self, records: Iterator[tuple]):
+        """Create the elements of the records as __create_element does, timing each phase in the stats and counting
+        the lines, records and elements.
+
+        :param records: The (parsed level 0 line, tokenized lines) of the records.
+        :type records: Iterator[tuple]
+        """
+        stats = self.stats
+        records = iter(records)
+        while True:
+            start = time.perf_counter()
+            record = next(records, None)
+            tokenized = time.perf_counter()
+            stats.add_time("tokenize", tokenized - start)
+            if record is None:
+                break
+            parsed_line, element_lines = record
+            stats.count_lines(len(element_lines) + 1)
+            element = self.__build_root_element(parsed_line, element_lines)
+            if element is None:
+                self.isTRLR = self.isTRLR or parsed_line["tag"] == "TRLR"
+                stats.count_record(parsed_line["tag"], 0)
+                continue
+            built = time.perf_counter()
+            stats.add_time("build", built - tokenized)
+            self.__store_root_element(element)
+            stats.add_time("index", time.perf_counter() - built)
+            stats.count_record(parsed_line["tag"], len(element_lines) + 1)
+
+    def __phase(self, phase: str):
+        """Time a with block as part of a phase of the stats, or do nothing if the parser has no stats.
+
+        :param phase: The name of the phase.
+        :type phase: str
+        :return: The context manager of the with block.
+        :rtype: ContextManager
+        """
+        if self.stats is None:
+            return contextlib.nullcontext()
+        return self.stats.phase(phase)
+
+    def __store_root_element(self, element: GedcomRootElement, members: tuple = None):
+        """Store a parsed root element as the head or in the collection matching its tag.
+
+        :param element: The element to store.
+        :type element: GedcomRootElement
+        :param members: The parents and children of a family, if they are already known. Default is None.
+        :type members: tuple, optional
+        """
+        if element.get_tag() == "HEAD":
+            self.head = element
+        else:
+            self.__index_root_element(self.__ROOT_ELEMENTS[element.get_tag()][0], element, members)
+
+    def __iter_raw_records(self, lines, parse_line) -> Iterator[tuple]:
+        """Group the lines of a GEDCOM file by level 0 record.
+
+        :param lines: The lines of the file, without their line break.
+        :type lines: Iterable[str] or Iterable[bytes]
+        :param parse_line: The function tokenizing a line into a dictionary with its level, xref, tag and value.
+        :type parse_line: Callable
+        :return: A generator of (parsed level 0 line, tokenized (level, tag, value) lines of the record) tuples.
+        :rtype: Iterator[tuple]
+        """
+        current_parsed_line = None
+        element_lines = []
+        for line in lines:
+            if line:
+                # Each line is tokenized once here, the elements are then built from the tokens.
+                tmp_parsed_line = parse_line(line)
+                if tmp_parsed_line["level"] > 0:
+                    element_lines.append((tmp_parsed_line["level"], tmp_parsed_line["tag"], tmp_parsed_line["value"]))
+                else:
+                    if current_parsed_line is not None:
+                        yield current_parsed_line, element_lines
+                    current_parsed_line = tmp_parsed_line
+                    element_lines = []
+        if current_parsed_line is not None:
+            yield current_parsed_line, element_lines
+
+    def __index_root_element(self, collection: str, element: GedcomRootElement, members: tuple = None):
+        """Append a parsed element to its collection and index it by xref. Families are also indexed by their members.
+
+        If the file contains the same xref twice, the first element keeps the xref.
+
+        :param collection: The name of the collection to add the element to.
+        :type collection: str
+        :param element: The element to add.
+        :type element: GedcomRootElement
+        :param members: The parents and children of a family, if they are already known. Default is None.
+        :type members: tuple, optional
+        """
+        getattr(self, collection).append(element)
+        self.__xref_indexes[collection].setdefault(element.get_xref(), element)
+        if collection == "families":
+            self.__family_index.add_family(element, members)
+        if self.stats is not None:
+            element.set_stats(self.stats)
+
+    def __find_record_boundaries(self, parts: int) -> list:
+        """Split the GEDCOM file in byte ranges of whole level 0 records.
+
+        :param parts: The number of ranges wanted. Fewer ranges are returned for files with too few records.
+        :type parts: int
+        :return: The offsets of the ranges, starting with 0 and ending with the size of the file.
+        :rtype: list
+        """
+        size = os.path.getsize(self.path)
+        offsets = [0]
+        with open(self.path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for part in range(1, parts):
+                    position = mapped.find(b"\n0 ", max(size * part // parts, offsets[-1]))
+                    if position == -1:
+                        break
+                    offsets.append(position + 1)
+        offsets.append(size)
+        return offsets
+
+    def __ends_with_trailer(self) -> bool:
+        """Check if the last record of the GEDCOM file is the TRLR record.
+
+        :return: True if the file ends with a TRLR record, False otherwise.
+        :rtype: bool
+        """
+        with open(self.path, "rb") as file:
+            file.seek(max(os.path.getsize(self.path) - self.__ENCODING_SAMPLE_SIZE, 0))
+            tail = file.read()
+        return re.search(rb"(^|[\r\n])0 TRLR\s*$", tail) is not None
+
+    def __parse_in_processes(self, workers: int):
+        """Parse the GEDCOM file with a pool of processes, each one parsing a range of level 0 records.
 
-    def parse(self) -> dict:
+        The records of every range are merged back into the collections in file order.
+
+        :param workers: The number of processes.
+        :type workers: int
+        """
+        offsets = self.__find_record_boundaries(workers)
+        parts = len(offsets) - 1
+        # The encoding is resolved once here, so that the workers decode the file as parse does without checking it.
+        encodings = [self.__get_file_encoding()] * parts
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_parse_chunk, [self.path] * parts, offsets[:-1], offsets[1:], encodings)
+            for records in chunks:
+                for record in records:
+                    self.__store_root_element(record)
+                    if self.stats is not None:
+                        self.stats.count_record(record.get_tag(), 0)
+        self.isTRLR = self.__ends_with_trailer()
+
+    def parse(self, workers: int = 1) -> dict:
         """Parse the GEDCOM file and return a dictionary with the parsed elements
 
+        Level 0 records are independent, so with more than one worker the file is cut in ranges of records parsed in
+        parallel processes. This is not supported for UTF-16 files, which are always parsed in the current process.
+
+        :param workers: The number of processes parsing the file. Default is 1, parsing in the current process.
+        :type workers: int
         :return: A dictionary with the parsed elements.
         :rtype: dict
         """
+        self.__reset()
+        if (workers > 1 or self.use_mmap) and self.__is_byte_splittable():
+            # The content kept by verify is not used when parsing bytes, it is released.
+            self.__content = None
+            if workers > 1:
+                with self.__phase("processes"):
+                    self.__parse_in_processes(workers)
+                records = []
+            else:
+                records = self.__iter_raw_records(self.__iter_mapped_lines(), self.__parse_raw_line)
+        else:
+            # UTF-16 lines cannot be split on bytes, such files are always decoded.
+            with self.__phase("decode"):
+                lines = self.__open().split("\n")
+            records = self.__iter_raw_records(lines, self.__parse_line)
+        if self.stats is None:
+            for parsed_line, element_lines in records:
+                self.__create_element(parsed_line, element_lines)
+        else:
+            self.__create_elements_with_stats(records)
+        return self.__get_parsed_elements()
+
+    def __reset(self):
+        """Remove all the parsed elements."""
         self.head = None
         self.submitters = []
         self.individuals = []
@@ -186,21 +718,20 @@ class GedcomParser:
         self.objects = []
         self.notes = []
         self.repositories = []
-        file = self.__open()
-        lines = file.split("\n")
-        current_parsed_line = self.__parse_line(lines[0])
-        element_lines = []
-        if lines != []:
-            for line in lines[1:]:
-                if line != "":
-                    tmp_parsed_line = self.__parse_line(line)
-                    if tmp_parsed_line["level"] > 0:
-                        element_lines.append(line)
-                    else:
-                        self.__create_element(current_parsed_line, element_lines)
-                        current_parsed_line = tmp_parsed_line
-                        element_lines = []
-            self.__create_element(current_parsed_line, element_lines)
+        self.isTRLR = False
+        self.__xref_indexes = self.__new_xref_indexes()
+        self.__family_index = GedcomFamilyIndex()
+        self.__date_indexes = {}
+        self.__ancestors = {}
+        self.__name_index = None
+        self.__raw_records = None
+
+    def __get_parsed_elements(self) -> dict:
+        """Get the parsed elements, as returned by parse.
+
+        :return: A dictionary with the parsed elements.
+        :rtype: dict
+        """
         return {
             "head": self.head,
             "individuals": self.individuals,
@@ -212,6 +743,302 @@ class GedcomParser:
             "repositories": self.repositories,
         }
 
+    def __get_snapshot_path(self, cache_dir: str) -> str:
+        """Get the path of the snapshot of the GEDCOM file.
+
+        :param cache_dir: The directory of the snapshot, or None to put it next to the GEDCOM file.
+        :type cache_dir: str
+        :return: The path of the snapshot.
+        :rtype: str
+        """
+        if cache_dir is None:
+            return self.path + ".snapshot"
+        name = hashlib.sha256(os.path.abspath(self.path).encode("utf-8")).hexdigest()
+        return os.path.join(cache_dir, name + ".snapshot")
+
+    def __hash_file(self) -> str:
+        """Hash the content of the GEDCOM file.
+
+        :return: The hexadecimal digest of the content.
+        :rtype: str
+        """
+        digest = hashlib.blake2b()
+        with open(self.path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def save_snapshot(self, cache_dir: str = None) -> str:
+        """Save the parsed elements to a binary snapshot, which load_snapshot reads back much faster than parse.
+
+        The snapshot records the size, modification time and hash of the GEDCOM file, so it should be saved right after
+        parsing, before editing the elements. Snapshots can only be loaded by the Python version that saved them.
+
+        :param cache_dir: The directory to save the snapshot in. Default is None, saving it next to the GEDCOM file.
+        :type cache_dir: str, optional
+        :return: The path of the snapshot.
+        :rtype: str
+        """
+        stat = os.stat(self.path)
+        header = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "hash": self.__hash_file()}
+        records = [self.head] if self.head else []
+        for collection in self.__EXPORT_COLLECTIONS:
+            records += getattr(self, collection)
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        path = self.__get_snapshot_path(cache_dir)
+        # Write to a temporary file first, so that a concurrent load never reads a partial snapshot.
+        with open(path + ".tmp", "wb") as file:
+            file.write(self.__get_snapshot_magic())
+            marshal.dump(header, file)
+            # The members of the families are saved too, so that indexing them does not unpack their sub elements.
+            records = [
+                (
+                    record.get_tag(),
+                    record.get_xref(),
+                    record.pack_sub_elements(),
+                    self.__family_index.get_members(record) if record.get_tag() == "FAM" else None,
+                )
+                for record in records
+            ]
+            # The packed lines repeat the same tags over and over, a fast compression makes the snapshot compact.
+            file.write(zlib.compress(marshal.dumps((self.isTRLR, records)), 1))
+        os.replace(path + ".tmp", path)
+        return path
+
+    def __get_snapshot_magic(self) -> bytes:
+        """Get the first bytes of a snapshot, which identify its format and the Python version that saved it.
+
+        :return: The first bytes of a snapshot.
+        :rtype: bytes
+        """
+        return f"{self.__SNAPSHOT_FORMAT} {sys.version_info[0]}.{sys.version_info[1]}\n".encode("ascii")
+
+    def load_snapshot(self, cache_dir: str = None) -> bool:
+        """Load the elements from the snapshot saved by save_snapshot, if it is up to date.
+
+        The snapshot is up to date if the GEDCOM file has the same size and modification time, or the same size and
+        content hash, as when it was saved. Records are created without their sub elements, which are only built when
+        they are first accessed.
+
+        :param cache_dir: The directory of the snapshot. Default is None, for a snapshot next to the GEDCOM file.
+        :type cache_dir: str, optional
+        :return: True if the snapshot was loaded, False if it is missing or stale, leaving the elements unchanged.
+        :rtype: bool
+        """
+        try:
+            file = open(self.__get_snapshot_path(cache_dir), "rb")
+        except OSError:
+            return False
+        with file:
+            magic = self.__get_snapshot_magic()
+            if file.read(len(magic)) != magic:
+                return False
+            try:
+                header = marshal.load(file)
+                stat = os.stat(self.path)
+                if header["size"] != stat.st_size:
+                    return False
+                if header["mtime"] != stat.st_mtime_ns and header["hash"] != self.__hash_file():
+                    return False
+                is_trlr, records = marshal.loads(zlib.decompress(file.read()))
+            except (EOFError, ValueError, TypeError, zlib.error):
+                return False
+        # The records are created at once without any cycle to collect, the garbage collector would only slow it down.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.__reset()
+            for tag, xref, packed, members in records:
+                self.__store_root_element(self.__ROOT_ELEMENTS[tag][1](0, xref, tag, packed), members)
+            self.isTRLR = is_trlr
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return True
+
+    def parse_cached(self, cache_dir: str = None, workers: int = 1) -> dict:
+        """Load the elements from an up to date snapshot, or parse the GEDCOM file and save its snapshot.
+
+        :param cache_dir: The directory of the snapshot. Default is None, for a snapshot next to the GEDCOM file.
+        :type cache_dir: str, optional
+        :param workers: The number of processes parsing the file if the snapshot is stale, see parse. Default is 1.
+        :type workers: int
+        :return: A dictionary with the parsed elements.
+        :rtype: dict
+        """
+        if not self.load_snapshot(cache_dir):
+            self.parse(workers)
+            self.save_snapshot(cache_dir)
+        return self.__get_parsed_elements()
+
+    def __build_raw_records(self, text: str) -> tuple:
+        """Build the records of a piece of a GEDCOM file.
+
+        :param text: The lines of the records.
+        :type text: str
+        :return: The (tag, root element or None if the tag is not a supported record) of each record.
+        :rtype: tuple
+        """
+        return tuple(
+            (parsed_line["tag"], self.__build_root_element(parsed_line, element_lines))
+            for parsed_line, element_lines in self.__iter_raw_records(text.split("\n"), self.__parse_line)
+        )
+
+    def reparse(self) -> dict:
+        """Parse the GEDCOM file again, only building the records that changed since the last call.
+
+        The text of each level 0 record is hashed and compared with the records of the last call. Unchanged records
+        keep their element, only the added and changed records are parsed, and the collections and indexes are patched
+        in place. The first call, and the first one after parse or load_snapshot, parses the whole file.
+
+        Unchanged records keep their element as it is, including the changes made to it since the last call, so this
+        is meant for trees that are not edited between calls. Elements added to the collections are removed as they are
+        not in the file.
+
+        :return: A dictionary with the parsed elements.
+        :rtype: dict
+        """
+        previous = self.__raw_records
+        if previous is None:
+            self.__reset()
+            previous = {}
+        with self.__phase("decode"):
+            content = self.__open()
+        raw_records = {}
+        records = []
+        added = set()
+        with self.__phase("build"):
+            # Every level 0 line but the first one starts a piece of the split content.
+            for position, text in enumerate(content.split("\n0 ")):
+                digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+                reused = previous.get(digest)
+                if reused:
+                    pieces = reused.pop()
+                else:
+                    pieces = self.__build_raw_records(text if position == 0 else "0 " + text)
+                    added.update(element for tag, element in pieces if element is not None)
+                raw_records.setdefault(digest, []).append(pieces)
+                records += pieces
+        with self.__phase("index"):
+            self.__patch_records(records, added)
+        self.__raw_records = raw_records
+        return self.__get_parsed_elements()
+
+    def __patch_records(self, records: list, added: set):
+        """Replace the elements of the collections with the records of the file, updating the indexes for the added
+        and removed elements only.
+
+        :param records: The (tag, root element or None) of the records, in file order.
+        :type records: list
+        :param added: The elements built for the records that were not in the collections.
+        :type added: set
+        """
+        self.head = None
+        self.isTRLR = False
+        collections = {collection: [] for collection in self.__xref_indexes}
+        for tag, element in records:
+            if tag == "TRLR":
+                self.isTRLR = True
+            elif element is None:
+                continue
+            elif tag == "HEAD":
+                self.head = element
+            else:
+                collections[self.__ROOT_ELEMENTS[tag][0]].append(element)
+        for collection, elements in collections.items():
+            current = getattr(self, collection)
+            index = self.__xref_indexes[collection]
+            # The xrefs are unique unless the file uses the same xref twice, in which case the first element keeps it.
+            had_duplicates = len(index) != len(current)
+            kept = set(elements)
+            removed = [element for element in current if element not in kept]
+            new = [element for element in elements if element in added]
+            # The collection is assigned in place so that the lists returned by a previous parse stay up to date.
+            current[:] = elements
+            if not removed and not new:
+                continue
+            for element in removed:
+                if index.get(element.get_xref()) is element:
+                    del index[element.get_xref()]
+                if collection == "families":
+                    self.__family_index.remove_family(element)
+                elif collection == "individuals" and self.__name_index is not None:
+                    self.__name_index.remove_individual(element)
+            for element in new:
+                index.setdefault(element.get_xref(), element)
+                if collection == "families":
+                    self.__family_index.add_family(element)
+                elif collection == "individuals" and self.__name_index is not None:
+                    self.__name_index.add_individual(element)
+                if self.stats is not None:
+                    element.set_stats(self.stats)
+            if had_duplicates or len(index) != len(elements):
+                index.clear()
+                for element in elements:
+                    index.setdefault(element.get_xref(), element)
+            self.__date_indexes = {}
+            self.__ancestors = {}
+
+    def __iter_range_lines(self, start: int, end: int) -> Iterator[str]:
+        """Iterate over the lines of a byte range of the GEDCOM file.
+
+        :param start: The offset of the first line.
+        :type start: int
+        :param end: The offset where the range ends.
+        :type end: int
+        :return: A generator of the decoded lines, without their line break. A carriage return alone also ends a line.
+        :rtype: Iterator[str]
+        """
+        encoding = self.__get_file_encoding()
+        if encoding.startswith("utf-16"):
+            raise ValueError("Byte ranges are not supported for UTF-16 files.")
+        with open(self.path, "rb") as file:
+            file.seek(start)
+            remaining = end - start
+            for line in file:
+                if remaining <= 0:
+                    break
+                remaining -= len(line)
+                line = line.decode(encoding).rstrip("\r\n")
+                if "\r" in line:
+                    yield from line.split("\r")
+                else:
+                    yield line
+
+    def iter_records(self, start: int = 0, end: int = None) -> Iterator[GedcomRootElement]:
+        """Iterate over the records of the GEDCOM file without loading the whole file in memory.
+
+        The file is read line by line and each record is yielded as soon as it is complete, so the memory used is
+        bounded by the largest record. The collections of the parser are left untouched.
+
+        A byte range can be given to read only part of the file, for instance to share it between workers. The range
+        must start at the beginning of a level 0 line.
+
+        :param start: The offset where to start reading. Default is 0.
+        :type start: int
+        :param end: The offset where to stop reading, the last record read is the one starting before it. Default is
+            None, reading until the end of the file.
+        :type end: int
+        :return: A generator of the root elements (GedcomHead, GedcomIndividual, GedcomFamily, ...) in file order.
+        :rtype: Iterator[GedcomRootElement]
+        :raises ValueError: If a byte range is given for a UTF-16 file.
+        """
+        if start == 0 and end is None:
+            file = self.__open_stream()
+            lines = (line.rstrip("\n") for line in file)
+        else:
+            file = None
+            lines = self.__iter_range_lines(start, end if end is not None else os.path.getsize(self.path))
+        try:
+            for parsed_line, element_lines in self.__iter_raw_records(lines, self.__parse_line):
+                element = self.__build_root_element(parsed_line, element_lines)
+                if element is not None:
+                    yield element
+        finally:
+            if file is not None:
+                file.close()
+
     def get_stats(self) -> dict:
         """Get statistics about the GEDCOM file.
 
@@ -251,6 +1078,129 @@ class GedcomParser:
             elif not d[k]:
                 del d[k]
 
+    def __dump_json(self, value, depth: int) -> str:
+        """Serialize a value as json.dumps(indent=4) would when the value is nested at the given depth.
+
+        :param value: The value to serialize.
+        :type value: Any
+        :param depth: The number of objects the value is nested in.
+        :type depth: int
+        :return: The serialized value.
+        :rtype: str
+        """
+        return json.dumps(value, indent=4, ensure_ascii=False).replace("\n", "\n" + "    " * depth)
+
+    def __iter_export_records(self, collection: str) -> Iterator[GedcomRootElement]:
+        """Get the records of a collection as they appear in the JSON export.
+
+        Like the keys of a dictionary, a duplicated xref is exported once, at its first position with its last record.
+
+        :param collection: The name of the collection.
+        :type collection: str
+        :return: The records of the collection.
+        :rtype: Iterator[GedcomRootElement]
+        """
+        records = getattr(self, collection)
+        if len(records) != len(self.__xref_indexes[collection]):
+            return iter({record.get_xref(): record for record in records}.values())
+        return iter(records)
+
+    def __serialize_json(self, record: GedcomRootElement, empty_fields: bool, depth: int) -> str:
+        """Export, prune and serialize a record for the JSON export. The result is cached until the record changes.
+
+        :param record: The record to serialize.
+        :type record: GedcomRootElement
+        :param empty_fields: If True, empty fields will be exported.
+        :type empty_fields: bool
+        :param depth: The number of objects the record is nested in.
+        :type depth: int
+        :return: The serialized record, or None if it only has empty fields and they are not exported.
+        :rtype: str
+        """
+
+        def serialize(record: GedcomRootElement) -> str:
+            exported = record.export()
+            if not empty_fields:
+                self.__remove_empty(exported)
+                if not exported:
+                    return None
+            return self.__dump_json(exported, depth)
+
+        key = f"json-{depth}" if empty_fields else f"json-{depth}-without-empty-fields"
+        return record.get_serialization(key, serialize)
+
+    def __write_json(self, fp, empty_fields: bool):
+        """Write the JSON export, with the same layout as json.dumps(indent=4).
+
+        Each record is exported, pruned and serialized on its own, so only one record is held in memory at a time.
+        Records that did not change since the previous export are not serialized again.
+
+        :param fp: The file object to write to.
+        :type fp: TextIO
+        :param empty_fields: If True, empty fields will be exported.
+        :type empty_fields: bool
+        """
+        separator = "{"
+        if empty_fields or self.head:
+            head = self.__serialize_json(self.head, empty_fields, 1) if self.head else '""'
+            if head is not None:
+                fp.write(separator + '\n    "head": ' + head)
+                separator = ","
+        for collection in self.__EXPORT_COLLECTIONS:
+            record_separator = "{"
+            for record in self.__iter_export_records(collection):
+                serialized = self.__serialize_json(record, empty_fields, 2)
+                if serialized is None:
+                    continue
+                if record_separator == "{":
+                    fp.write(separator + '\n    "' + collection + '": ')
+                    separator = ","
+                fp.write(record_separator + "\n        " + self.__dump_json(record.get_xref(), 2) + ": ")
+                fp.write(serialized)
+                record_separator = ","
+            if record_separator == ",":
+                fp.write("\n    }")
+            elif empty_fields:
+                fp.write(separator + '\n    "' + collection + '": {}')
+                separator = ","
+        fp.write("{}" if separator == "{" else "\n}")
+
+    def __write_gedcom(self, fp):
+        """Write the GEDCOM export record by record. Records that did not change since the previous export are not
+        serialized again.
+
+        :param fp: The file object to write to.
+        :type fp: TextIO
+        """
+        if self.head:
+            fp.write(self.head.get_serialization("gedcom", GedcomElement.extract_gedcom))
+        for collection in self.__EXPORT_COLLECTIONS:
+            for record in getattr(self, collection):
+                fp.write(record.get_serialization("gedcom", GedcomElement.extract_gedcom))
+        if self.isTRLR:
+            fp.write("0 TRLR\n")
+
+    def export_to(self, fp, format: str = "json", empty_fields=True):
+        """Export the GEDCOM file to another format, writing it to a file object record by record.
+
+        Unlike export, the whole document is never held in memory, so it can be written straight to a file or a socket.
+
+        :param fp: The text file object to write to.
+        :type fp: TextIO
+        :param format: The format to export to. Default is "json".
+        :type format: str
+        :param empty_fields: If True, empty fields will be exported. Default is True.
+        :type empty_fields: bool
+        :raises ValueError: If the format is not supported.
+        """
+        if format not in ["json", "gedcom"]:
+            raise ValueError("Format " + format + " is not supported.")
+        with self.__phase("export"):
+            if format == "json":
+                self.__write_json(fp, empty_fields)
+            if format == "gedcom":
+                self.__write_gedcom(fp)
+
     def export(self, format: str = "json", empty_fields=True) -> str:
         """Export the GEDCOM file to another format.
 
@@ -262,64 +1212,9 @@ class GedcomParser:
         :rtype: str
         :raises ValueError: If the format is not supported.
         """
-        if format not in ["json", "gedcom"]:
-            raise ValueError("Format " + format + " is not supported.")
-        if format == "json":
-            export = {}
-            if empty_fields or self.head:
-                export["head"] = self.head.export() if self.head else ""
-            if empty_fields or self.submitters:
-                export["submitters"] = {}
-                for submitter in self.submitters:
-                    export["submitters"][submitter.get_xref()] = submitter.export()
-            if empty_fields or self.individuals:
-                export["individuals"] = {}
-                for individual in self.individuals:
-                    export["individuals"][individual.get_xref()] = individual.export()
-            if empty_fields or self.families:
-                export["families"] = {}
-                for family in self.families:
-                    export["families"][family.get_xref()] = family.export()
-            if empty_fields or self.objects:
-                export["objects"] = {}
-                for object in self.objects:
-                    export["objects"][object.get_xref()] = object.export()
-            if empty_fields or self.notes:
-                export["notes"] = {}
-                for note in self.notes:
-                    export["notes"][note.get_xref()] = note.export()
-            if empty_fields or self.repositories:
-                export["repositories"] = {}
-                for repository in self.repositories:
-                    export["repositories"][repository.get_xref()] = repository.export()
-            if empty_fields or self.sources:
-                export["sources"] = {}
-                for source in self.sources:
-                    export["sources"][source.get_xref()] = source.export()
-
-            if not empty_fields:
-                self.__remove_empty(export)
-            return json.dumps(export, indent=4, ensure_ascii=False)
-        if format == "gedcom":
-            content = ""
-            if self.head:
-                content += self.head.extract_gedcom()
-            for submitter in self.submitters:
-                content += submitter.extract_gedcom()
-            for individual in self.individuals:
-                content += individual.extract_gedcom()
-            for family in self.families:
-                content += family.extract_gedcom()
-            for object in self.objects:
-                content += object.extract_gedcom()
-            for note in self.notes:
-                content += note.extract_gedcom()
-            for repository in self.repositories:
-                content += repository.extract_gedcom()
-            for source in self.sources:
-                content += source.extract_gedcom()
-            content += "0 TRLR\n" if self.isTRLR else ""
-            return content
+        buffer = io.StringIO()
+        self.export_to(buffer, format, empty_fields)
+        return buffer.getvalue()
 
     def get_parents(self, individual: GedcomIndividual) -> list:
         """Get the parents of an individual.
@@ -330,12 +1225,11 @@ class GedcomParser:
         :rtype: list
         """
         parents = []
-        for family in self.families:
-            if individual.get_xref() in family.get_children():
-                if family.get_husband() != "":
-                    parents.append(self.find_individual(family.get_husband()))
-                if family.get_wife() != "":
-                    parents.append(self.find_individual(family.get_wife()))
+        for family in self.__family_index.get_child_families(individual.get_xref()):
+            if family.get_husband() != "":
+                parents.append(self.find_individual(family.get_husband()))
+            if family.get_wife() != "":
+                parents.append(self.find_individual(family.get_wife()))
         return parents
 
     def get_children(self, individual: GedcomIndividual) -> list:
@@ -347,26 +1241,266 @@ class GedcomParser:
         :rtype: list
         """
         children = []
-        for family in self.families:
-            if individual.get_xref() in family.get_parents():
-                for child in family.get_children():
-                    children.append(self.find_individual(child))
+        for family in self.__family_index.get_parent_families(individual.get_xref()):
+            for child in family.get_children():
+                children.append(self.find_individual(child))
         return children
 
-    def __find_root_element(self, collection: list, xref: str) -> GedcomElement:
+    def __iter_relatives(self, xref: str, max_generations: int, get_relatives) -> Iterator[tuple]:
+        """Walk the relatives of an individual breadth first, one generation at a time.
+
+        :param xref: The xref of the individual to start from.
+        :type xref: str
+        :param max_generations: The number of generations to walk, or None to walk them all.
+        :type max_generations: int
+        :param get_relatives: The function getting the xrefs of the next generation of an xref.
+        :type get_relatives: Callable
+        :return: A generator of (GedcomIndividual, generation) tuples.
+        :rtype: Iterator[tuple]
+        """
+        individuals = self.__xref_indexes["individuals"]
+        visited = {xref}
+        current = [xref]
+        generation = 0
+        while current and (max_generations is None or generation < max_generations):
+            generation += 1
+            following = []
+            for relative in (relative for xref in current for relative in get_relatives(xref)):
+                # An individual reached by several lines is only yielded at its closest generation.
+                if relative not in visited and relative in individuals:
+                    visited.add(relative)
+                    following.append(relative)
+                    yield individuals[relative], generation
+            current = following
+
+    def ancestors(self, xref: str, max_generations: int = None) -> Iterator[tuple]:
+        """Iterate over the ancestors of an individual, generation by generation.
+
+        Each ancestor is yielded once, at its closest generation, even if it is an ancestor through several lines.
+
+        :param xref: The xref of the individual.
+        :type xref: str
+        :param max_generations: The number of generations to go up, 1 being the parents. Default is None, going up
+            to the oldest ancestors.
+        :type max_generations: int, optional
+        :return: A generator of (GedcomIndividual, generation) tuples, the generation being 1 for the parents, 2 for
+            the grandparents, and so on.
+        :rtype: Iterator[tuple]
+        :raises KeyError: If the individual does not exist.
+        """
+        self.find_individual(xref)
+        return self.__iter_relatives(xref, max_generations, self.__family_index.get_parents)
+
+    def descendants(self, xref: str, max_generations: int = None) -> Iterator[tuple]:
+        """Iterate over the descendants of an individual, generation by generation.
+
+        Each descendant is yielded once, at its closest generation, even if it is a descendant through several lines.
+
+        :param xref: The xref of the individual.
+        :type xref: str
+        :param max_generations: The number of generations to go down, 1 being the children. Default is None, going
+            down to the youngest descendants.
+        :type max_generations: int, optional
+        :return: A generator of (GedcomIndividual, generation) tuples, the generation being 1 for the children, 2 for
+            the grandchildren, and so on.
+        :rtype: Iterator[tuple]
+        :raises KeyError: If the individual does not exist.
+        """
+        self.find_individual(xref)
+        return self.__iter_relatives(xref, max_generations, self.__family_index.get_children)
+
+    def __get_ancestors(self, xref: str) -> GedcomAncestors:
+        """Get the ancestors of an individual walked by the previous relationship queries, or start walking them.
+
+        The least recently used ancestors are dropped when there are too many, and all of them are dropped when the
+        families change.
+
+        :param xref: The xref of the individual.
+        :type xref: str
+        :return: The ancestors of the individual.
+        :rtype: GedcomAncestors
+        """
+        if self.__ancestors_version != self.__family_index.get_version():
+            self.__ancestors = {}
+            self.__ancestors_version = self.__family_index.get_version()
+        ancestors = self.__ancestors.pop(xref, None)
+        if ancestors is None:
+            ancestors = GedcomAncestors(xref)
+            if len(self.__ancestors) >= self.__ANCESTORS_CACHE_SIZE:
+                del self.__ancestors[next(iter(self.__ancestors))]
+        self.__ancestors[xref] = ancestors
+        return ancestors
+
+    def get_relationship(self, xref1: str, xref2: str) -> dict:
+        """Find how an individual is related by blood to another one, through their nearest common ancestors.
+
+        The ancestors of both individuals are walked one generation at a time, on the side with the fewest generations
+        walked, until no closer common ancestor can be found. The ancestors walked are kept for the next queries of
+        the same individuals, so that batches of queries sharing individuals only walk each generation once.
+
+        :param xref1: The xref of the individual.
+        :type xref1: str
+        :param xref2: The xref of the other individual.
+        :type xref2: str
+        :return: None if the individuals have no common ancestor, or a dictionary with:
+            - relationship: what the individual is to the other one, e.g. "father" or "3rd cousin twice removed".
+            - generations: the number of generations from each individual up to the common ancestors.
+            - common_ancestors: the nearest common ancestors, as GedcomIndividual objects.
+            - path: the GedcomIndividual objects from the individual up to a common ancestor and down to the other one.
+        :rtype: dict
+        :raises KeyError: If an individual does not exist.
+        """
+        individual = self.find_individual(xref1)
+        self.find_individual(xref2)
+        individuals = self.__xref_indexes["individuals"]
+        first = self.__get_ancestors(xref1)
+        second = self.__get_ancestors(xref2)
+        common = {xref for xref in first.get_xrefs() if second.get_generation(xref) is not None}
+        while True:
+            best = min((first.get_generation(xref) + second.get_generation(xref) for xref in common), default=None)
+            walking = [side for side in (first, second) if not side.is_complete()]
+            # An ancestor not reached yet by a side is more generations away than the generations walked on that side.
+            if not walking or (best is not None and best <= min(side.get_depth() for side in walking)):
+                break
+            side = min(walking, key=GedcomAncestors.get_depth)
+            other = second if side is first else first
+            reached = side.expand(self.__family_index.get_parents, individuals)
+            common.update(xref for xref in reached if other.get_generation(xref) is not None)
+        if best is None:
+            return None
+
+        def generations(xref: str) -> tuple:
+            return first.get_generation(xref), second.get_generation(xref)
+
+        # Of the common ancestors as near, prefer the ones of the same generation on both sides.
+        nearest = [xref for xref in first.get_xrefs() if xref in common and sum(generations(xref)) == best]
+        up, down = min((generations(xref) for xref in nearest), key=lambda pair: abs(pair[0] - pair[1]))
+        ancestors = [xref for xref in nearest if generations(xref) == (up, down)]
+        path = first.get_path(ancestors[0])[::-1] + second.get_path(ancestors[0])[1:]
+        return {
+            "relationship": get_relationship_name(up, down, individual.get_sex()),
+            "generations": (up, down),
+            "common_ancestors": [individuals[xref] for xref in ancestors],
+            "path": [individuals[xref] for xref in path],
+        }
+
+    def __get_name_index(self) -> GedcomNameIndex:
+        """Get the index of the individuals by name, built on first use and then kept up to date.
+
+        :return: The name index.
+        :rtype: GedcomNameIndex
+        """
+        if self.__name_index is None:
+            self.__name_index = GedcomNameIndex()
+            self.__name_index.add_individuals(self.__xref_indexes["individuals"].values())
+        return self.__name_index
+
+    def find_xrefs_by_name(self, query: str, limit: int = None) -> list:
+        """Find the individuals whose name has a word starting with each word of a query.
+
+        The case and the accents are ignored, so "jo mul" finds "Johann /Müller/". The index of the names is built
+        on the first search, then updated as individuals are added, removed or renamed.
+
+        :param query: The beginning of the words of the name.
+        :type query: str
+        :param limit: The maximum number of xrefs returned. Default is None, returning them all.
+        :type limit: int, optional
+        :return: The xrefs of the individuals found.
+        :rtype: list
+        """
+        return self.__get_name_index().search(query, limit)
+
+    def find_xrefs_by_surname_sound(self, surname: str, limit: int = None) -> list:
+        """Find the individuals whose surname sounds like a surname, such as "Maier" for "Meyer".
+
+        Surnames are compared by the Soundex key of each of their words.
+
+        :param surname: The surname.
+        :type surname: str
+        :param limit: The maximum number of xrefs returned. Default is None, returning them all.
+        :type limit: int, optional
+        :return: The xrefs of the individuals found.
+        :rtype: list
+        """
+        return self.__get_name_index().search_surname(surname, limit)
+
+    def __get_date_index(self, tag: str) -> tuple:
+        """Get the index of the records by the date of an event, built on first use.
+
+        :param tag: The tag of the event.
+        :type tag: str
+        :return: The sorted earliest keys of the dates, and the matching (earliest key, latest key, record) entries.
+        :rtype: tuple
+        """
+        if tag not in self.__date_indexes:
+            collection, get_event = self.__DATED_EVENTS[tag]
+            entries = []
+            for record in getattr(self, collection):
+                key_range = get_event(record).get_date().get_key_range()
+                if key_range is not None:
+                    entries.append((key_range[0], key_range[1], record))
+            entries.sort(key=lambda entry: entry[:2])
+            self.__date_indexes[tag] = ([entry[0] for entry in entries], entries)
+        return self.__date_indexes[tag]
+
+    def __get_date_key_range(self, date: str) -> tuple:
+        """Get the key range of a date given as a GEDCOM date value.
+
+        :param date: The date value, e.g. "1850" or "MAR 1850".
+        :type date: str
+        :return: The earliest and latest keys of the date.
+        :rtype: tuple
+        :raises ValueError: If the date cannot be parsed.
+        """
+        key_range = GedcomDate(0, "DATE", [], value=date).get_key_range()
+        if key_range is None:
+            raise ValueError("Invalid date " + date + ".")
+        return key_range
+
+    def find_by_event_date(self, tag: str, start: str = None, end: str = None) -> list:
+        """Find the records whose event date is certainly within a range, e.g. everyone born between 1820 and 1850.
+
+        The range includes the whole start and end dates, so ("1820", "1850") goes from 1 JAN 1820 to 31 DEC 1850. The
+        date of an event must fit entirely in the range, see GedcomDate.get_key_range: "BEF 1700" is before 1700 but
+        not between 1650 and 1700. Records without a parsable date are never returned.
+
+        The records are indexed by date on the first search, using binary search afterwards. The index is rebuilt after
+        records are added or removed, but not after dates are edited in place.
+
+        :param tag: The tag of the event: "BIRT", "DEAT" for individuals, or "MARR" for families.
+        :type tag: str
+        :param start: The first date of the range, as a GEDCOM date. Defaults to None, for no lower bound.
+        :type start: str, optional
+        :param end: The last date of the range, as a GEDCOM date. Defaults to None, for no upper bound.
+        :type end: str, optional
+        :return: The matching records, by date.
+        :rtype: list
+        :raises ValueError: If the tag is not supported or a date cannot be parsed.
+        """
+        if tag not in self.__DATED_EVENTS:
+            raise ValueError("Event " + tag + " is not supported.")
+        start_key = self.__get_date_key_range(start)[0] if start is not None else GedcomDate.MIN_KEY
+        end_key = self.__get_date_key_range(end)[1] if end is not None else GedcomDate.MAX_KEY
+        earliest_keys, entries = self.__get_date_index(tag)
+        first = bisect.bisect_left(earliest_keys, start_key)
+        last = bisect.bisect_right(earliest_keys, end_key)
+        return [record for earliest, latest, record in entries[first:last] if latest <= end_key]
+
+    def __find_root_element(self, collection: str, xref: str) -> GedcomElement:
         """Find an element in a collection by its xref.
 
-        :param collection: The collection to search in.
-        :type collection: list
+        :param collection: The name of the collection to search in.
+        :type collection: str
         :param xref: The xref to search for.
         :type xref: str
-        :return: The element if found, None otherwise.
+        :return: The element if found.
         :rtype: GedcomElement
+        :raises KeyError: If the element is not found.
         """
-        for element in collection:
-            if element.get_xref() == xref:
-                return element
-        raise KeyError("Element with xref " + xref + " not found.")
+        try:
+            return self.__xref_indexes[collection][xref]
+        except KeyError:
+            raise KeyError("Element with xref " + xref + " not found.")
 
     def find_individual(self, xref: str) -> GedcomIndividual:
         """Find an individual by its xref.
@@ -376,7 +1510,7 @@ class GedcomParser:
         :return: The individual if found, None otherwise.
         :rtype: GedcomIndividual
         """
-        return self.__find_root_element(self.individuals, xref)
+        return self.__find_root_element("individuals", xref)
 
     def find_family(self, xref: str) -> GedcomFamily:
         """Find a family by its xref.
@@ -386,7 +1520,7 @@ class GedcomParser:
         :return: The family if found, None otherwise.
         :rtype: GedcomFamily
         """
-        return self.__find_root_element(self.families, xref)
+        return self.__find_root_element("families", xref)
 
     def find_source(self, xref: str) -> GedcomSource:
         """Find a source by its xref.
@@ -396,7 +1530,7 @@ class GedcomParser:
         :return: The source if found, None otherwise.
         :rtype: GedcomSource
         """
-        return self.__find_root_element(self.sources, xref)
+        return self.__find_root_element("sources", xref)
 
     def find_object(self, xref: str) -> GedcomObject:
         """Find an object by its xref.
@@ -406,7 +1540,7 @@ class GedcomParser:
         :return: The object if found, None otherwise.
         :rtype: GedcomObject
         """
-        return self.__find_root_element(self.objects, xref)
+        return self.__find_root_element("objects", xref)
 
     def find_repository(self, xref: str) -> GedcomRepository:
         """Find a repository by its xref.
@@ -416,23 +1550,28 @@ class GedcomParser:
         :return: The repository if found, None otherwise.
         :rtype: GedcomRepository
         """
-        return self.__find_root_element(self.repositories, xref)
+        return self.__find_root_element("repositories", xref)
 
-    def __add_root_element(self, collection: list, element: GedcomRootElement):
+    def __add_root_element(self, collection: str, element: GedcomRootElement):
         """Add an element to a collection.
 
-        :param collection: The collection to add the element to.
-        :type collection: list
+        :param collection: The name of the collection to add the element to.
+        :type collection: str
         :param element: The element to add.
         :type element: GedcomRootElement
         :raises KeyError: If the element already exists.
         """
-        try:
-            self.__find_root_element(collection, element.get_xref())
-        except KeyError:
-            collection.append(element)
-        else:
+        index = self.__xref_indexes[collection]
+        if element.get_xref() in index:
             raise KeyError("Element with xref " + element.get_xref() + " already exists.")
+        getattr(self, collection).append(element)
+        index[element.get_xref()] = element
+        if collection == "individuals" and self.__name_index is not None:
+            self.__name_index.add_individual(element)
+        if self.stats is not None:
+            element.set_stats(self.stats)
+        self.__date_indexes = {}
+        self.__ancestors = {}
 
     def add_individual(self, individual: GedcomIndividual):
         """Add an individual to the collection.
@@ -445,7 +1584,7 @@ class GedcomParser:
         if not isinstance(individual, GedcomIndividual):
             raise TypeError("Individual must be of type GedcomIndividual.")
         try:
-            self.__add_root_element(self.individuals, individual)
+            self.__add_root_element("individuals", individual)
         except KeyError:
             raise KeyError("Individual with xref " + individual.get_xref() + " already exists.")
 
@@ -463,19 +1602,21 @@ class GedcomParser:
         :raises KeyError: If the family already exists.
         :raises TypeError: If the family is not of type GedcomFamily.
         """
-        if self.find_individual(family.get_husband()) is None:
+        if not isinstance(family, GedcomFamily):
+            raise TypeError("Family must be of type GedcomFamily.")
+        individuals = self.__xref_indexes["individuals"]
+        if family.get_husband() and family.get_husband() not in individuals:
             raise KeyError("Husband with xref " + family.get_husband() + " not found.")
-        if self.find_individual(family.get_wife()) is None:
+        if family.get_wife() and family.get_wife() not in individuals:
             raise KeyError("Wife with xref " + family.get_wife() + " not found.")
         for child in family.get_children():
-            if self.find_individual(child) is None:
+            if child not in individuals:
                 raise KeyError("Child with xref " + child + " not found.")
-        if not isinstance(family, GedcomFamily):
-            raise TypeError("Family must be of type GedcomFamily.")
         try:
-            self.__add_root_element(self.families, family)
+            self.__add_root_element("families", family)
         except KeyError:
             raise KeyError("Family with xref " + family.get_xref() + " already exists.")
+        self.__family_index.add_family(family)
 
     def add_source(self, source: GedcomSource):
         """Add a source to the collection.
@@ -488,10 +1629,9 @@ class GedcomParser:
         if not isinstance(source, GedcomSource):
             raise TypeError("Source must be of type GedcomSource.")
         try:
-            self.__add_root_element(self.sources, source)
+            self.__add_root_element("sources", source)
         except KeyError:
             raise KeyError("Source with xref " + source.get_xref() + " already exists.")
-        self.sources.append(source)
 
     def add_object(self, object: GedcomObject):
         """Add an object to the collection.
@@ -504,10 +1644,9 @@ class GedcomParser:
         if not isinstance(object, GedcomObject):
             raise TypeError("Object must be of type GedcomObject.")
         try:
-            self.__add_root_element(self.objects, object)
+            self.__add_root_element("objects", object)
         except KeyError:
             raise KeyError("Object with xref " + object.get_xref() + " already exists.")
-        self.objects.append(object)
 
     def add_repository(self, repository: GedcomRepository):
         """Add a repository to the collection.
@@ -520,24 +1659,95 @@ class GedcomParser:
         if not isinstance(repository, GedcomRepository):
             raise TypeError("Repository must be of type GedcomRepository.")
         try:
-            self.__add_root_element(self.repositories, repository)
+            self.__add_root_element("repositories", repository)
         except KeyError:
             raise KeyError("Repository with xref " + repository.get_xref() + " already exists.")
-        self.repositories.append(repository)
 
-    def __remove_root_element(self, collection: list, xref: str):
-        """Remove an element from a collection.
+    def add_many(self, elements):
+        """Add individuals, families, sources, objects and repositories at once.
 
-        :param collection: The collection to remove the element from.
-        :type collection: list
-        :param xref: The xref of the element to remove.
-        :type xref: str
-        :raises KeyError: If the element does not exist.
+        The whole batch is checked before anything is added: the xrefs must not exist yet nor be repeated in the batch,
+        and the parents and children of the families must be individuals of the collection or of the batch. Every check
+        is a lookup in a dictionary, so the time taken is proportional to the number of elements.
+
+        :param elements: The elements to add, in any order.
+        :type elements: Iterable[GedcomRootElement]
+        :raises TypeError: If an element is not of one of these types, in which case nothing is added.
+        :raises KeyError: If an xref already exists or a member of a family is not found, in which case nothing is
+            added.
+        """
+        batch = []
+        added = {collection: {} for _, collection, _ in self.__ADDABLE_ELEMENTS}
+        for element in elements:
+            for element_class, collection, name in self.__ADDABLE_ELEMENTS:
+                if isinstance(element, element_class):
+                    break
+            else:
+                raise TypeError(
+                    "Element must be of type GedcomIndividual, GedcomFamily, GedcomSource, GedcomObject or "
+                    "GedcomRepository."
+                )
+            xref = element.get_xref()
+            if xref in self.__xref_indexes[collection] or xref in added[collection]:
+                raise KeyError(name + " with xref " + xref + " already exists.")
+            added[collection][xref] = element
+            batch.append((collection, element))
+        individuals = self.__xref_indexes["individuals"]
+        for family in added["families"].values():
+            members = [("Husband", family.get_husband()), ("Wife", family.get_wife())]
+            members += [("Child", child) for child in family.get_children()]
+            for role, xref in members:
+                if xref and xref not in individuals and xref not in added["individuals"]:
+                    raise KeyError(role + " with xref " + xref + " not found.")
+        for collection, element in batch:
+            getattr(self, collection).append(element)
+            self.__xref_indexes[collection][element.get_xref()] = element
+            if collection == "families":
+                self.__family_index.add_family(element)
+            elif collection == "individuals" and self.__name_index is not None:
+                self.__name_index.add_individual(element)
+            if self.stats is not None:
+                element.set_stats(self.stats)
+        self.__date_indexes = {}
+        self.__ancestors = {}
+
+    def __remove_root_elements(self, collection: str, xrefs: set):
+        """Remove elements from a collection, rebuilding it once.
+
+        :param collection: The name of the collection to remove the elements from.
+        :type collection: str
+        :param xrefs: The xrefs of the elements to remove, which must exist.
+        :type xrefs: set
+        """
+        index = self.__xref_indexes[collection]
+        removed = {index.pop(xref) for xref in xrefs}
+        if collection == "individuals" and self.__name_index is not None:
+            for element in removed:
+                self.__name_index.remove_individual(element)
+        # Assigned in place, so that the lists returned by parse stay up to date.
+        elements = getattr(self, collection)
+        elements[:] = [element for element in elements if element not in removed]
+        self.__date_indexes = {}
+        self.__ancestors = {}
+
+    def __check_xrefs(self, collection: str, xrefs, name: str) -> set:
+        """Check that the elements of a collection exist.
+
+        :param collection: The name of the collection.
+        :type collection: str
+        :param xrefs: The xrefs of the elements.
+        :type xrefs: Iterable[str]
+        :param name: The name of the elements, for the error message.
+        :type name: str
+        :return: The set of the xrefs.
+        :rtype: set
+        :raises KeyError: If an element does not exist.
         """
-        element = self.__find_root_element(collection, xref)
-        if not element:
-            raise KeyError()
-        collection.remove(element)
+        xrefs = set(xrefs)
+        missing = sorted(xrefs - self.__xref_indexes[collection].keys())
+        if missing != []:
+            raise KeyError(name + " with xref " + missing[0] + " does not exist.")
+        return xrefs
 
     def remove_individual(self, xref: str):
         """Remove an individual from the collection and all mentions of it in families.
@@ -546,18 +1756,26 @@ class GedcomParser:
         :type xref: str
         :raises KeyError: If the individual does not exist.
         """
-        try:
-            individual = self.find_individual(xref)
-        except KeyError:
-            raise KeyError("Individual with xref " + xref + " does not exist.")
+        self.remove_individuals([xref])
 
-        xref = individual.get_xref()
+    def remove_individuals(self, xrefs):
+        """Remove individuals from the collection and all mentions of them in families.
 
-        for family in self.families:
-            family.remove_parent(xref)
-            family.remove_child(xref)
+        Each family of the individuals is updated once and the collection is rebuilt once, so removing many
+        individuals takes time proportional to the size of the collection.
 
-        self.__remove_root_element(self.individuals, xref)
+        :param xrefs: The xrefs of the individuals to remove.
+        :type xrefs: Iterable[str]
+        :raises KeyError: If an individual does not exist, in which case nothing is removed.
+        """
+        xrefs = self.__check_xrefs("individuals", xrefs, "Individual")
+        families = {}
+        for xref in xrefs:
+            families.update(dict.fromkeys(self.__family_index.get_parent_families(xref)))
+            families.update(dict.fromkeys(self.__family_index.get_child_families(xref)))
+        for family in families:
+            family.remove_members(xrefs)
+        self.__remove_root_elements("individuals", xrefs)
 
     def remove_family(self, xref: str):
         """Remove a family from the collection.
@@ -566,14 +1784,23 @@ class GedcomParser:
         :type xref: str
         :raises KeyError: If the family does not exist.
         """
-        try:
-            family = self.find_family(xref)
-        except KeyError:
-            raise KeyError("Family with xref " + xref + " does not exist.")
+        self.remove_families([xref])
 
-        xref = family.get_xref()
+    def remove_families(self, xrefs):
+        """Remove families from the collection and all mentions of them in individuals.
 
-        for individual in self.individuals:
-            individual.remove_family(xref)
+        The individuals are swept once, removing their links to any of the families, including the ones the families
+        do not list, and the collection is rebuilt once. Removing many families takes time proportional to the size of
+        the collections.
 
-        self.__remove_root_element(self.families, xref)
+        :param xrefs: The xrefs of the families to remove.
+        :type xrefs: Iterable[str]
+        :raises KeyError: If a family does not exist, in which case nothing is removed.
+        """
+        xrefs = self.__check_xrefs("families", xrefs, "Family")
+        families = self.__xref_indexes["families"]
+        for xref in xrefs:
+            self.__family_index.remove_family(families[xref])
+        for individual in self.individuals:
+            individual.remove_families(xrefs)
+        self.__remove_root_elements("families", xrefs)
@@ -0,0 +1,244 @@
+import bisect
+import re
+import unicodedata
+from functools import lru_cache
+
+from .elements.rootElements.individual import GedcomIndividual
+
+
+class GedcomNameIndex:
+    """Index of the individuals by the words of their names and the phonetic keys of their surnames.
+
+    Names are folded to lowercase without accents, so that "Müller" is found by "mul". The words are also kept sorted,
+    so that a prefix is found by a binary search. Each word of a surname is indexed by its Soundex key, so that
+    "Meyer" is found by "Maier". Individuals notify the index when their name changes.
+
+    :return: The name index.
+    :rtype: GedcomNameIndex
+    """
+
+    # The Soundex digits of the consonants, the other letters have none.
+    __SOUNDEX_DIGITS = {
+        letter: digit
+        for digit, letters in (("1", "bfpv"), ("2", "cgjkqsxz"), ("3", "dt"), ("4", "l"), ("5", "mn"), ("6", "r"))
+        for letter in letters
+    }
+
+    # The words of the names and of the queries.
+    __WORD = re.compile(r"\w+")
+
+    def __init__(self):
+        """Initialize an empty name index."""
+        self.__words = {}
+        self.__sorted_words = []
+        self.__sounds = {}
+        self.__entries = {}
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """Fold a text to lowercase without accents.
+
+        :param text: The text to fold.
+        :type text: str
+        :return: The folded text.
+        :rtype: str
+        """
+        if text.isascii():
+            return text.lower()
+        decomposed = unicodedata.normalize("NFKD", text)
+        return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def soundex(word: str) -> str:
+        """Get the Soundex key of a word: its first letter followed by three digits for the consonants that follow.
+
+        :param word: The word.
+        :type word: str
+        :return: The Soundex key, such as "R163" for "Robert", or "" if the word has no latin letter.
+        :rtype: str
+        """
+        letters = [letter for letter in GedcomNameIndex.fold(word) if "a" <= letter <= "z"]
+        if letters == []:
+            return ""
+        key = letters[0].upper()
+        digits = GedcomNameIndex.__SOUNDEX_DIGITS
+        previous = digits.get(letters[0], "")
+        for letter in letters[1:]:
+            digit = digits.get(letter, "")
+            if digit != "" and digit != previous:
+                key += digit
+                if len(key) == 4:
+                    break
+            # A vowel separates two consonants with the same digit, H and W do not.
+            if letter not in "hw":
+                previous = digit
+        return key.ljust(4, "0")
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def __split_name(name: str) -> tuple:
+        """Split a name in its distinct folded words.
+
+        :param name: The name.
+        :type name: str
+        :return: The words of the name.
+        :rtype: tuple
+        """
+        return tuple(dict.fromkeys(GedcomNameIndex.__WORD.findall(GedcomNameIndex.fold(name))))
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def __split_surname(surname: str) -> tuple:
+        """Split a surname in the distinct Soundex keys of its words.
+
+        :param surname: The surname.
+        :type surname: str
+        :return: The Soundex keys of the words of the surname.
+        :rtype: tuple
+        """
+        return tuple(dict.fromkeys(filter(None, map(GedcomNameIndex.soundex, GedcomNameIndex.__WORD.findall(surname)))))
+
+    def __unlink(self, index: dict, key: str, xref: str):
+        """Remove an xref from the xrefs of a key, removing the word from the sorted words if it has no xref left."""
+        xrefs = index[key]
+        xrefs.pop(xref, None)
+        if not xrefs:
+            del index[key]
+            if index is self.__words:
+                del self.__sorted_words[bisect.bisect_left(self.__sorted_words, key)]
+
+    def __index_individual(self, individual: GedcomIndividual) -> list:
+        """Index an individual by its current name, without adding its words to the sorted words.
+
+        :param individual: The individual to index.
+        :type individual: GedcomIndividual
+        :return: The words that were not in the index yet.
+        :rtype: list
+        """
+        xref = individual.get_xref()
+        # Names and surnames repeat a lot in a tree, their words are cached.
+        words = self.__split_name(individual.get_name())
+        sounds = self.__split_surname(individual.get_last_name())
+        # The words are also joined after a space each, so that a word starting with a prefix is found as " prefix".
+        self.__entries[xref] = (words, sounds, " " + " ".join(words))
+        new_words = []
+        for word in words:
+            xrefs = self.__words.get(word)
+            if xrefs is None:
+                self.__words[word] = {xref: None}
+                new_words.append(word)
+            else:
+                xrefs[xref] = None
+        for sound in sounds:
+            xrefs = self.__sounds.get(sound)
+            if xrefs is None:
+                self.__sounds[sound] = {xref: None}
+            else:
+                xrefs[xref] = None
+        individual.set_name_index(self)
+        return new_words
+
+    def add_individual(self, individual: GedcomIndividual):
+        """Index an individual by its current name.
+
+        :param individual: The individual to index.
+        :type individual: GedcomIndividual
+        """
+        for word in self.__index_individual(individual):
+            bisect.insort(self.__sorted_words, word)
+
+    def add_individuals(self, individuals):
+        """Index individuals by their current name, sorting the words once for all of them.
+
+        :param individuals: The individuals to index.
+        :type individuals: Iterable[GedcomIndividual]
+        """
+        for individual in individuals:
+            self.__index_individual(individual)
+        self.__sorted_words = sorted(self.__words)
+
+    def remove_individual(self, individual: GedcomIndividual):
+        """Remove an individual from the index. Nothing is done if the individual is not indexed.
+
+        :param individual: The individual to remove.
+        :type individual: GedcomIndividual
+        """
+        xref = individual.get_xref()
+        if xref not in self.__entries:
+            return
+        words, sounds, text = self.__entries.pop(xref)
+        for word in words:
+            self.__unlink(self.__words, word, xref)
+        for sound in sounds:
+            self.__unlink(self.__sounds, sound, xref)
+        individual.set_name_index(None)
+
+    def update_individual(self, individual: GedcomIndividual):
+        """Re-index an individual after its name changed.
+
+        :param individual: The individual to re-index.
+        :type individual: GedcomIndividual
+        """
+        self.remove_individual(individual)
+        self.add_individual(individual)
+
+    def __get_prefixed_range(self, prefix: str) -> range:
+        """Get the positions of the sorted words starting with a prefix."""
+        start = bisect.bisect_left(self.__sorted_words, prefix)
+        # No word starting with the prefix is greater than the prefix followed by the last character.
+        return range(start, bisect.bisect_right(self.__sorted_words, prefix + "\U0010ffff", start))
+
+    def __count_prefixed(self, prefix: str) -> int:
+        """Count the xrefs of the words starting with a prefix, an xref being counted once per word."""
+        return sum(len(self.__words[self.__sorted_words[position]]) for position in self.__get_prefixed_range(prefix))
+
+    def __iter_prefixed(self, prefix: str):
+        """Iterate over the xrefs of the words starting with a prefix, in the order of the words."""
+        for position in self.__get_prefixed_range(prefix):
+            yield from self.__words[self.__sorted_words[position]]
+
+    def search(self, query: str, limit: int = None) -> list:
+        """Find the individuals with a word of their name starting with each word of a query.
+
+        :param query: The beginning of the words, in any case and with or without accents, such as "jo dup".
+        :type query: str
+        :param limit: The maximum number of xrefs returned. Default is None, returning them all.
+        :type limit: int, optional
+        :return: The xrefs of the individuals found, in the order of their words.
+        :rtype: list
+        """
+        prefixes = self.__WORD.findall(self.fold(query))
+        if prefixes == []:
+            return []
+        # The individuals of the prefix with the fewest xrefs are filtered by the other prefixes.
+        prefixes.sort(key=self.__count_prefixed)
+        others = [" " + prefix for prefix in prefixes[1:]]
+        found = {}
+        for xref in self.__iter_prefixed(prefixes[0]):
+            if xref not in found and all(prefix in self.__entries[xref][2] for prefix in others):
+                found[xref] = None
+                if limit is not None and len(found) >= limit:
+                    break
+        return list(found)
+
+    def search_surname(self, surname: str, limit: int = None) -> list:
+        """Find the individuals with a surname that sounds like a surname, by comparing their Soundex keys.
+
+        :param surname: The surname, whose words must all sound like words of the surnames found.
+        :type surname: str
+        :param limit: The maximum number of xrefs returned. Default is None, returning them all.
+        :type limit: int, optional
+        :return: The xrefs of the individuals found.
+        :rtype: list
+        """
+        sounds = [sound for sound in map(self.soundex, self.__WORD.findall(surname)) if sound]
+        if sounds == []:
+            return []
+        found = []
+        for xref in self.__sounds.get(sounds[0], ()):
+            if all(sound in self.__entries[xref][1] for sound in sounds[1:]):
+                found.append(xref)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
@@ -0,0 +1,147 @@
+import time
+from contextlib import contextmanager
+
+
+class GedcomParseStats:
+    """Timings and counters of the work done by a GedcomParser, collected when it is given to the parser.
+
+    The wall time of each phase is accumulated in seconds, over every call:
+
+    - decode: reading and decoding the file.
+    - tokenize: splitting the lines into level, tag and value.
+    - build: building the trees of elements.
+    - index: storing the records in their collections and indexes.
+    - processes: parsing in worker processes, which are not instrumented.
+    - export: exporting with export or export_to.
+
+    Typed properties, such as dates and places, are computed on first access, so their time is part of the phase
+    accessing them. The dates and places parsed are counted for the records of the parser owning the stats.
+
+    :return: The parse stats.
+    :rtype: GedcomParseStats
+    """
+
+    def __init__(self):
+        """Initialize empty stats."""
+        self.__timings = {}
+        self.__lines = 0
+        self.__nodes = 0
+        self.__records = {}
+        self.__dates = 0
+        self.__places = 0
+
+    def add_time(self, phase: str, seconds: float):
+        """Add wall time to a phase.
+
+        :param phase: The name of the phase.
+        :type phase: str
+        :param seconds: The time to add, in seconds.
+        :type seconds: float
+        """
+        self.__timings[phase] = self.__timings.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str):
+        """Time the code run in a with block as part of a phase.
+
+        :param phase: The name of the phase.
+        :type phase: str
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.perf_counter() - start)
+
+    def count_lines(self, lines: int):
+        """Count tokenized lines.
+
+        :param lines: The number of lines.
+        :type lines: int
+        """
+        self.__lines += lines
+
+    def count_record(self, tag: str, nodes: int):
+        """Count a level 0 record and the elements built for it.
+
+        :param tag: The tag of the record.
+        :type tag: str
+        :param nodes: The number of elements of the record, including itself. 0 if it was not built.
+        :type nodes: int
+        """
+        self.__records[tag] = self.__records.get(tag, 0) + 1
+        self.__nodes += nodes
+
+    def count_event(self, event):
+        """Count the date and place of an event, if they are not empty.
+
+        :param event: The event whose date and place were parsed.
+        :type event: GedcomCommonEvent
+        """
+        if event.get_date().get_value():
+            self.__dates += 1
+        if event.get_place().get_value():
+            self.__places += 1
+
+    def get_timings(self) -> dict:
+        """Get the wall time of each phase.
+
+        :return: A dictionary of the time of each phase, in seconds.
+        :rtype: dict
+        """
+        return dict(self.__timings)
+
+    def get_lines(self) -> int:
+        """Get the number of tokenized lines.
+
+        :return: The number of lines.
+        :rtype: int
+        """
+        return self.__lines
+
+    def get_nodes(self) -> int:
+        """Get the number of elements built.
+
+        :return: The number of elements.
+        :rtype: int
+        """
+        return self.__nodes
+
+    def get_records(self) -> dict:
+        """Get the number of level 0 records by tag.
+
+        :return: A dictionary of the number of records of each tag.
+        :rtype: dict
+        """
+        return dict(self.__records)
+
+    def get_dates(self) -> int:
+        """Get the number of date values parsed.
+
+        :return: The number of dates.
+        :rtype: int
+        """
+        return self.__dates
+
+    def get_places(self) -> int:
+        """Get the number of places parsed.
+
+        :return: The number of places.
+        :rtype: int
+        """
+        return self.__places
+
+    def export(self) -> dict:
+        """Export the stats.
+
+        :return: The timings and counters.
+        :rtype: dict
+        """
+        return {
+            "timings": self.get_timings(),
+            "lines": self.get_lines(),
+            "nodes": self.get_nodes(),
+            "records": self.get_records(),
+            "dates": self.get_dates(),
+            "places": self.get_places(),
+        }
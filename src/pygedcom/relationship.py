@@ -0,0 +1,143 @@
+from typing import Callable
+
+
+class GedcomAncestors:
+    """The ancestors of an individual reached so far by a breadth-first walk, one generation at a time.
+
+    The walk is only expanded when a query needs more generations, so queries sharing an individual reuse its
+    ancestors. Each ancestor is kept with its generation and the relative it was reached from, to rebuild the path.
+
+    :param xref: The xref of the individual.
+    :type xref: str
+    :return: The ancestors of the individual.
+    :rtype: GedcomAncestors
+    """
+
+    def __init__(self, xref: str):
+        """Initialize the walk with the individual itself, at generation 0."""
+        self.__reached = {xref: (0, None)}
+        self.__frontier = [xref]
+        self.__depth = 0
+
+    def get_depth(self) -> int:
+        """Get the number of generations walked.
+
+        :return: The number of generations walked.
+        :rtype: int
+        """
+        return self.__depth
+
+    def is_complete(self) -> bool:
+        """Check if all the ancestors were reached.
+
+        :return: True if the last generation walked has no parents, False otherwise.
+        :rtype: bool
+        """
+        return not self.__frontier
+
+    def get_xrefs(self) -> list:
+        """Get the xrefs reached so far, generation by generation, starting with the individual.
+
+        :return: The xrefs reached.
+        :rtype: list
+        """
+        return list(self.__reached)
+
+    def get_generation(self, xref: str) -> int:
+        """Get the generation of an ancestor.
+
+        :param xref: The xref of the ancestor.
+        :type xref: str
+        :return: The generation of the ancestor, 0 for the individual, or None if it was not reached.
+        :rtype: int
+        """
+        reached = self.__reached.get(xref)
+        return reached[0] if reached is not None else None
+
+    def get_path(self, xref: str) -> list:
+        """Get the path from an ancestor down to the individual.
+
+        :param xref: The xref of a reached ancestor.
+        :type xref: str
+        :return: The xrefs from the ancestor to the individual.
+        :rtype: list
+        """
+        path = []
+        while xref is not None:
+            path.append(xref)
+            xref = self.__reached[xref][1]
+        return path
+
+    def expand(self, get_parents: Callable, individuals: dict) -> list:
+        """Walk one more generation.
+
+        :param get_parents: The function getting the xrefs of the parents of an xref.
+        :type get_parents: Callable
+        :param individuals: The individuals by xref, parents that are not individuals are ignored.
+        :type individuals: dict
+        :return: The xrefs reached in the new generation.
+        :rtype: list
+        """
+        self.__depth += 1
+        frontier = []
+        for xref in self.__frontier:
+            for parent in get_parents(xref):
+                if parent not in self.__reached and parent in individuals:
+                    self.__reached[parent] = (self.__depth, xref)
+                    frontier.append(parent)
+        self.__frontier = frontier
+        return frontier
+
+
+def _ordinal(number: int) -> str:
+    """Write a number as an ordinal: 1st, 2nd, 3rd, 4th..."""
+    if 10 <= number % 100 <= 20:
+        return str(number) + "th"
+    return str(number) + {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+
+
+def _times(number: int) -> str:
+    """Write a number of times: once, twice, 3 times..."""
+    return {1: "once", 2: "twice"}.get(number, str(number) + " times")
+
+
+def _greats(greats: int, name: str) -> str:
+    """Prefix a name with a number of greats: great-uncle, 2nd great-uncle..."""
+    if greats == 0:
+        return name
+    if greats == 1:
+        return "great-" + name
+    return _ordinal(greats) + " great-" + name
+
+
+def get_relationship_name(up: int, down: int, sex: str = "") -> str:
+    """Name the relationship of an individual to another one from the generations to their nearest common ancestor.
+
+    :param up: The number of generations from the individual up to the common ancestor.
+    :type up: int
+    :param down: The number of generations from the other individual up to the common ancestor.
+    :type down: int
+    :param sex: The sex of the individual, "M" or "F" for gendered names. Default is "", for neutral names.
+    :type sex: str, optional
+    :return: What the individual is to the other one, e.g. "grandfather" or "3rd cousin twice removed".
+    :rtype: str
+    """
+    index = {"M": 0, "F": 1}.get(sex, 2)
+    if up == 0 and down == 0:
+        return "self"
+    if up == 0:
+        name = ("father", "mother", "parent")[index]
+        return name if down == 1 else _greats(down - 2, "grand" + name)
+    if down == 0:
+        name = ("son", "daughter", "child")[index]
+        return name if up == 1 else _greats(up - 2, "grand" + name)
+    if up == 1 and down == 1:
+        return ("brother", "sister", "sibling")[index]
+    if up == 1:
+        return _greats(down - 2, ("uncle", "aunt", "uncle/aunt")[index])
+    if down == 1:
+        return _greats(up - 2, ("nephew", "niece", "nephew/niece")[index])
+    name = _ordinal(min(up, down) - 1) + " cousin"
+    if up != down:
+        name += " " + _times(abs(up - down)) + " removed"
+    return name
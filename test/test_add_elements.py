@@ -1,6 +1,9 @@
 import json
 
+import pytest
+
 from ..src.pygedcom.elements.rootElements.family import GedcomFamily
+from ..src.pygedcom.elements.rootElements.source import GedcomSource
 from ..src.pygedcom import gedcom_parser
 from ..src.pygedcom.elements.rootElements.individual import GedcomIndividual
 
@@ -50,3 +53,65 @@ def test_add_family():
     assert result["families"]["@F2@"]["husband"] == "@I1@"
     assert result["families"]["@F2@"]["wife"] == "@I2@"
     assert result["families"]["@F2@"]["children"] == []
+
+
+def test_add_duplicate_individual():
+    parser = gedcom_parser.GedcomParser("test/samples/00_simple_individual_record.ged")
+    parser.parse()
+    with pytest.raises(KeyError):
+        parser.add_individual(GedcomIndividual(0, "@I1@", "INDI", []))
+    assert len(parser.individuals) == 1
+
+
+def test_add_family_unknown_member():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    newFamily = GedcomFamily(0, "@F2@", "FAM", [])
+    newFamily.set_husband("@I1@")
+    newFamily.add_child("@I9@")
+    with pytest.raises(KeyError):
+        parser.add_family(newFamily)
+    assert len(parser.families) == 1
+
+
+def test_add_source():
+    parser = gedcom_parser.GedcomParser("test/samples/02_simple_source_record.ged")
+    parser.parse()
+    current_len = len(parser.sources)
+    newSource = GedcomSource(0, "@S9@", "SOUR", [])
+    parser.add_source(newSource)
+    assert len(parser.sources) == current_len + 1
+    assert parser.find_source("@S9@") is newSource
+
+
+def test_add_many():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    family = GedcomFamily(0, "@F2@", "FAM", [])
+    family.set_husband("@I3@")
+    family.set_children(["@I4@"])
+    child = GedcomIndividual(0, "@I4@", "INDI", [])
+    source = GedcomSource(0, "@S1@", "SOUR", [])
+    # The family comes before its child in the batch.
+    parser.add_many([family, child, source])
+    assert [individual.get_xref() for individual in parser.individuals] == ["@I1@", "@I2@", "@I3@", "@I4@"]
+    assert parser.find_family("@F2@") is family
+    assert parser.find_source("@S1@") is source
+    assert [individual.get_xref() for individual in parser.get_children(parser.find_individual("@I3@"))] == ["@I4@"]
+
+
+def test_add_many_is_all_or_nothing():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    family = GedcomFamily(0, "@F2@", "FAM", [])
+    family.set_wife("@I9@")
+    with pytest.raises(KeyError, match="Wife with xref @I9@ not found."):
+        parser.add_many([GedcomIndividual(0, "@I4@", "INDI", []), family])
+    with pytest.raises(KeyError, match="Individual with xref @I4@ already exists."):
+        parser.add_many([GedcomIndividual(0, "@I4@", "INDI", []), GedcomIndividual(0, "@I4@", "INDI", [])])
+    with pytest.raises(KeyError, match="Individual with xref @I1@ already exists."):
+        parser.add_many([GedcomIndividual(0, "@I1@", "INDI", [])])
+    with pytest.raises(TypeError):
+        parser.add_many([GedcomIndividual(0, "@I4@", "INDI", []), "@I5@"])
+    assert len(parser.individuals) == 3
+    assert len(parser.families) == 1
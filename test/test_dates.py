@@ -0,0 +1,50 @@
+import pytest
+
+from ..src.pygedcom import gedcom_parser
+from ..src.pygedcom.elements.subElements.date import GedcomDate
+
+
+def key_range(value):
+    return GedcomDate(2, "DATE", [], value).get_key_range()
+
+
+def test_date_key_range():
+    assert key_range("12 MAR 1825") == (18250312, 18250312)
+    assert key_range("MAR 1825") == (18250301, 18250331)
+    assert key_range("1825") == (18250101, 18251231)
+    assert key_range("ABT 1840") == (18350101, 18451231)
+    assert key_range("BEF 1700") == (GedcomDate.MIN_KEY, 17001231)
+    assert key_range("AFT 1650") == (16500101, GedcomDate.MAX_KEY)
+    assert key_range("BET 1849 AND 1851") == (18490101, 18511231)
+    assert key_range("FROM 1900 TO MAR 1910") == (19000101, 19100331)
+    assert key_range("") is None
+    assert key_range("UNKNOWN") is None
+
+
+def xrefs(records):
+    return [record.get_xref() for record in records]
+
+
+def test_find_by_event_date():
+    parser = gedcom_parser.GedcomParser("test/samples/07_event_dates.ged")
+    parser.parse()
+    assert xrefs(parser.find_by_event_date("BIRT", "1820", "1850")) == ["@I1@", "@I2@", "@I5@"]
+    assert xrefs(parser.find_by_event_date("BIRT", "1820", "1851")) == ["@I1@", "@I2@", "@I4@", "@I5@"]
+    assert xrefs(parser.find_by_event_date("BIRT", "1849", "1850")) == ["@I5@"]
+    assert xrefs(parser.find_by_event_date("BIRT", end="1700")) == ["@I3@"]
+    assert xrefs(parser.find_by_event_date("BIRT", start="1 JAN 1850")) == ["@I5@"]
+    assert xrefs(parser.find_by_event_date("DEAT", "1700", "1800")) == ["@I3@"]
+    assert xrefs(parser.find_by_event_date("MARR", end="1699")) == ["@F2@"]
+    assert xrefs(parser.find_by_event_date("MARR", start="1650")) == ["@F1@", "@F2@"]
+    with pytest.raises(ValueError):
+        parser.find_by_event_date("BURI")
+    with pytest.raises(ValueError):
+        parser.find_by_event_date("BIRT", start="someday")
+
+
+def test_find_by_event_date_after_changes():
+    parser = gedcom_parser.GedcomParser("test/samples/07_event_dates.ged")
+    parser.parse()
+    assert xrefs(parser.find_by_event_date("BIRT", "1850", "1850")) == ["@I5@"]
+    parser.remove_individual("@I5@")
+    assert parser.find_by_event_date("BIRT", "1850", "1850") == []
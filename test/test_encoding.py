@@ -0,0 +1,126 @@
+import builtins
+
+from ..src.pygedcom import gedcom_parser
+
+CONTENT = "0 HEAD\n1 CHAR {}\n0 @I1@ INDI\n1 NAME Zoé /Müller/\n0 TRLR\n"
+
+
+def write_sample(tmp_path, char, encoding, bom=b""):
+    path = tmp_path / "sample.ged"
+    path.write_bytes(bom + CONTENT.format(char).encode(encoding))
+    return str(path)
+
+
+def test_encoding_ansi(tmp_path):
+    parser = gedcom_parser.GedcomParser(write_sample(tmp_path, "ANSI", "cp1252"))
+    parser.parse()
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_encoding_utf8_bom(tmp_path):
+    parser = gedcom_parser.GedcomParser(write_sample(tmp_path, "UTF-8", "utf-8", bom=b"\xef\xbb\xbf"))
+    assert parser.verify()["status"] == "ok"
+    parser.parse()
+    assert parser.head is not None
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_encoding_utf16(tmp_path):
+    parser = gedcom_parser.GedcomParser(write_sample(tmp_path, "UNICODE", "utf-16"))
+    parser.parse()
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+    assert parser.isTRLR
+
+
+def test_encoding_wrong_declaration(tmp_path):
+    parser = gedcom_parser.GedcomParser(write_sample(tmp_path, "UTF-8", "latin1"))
+    parser.parse()
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_encoding_crlf(tmp_path):
+    path = tmp_path / "sample.ged"
+    path.write_bytes(CONTENT.format("UTF-8").replace("\n", "\r\n").encode("utf-8"))
+    parser = gedcom_parser.GedcomParser(str(path))
+    parser.parse()
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_verify_then_parse_detects_encoding_once(tmp_path, monkeypatch):
+    path = write_sample(tmp_path, "ANSI", "cp1252")
+    parser = gedcom_parser.GedcomParser(path)
+    opened = []
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return builtins.open(*args, **kwargs)
+
+    monkeypatch.setattr(gedcom_parser, "open", counting_open, raising=False)
+    assert parser.verify()["status"] == "ok"
+    parser.parse()
+    # The content read by verify is kept for parse.
+    assert len(opened) == 1
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+    # The encoding is detected again when the file changes.
+    write_sample(tmp_path, "UTF-8", "utf-8")
+    parser.parse()
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_verify_then_parse_streams_large_file(tmp_path, monkeypatch):
+    path = tmp_path / "sample.ged"
+    note = "0 @N1@ NOTE " + "é" * (5 << 20) + "\n"
+    path.write_bytes(CONTENT.format("UTF-8").replace("0 TRLR\n", note + "0 TRLR\n").encode("utf-8"))
+    parser = gedcom_parser.GedcomParser(str(path))
+    opened = []
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return builtins.open(*args, **kwargs)
+
+    monkeypatch.setattr(gedcom_parser, "open", counting_open, raising=False)
+    assert parser.verify()["status"] == "ok"
+    verify_opened = len(opened)
+    parser.parse()
+    # Files over 8 MiB are not kept by verify, parse reads them again.
+    assert len(opened) == verify_opened + 1
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_encoding_mmap(tmp_path):
+    for char, encoding in [("ANSI", "cp1252"), ("UNICODE", "utf-16"), ("UTF-8", "utf-8")]:
+        parser = gedcom_parser.GedcomParser(write_sample(tmp_path, char, encoding), use_mmap=True)
+        parser.parse()
+        assert parser.individuals[0].get_name() == "Zoé /Müller/"
+        assert parser.isTRLR
+
+
+def test_iter_records_wrong_declaration(tmp_path):
+    parser = gedcom_parser.GedcomParser(write_sample(tmp_path, "UTF-8", "latin1"))
+    individuals = [record for record in parser.iter_records() if record.get_tag() == "INDI"]
+    assert individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_encoding_mmap_wrong_declaration(tmp_path):
+    parser = gedcom_parser.GedcomParser(write_sample(tmp_path, "UTF-8", "latin1"), use_mmap=True)
+    parser.parse()
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+
+
+def test_encoding_mmap_cr(tmp_path):
+    path = tmp_path / "sample.ged"
+    path.write_bytes(CONTENT.format("UTF-8").replace("\n", "\r").encode("utf-8"))
+    parser = gedcom_parser.GedcomParser(str(path), use_mmap=True)
+    parser.parse()
+    assert parser.individuals[0].get_name() == "Zoé /Müller/"
+    assert parser.isTRLR
+
+
+def test_encoding_workers(tmp_path):
+    path = tmp_path / "cr.ged"
+    path.write_bytes(CONTENT.format("UTF-8").replace("\n", "\r").encode("utf-8"))
+    for sample in [write_sample(tmp_path, "UTF-8", "latin1"), str(path)]:
+        parser = gedcom_parser.GedcomParser(sample)
+        parser.parse(workers=2)
+        assert parser.individuals[0].get_name() == "Zoé /Müller/"
+        assert parser.isTRLR
@@ -1,4 +1,8 @@
+import io
 import json
+
+import pytest
+
 from ..src.pygedcom import gedcom_parser
 
 
@@ -124,3 +128,82 @@ def test_export_gedcom_20():
     result = parser.export(format="gedcom")
     with open("test/samples/20_complex_sample.ged") as f:
         assert result == f.read()
+
+
+def test_export_to_json_20(tmp_path):
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    parser.parse()
+    for empty_fields in [True, False]:
+        path = tmp_path / "export.json"
+        with open(path, "w", encoding="utf-8") as f:
+            parser.export_to(f, empty_fields=empty_fields)
+        assert path.read_text(encoding="utf-8") == parser.export(empty_fields=empty_fields)
+        assert "@I0001@" in json.loads(path.read_text(encoding="utf-8"))["individuals"]
+
+
+def test_export_to_json_layout():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    result = json.loads(parser.export())
+    assert parser.export() == json.dumps(result, indent=4, ensure_ascii=False)
+    result = json.loads(parser.export(empty_fields=False))
+    assert parser.export(empty_fields=False) == json.dumps(result, indent=4, ensure_ascii=False)
+    assert "head" not in result
+    assert list(result) == ["individuals", "families"]
+
+
+def test_export_to_unsupported_format():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    with pytest.raises(ValueError):
+        parser.export_to(io.StringIO(), format="xml")
+
+
+def test_export_to_gedcom_20(tmp_path):
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    parser.parse()
+    path = tmp_path / "export.ged"
+    with open(path, "w", encoding="utf-8") as f:
+        parser.export_to(f, format="gedcom")
+    with open("test/samples/20_complex_sample.ged") as f:
+        assert path.read_text(encoding="utf-8") == f.read()
+
+
+def test_extract_gedcom_deeply_nested(tmp_path):
+    depth = 5000
+    path = tmp_path / "nested.ged"
+    path.write_text("0 @N1@ NOTE\n" + "".join(f"{level} CONT line {level}\n" for level in range(1, depth + 1)))
+    parser = gedcom_parser.GedcomParser(str(path))
+    parser.parse()
+    assert parser.export(format="gedcom") == path.read_text()
+
+
+def test_export_after_edit():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    parser.export()
+    parser.export(format="gedcom")
+    parser.find_individual("@I1@").set_first_name("Johnny")
+    parser.find_family("@F1@").find_sub_element("MARR")[0].find_sub_element("DATE")[0].set_value("02 FEB 1926")
+    assert "1 NAME Johnny /Travolta/\n" in parser.export(format="gedcom")
+    assert "2 DATE 02 FEB 1926\n" in parser.export(format="gedcom")
+    result = json.loads(parser.export())
+    assert result["individuals"]["@I1@"]["first_name"] == "Johnny"
+    assert result["individuals"]["@I2@"]["first_name"] == "Jane"
+    parser.find_family("@F1@").remove_child("@I3@")
+    assert "CHIL" not in parser.export(format="gedcom")
+    assert json.loads(parser.export())["families"]["@F1@"]["children"] == []
+
+
+def test_export_reuses_unchanged_records():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    parser.export(format="gedcom")
+    parser.find_individual("@I1@").set_sex("M")
+
+    def serialize(record):
+        return "changed\n"
+
+    assert parser.find_individual("@I1@").get_serialization("gedcom", serialize) == "changed\n"
+    unchanged = "0 @I2@ INDI\n1 NAME Jane /Travolta/\n"
+    assert parser.find_individual("@I2@").get_serialization("gedcom", serialize) == unchanged
@@ -0,0 +1,61 @@
+import pickle
+
+from ..src.pygedcom import gedcom_parser
+from ..src.pygedcom.elements.rootElements.individual import GedcomIndividual
+from ..src.pygedcom.name_index import GedcomNameIndex
+
+
+def test_soundex():
+    assert GedcomNameIndex.soundex("Robert") == "R163"
+    assert GedcomNameIndex.soundex("Rupert") == "R163"
+    assert GedcomNameIndex.soundex("Ashcraft") == "A261"
+    assert GedcomNameIndex.soundex("Tymczak") == "T522"
+    assert GedcomNameIndex.soundex("Pfister") == "P236"
+    assert GedcomNameIndex.soundex("Lee") == "L000"
+    assert GedcomNameIndex.soundex("Müller") == GedcomNameIndex.soundex("Muller")
+    assert GedcomNameIndex.soundex("42") == ""
+
+
+def test_find_xrefs_by_name():
+    parser = gedcom_parser.GedcomParser("test/samples/09_names.ged")
+    parser.parse()
+    assert parser.find_xrefs_by_name("jo") == ["@I1@", "@I3@", "@I2@"]
+    assert parser.find_xrefs_by_name("JOSE") == ["@I2@"]
+    assert parser.find_xrefs_by_name("mul") == ["@I1@"]
+    assert parser.find_xrefs_by_name("müll jo") == ["@I1@"]
+    assert parser.find_xrefs_by_name("marie mey") == ["@I2@"]
+    assert parser.find_xrefs_by_name("berg") == ["@I4@"]
+    assert parser.find_xrefs_by_name("jo", limit=2) == ["@I1@", "@I3@"]
+    assert parser.find_xrefs_by_name("jo zz") == []
+    assert parser.find_xrefs_by_name(" ") == []
+    assert parser.find_xrefs_by_name("pierre") == ["@I6@"]
+    assert parser.find_individual("@I6@").get_last_name() == ""
+
+
+def test_find_xrefs_by_surname_sound():
+    parser = gedcom_parser.GedcomParser("test/samples/09_names.ged")
+    parser.parse()
+    assert parser.find_xrefs_by_surname_sound("Meyer") == ["@I2@", "@I3@"]
+    assert parser.find_xrefs_by_surname_sound("Muller") == ["@I1@"]
+    assert parser.find_xrefs_by_surname_sound("Bergh") == ["@I4@"]
+    assert parser.find_xrefs_by_surname_sound("Smith") == []
+
+
+def test_name_index_follows_changes():
+    parser = gedcom_parser.GedcomParser("test/samples/09_names.ged")
+    parser.parse()
+    assert parser.find_xrefs_by_name("jo") == ["@I1@", "@I3@", "@I2@"]
+    parser.find_individual("@I1@").set_first_name("Hans")
+    parser.find_individual("@I3@").set_last_name("Schmidt")
+    assert parser.find_xrefs_by_name("jo") == ["@I3@", "@I2@"]
+    assert parser.find_xrefs_by_name("hans") == ["@I1@"]
+    assert parser.find_xrefs_by_surname_sound("Smith") == ["@I3@"]
+    assert parser.find_xrefs_by_surname_sound("Meyer") == ["@I2@"]
+    individual = GedcomIndividual(0, "@I7@", "INDI", [])
+    individual.set_first_name("Joe")
+    parser.add_individual(individual)
+    parser.remove_individual("@I2@")
+    assert parser.find_xrefs_by_name("jo") == ["@I7@", "@I3@"]
+    removed = pickle.loads(pickle.dumps(parser.find_individual("@I3@")))
+    removed.set_first_name("Zoe")
+    assert parser.find_xrefs_by_name("zoe") == []
@@ -1,4 +1,9 @@
 from ..src.pygedcom import gedcom_parser
+from ..src.pygedcom.parse_stats import GedcomParseStats
+from ..src.pygedcom.elements.element import GedcomElement
+from ..src.pygedcom.elements.rootElements.individual import GedcomIndividual
+from ..src.pygedcom.elements.subElements.commonEvent import GedcomCommonEvent
+from ..src.pygedcom.elements.subElements.date import GedcomDate
 
 
 def test_parse_00():
@@ -24,3 +29,162 @@ def test_parse_04():
     assert str(result["individuals"][0].get_death().get_date()) == "15 MAR 2043"
     assert str(result["individuals"][1].get_birth().get_date()) == "MAR 2025"
     assert str(result["individuals"][1].get_death().get_date()) == "MAR 2075"
+
+
+def test_parse_nested_sub_elements():
+    parser = gedcom_parser.GedcomParser("test/samples/05_all_date_modifiers.ged")
+    parser.parse()
+    sour = parser.head.find_sub_element("SOUR")[0]
+    assert sour.get_value() == "SomeSoftware"
+    assert sour.find_sub_element("VERS")[0].find_sub_element("CORP")[0].get_value() == "SomeCompany"
+    assert parser.head.find_sub_element("DATE")[0].find_sub_element("TIME")[0].get_value() == "08:00:00"
+    assert [element.get_tag() for element in parser.head.get_sub_elements()] == ["SOUR", "DATE"]
+
+
+def test_parse_sub_elements_from_lines():
+    individual = GedcomIndividual(
+        0, "@I1@", "INDI", ["1 NAME John /Doe/", "1 BIRT", "2 DATE 1900", "3 TIME 12:00", "1 SEX M"]
+    )
+    assert [element.get_tag() for element in individual.get_sub_elements()] == ["NAME", "BIRT", "SEX"]
+    assert individual.get_birth().get_date().find_sub_element("TIME")[0].get_value() == "12:00"
+    assert individual.get_sex() == "M"
+
+
+def test_iter_records_20():
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    records = list(parser.iter_records())
+    assert parser.get_stats()["individuals"] == 0
+    result = parser.parse()
+    collections = ["submitters", "individuals", "families", "objects", "notes", "repositories", "sources"]
+    assert [type(record) for record in records[1:]] == [type(record) for key in collections for record in result[key]]
+    assert type(records[0]) is type(result["head"])
+    assert [record.get_xref() for record in records if isinstance(record, GedcomIndividual)] == [
+        individual.get_xref() for individual in result["individuals"]
+    ]
+    assert records[1].extract_gedcom() == result["submitters"][0].extract_gedcom()
+
+
+def test_parse_mmap():
+    for sample in [
+        "00_simple_individual_record",
+        "01_simple_family_record",
+        "05_all_date_modifiers",
+        "20_complex_sample",
+    ]:
+        parser = gedcom_parser.GedcomParser(f"test/samples/{sample}.ged")
+        parser.parse()
+        mapped_parser = gedcom_parser.GedcomParser(f"test/samples/{sample}.ged", use_mmap=True)
+        mapped_parser.parse()
+        assert mapped_parser.get_stats() == parser.get_stats()
+        assert mapped_parser.export(format="gedcom") == parser.export(format="gedcom")
+        assert mapped_parser.export() == parser.export()
+
+
+def test_parse_mmap_lazy_values():
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged", use_mmap=True)
+    parser.parse()
+    expected = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    expected.parse()
+    address = parser.submitters[0].find_sub_element("ADDR")[0]
+    # A value is decoded on first access, then the decoded string is kept.
+    assert address.get_value() == "123 Main St."
+    assert address.get_value() is address.get_value()
+    assert parser.export() == expected.export()
+    assert parser.export(format="gedcom") == expected.export(format="gedcom")
+
+
+def test_parse_slotted_elements():
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    parser.parse()
+    john = parser.individuals[0]
+    assert not hasattr(john, "__dict__")
+    assert not hasattr(john.find_sub_element("NAME")[0], "__dict__")
+    birth = john.get_birth()
+    assert john.find_sub_element("BIRT")[0] is birth
+    assert john.get_birth().find_sub_element("DATE")[0] is john.get_birth().get_date()
+    assert john.find_sub_element("NAME")[0].get_sub_elements() == []
+    john.find_sub_element("NAME")[0].get_sub_elements().append(GedcomElement(2, "GIVN", [], "John"))
+    assert john.find_sub_element("NAME")[0].find_sub_element("GIVN")[0].get_value() == "John"
+    assert "2 GIVN John\n" in parser.export(format="gedcom")
+
+
+def test_parse_lazy_properties():
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    parser.parse()
+    parser.get_stats()
+    john = parser.individuals[0]
+    birth = john.find_sub_element("BIRT")[0]
+    assert type(birth) is GedcomCommonEvent
+    assert john.get_birth() is birth
+    assert str(john.get_birth().get_date()) == "1 JAN 1900"
+
+
+def test_typed_sub_elements_before_getters():
+    parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
+    parser.parse()
+    john = parser.individuals[0]
+    birth = john.find_sub_element("BIRT")[0]
+    assert str(birth.find_sub_element("DATE")[0]) == "1 JAN 1900"
+    assert birth.export()["date"] == {"day": "1", "month": "JAN", "year": "1900"}
+    assert "1 JAN 1900" in str(john.get_sub_elements())
+    john.add_sub_element(1, "DEAT", ["2 DATE 1990"])
+    assert str(john.find_sub_element("DEAT")[0]) == "1990 "
+    assert john.get_death().get_date().get_key_range() == (19900101, 19901231)
+
+
+def test_parse_workers():
+    for sample in ["01_simple_family_record", "05_all_date_modifiers", "20_complex_sample"]:
+        parser = gedcom_parser.GedcomParser(f"test/samples/{sample}.ged")
+        parser.parse()
+        parallel_parser = gedcom_parser.GedcomParser(f"test/samples/{sample}.ged")
+        parallel_parser.parse(workers=3)
+        assert parallel_parser.get_stats() == parser.get_stats()
+        assert parallel_parser.isTRLR == parser.isTRLR
+        assert parallel_parser.export(format="gedcom") == parser.export(format="gedcom")
+        assert parallel_parser.find_individual(parser.individuals[-1].get_xref()).get_name() != ""
+
+
+def test_iter_records_range():
+    path = "test/samples/20_complex_sample.ged"
+    with open(path, "rb") as file:
+        content = file.read()
+    middle = content.index(b"\n0 @F0001@ FAM") + 1
+    parser = gedcom_parser.GedcomParser(path)
+    first = list(parser.iter_records(0, middle))
+    second = list(parser.iter_records(middle))
+    assert [record.get_xref() for record in first + second] == [record.get_xref() for record in parser.iter_records()]
+    assert second[0].get_xref() == "@F0001@"
+
+
+def test_parse_date_qualifiers():
+    assert GedcomDate(2, "DATE", [], "ABT 1850").export() == {"day": "", "month": "", "tag": "ABT", "year": "1850"}
+    assert GedcomDate(2, "DATE", [], "1 JAN 1900").export() == {"day": "1", "month": "JAN", "year": "1900"}
+    assert GedcomDate(2, "DATE", [], "INT MAR 1900 (as written)").export()["month"] == "MAR"
+    assert GedcomDate(2, "DATE", [], "ABT 1850s").export() == {"day": "", "month": "", "tag": "ABT", "year": ""}
+    between = GedcomDate(2, "DATE", [], "BET 15 MAR 2060 AND 2070").export()
+    assert (between["tag"], between["day"], between["year"], between["year1"]) == ("BET", "15", "2060", "2070")
+    period = GedcomDate(2, "DATE", [], "FROM 1900 TO MAR 1910").export()
+    assert (period["tag"], period["year"], period["month1"], period["year1"]) == ("FROM", "1900", "MAR", "1910")
+    assert "year1" not in GedcomDate(2, "DATE", [], "ABT 1900 AND 1910").export()
+
+
+def test_parse_stats():
+    stats = GedcomParseStats()
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged", stats=stats)
+    parser.parse()
+    assert stats.get_lines() == 12
+    assert stats.get_nodes() == 12
+    assert stats.get_records() == {"INDI": 3, "FAM": 1}
+    assert set(stats.get_timings()) == {"decode", "tokenize", "build", "index"}
+    parser.export()
+    assert "export" in stats.get_timings()
+    assert stats.get_dates() == 1
+    assert stats.get_places() == 0
+    assert stats.export()["records"] == {"INDI": 3, "FAM": 1}
+    # The dates and places parsed by another parser are not counted.
+    other_parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged", stats=GedcomParseStats())
+    other_parser.parse()
+    other_parser.export()
+    assert other_parser.stats.get_dates() > 0
+    assert stats.get_dates() == 1
+    assert stats.get_places() == 0
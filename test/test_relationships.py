@@ -0,0 +1,154 @@
+import pickle
+
+import pytest
+
+from ..src.pygedcom import gedcom_parser
+from ..src.pygedcom.relationship import get_relationship_name
+
+
+def xrefs(elements):
+    return [element.get_xref() for element in elements]
+
+
+def test_get_parents_and_children():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    assert xrefs(parser.get_parents(parser.find_individual("@I3@"))) == ["@I1@", "@I2@"]
+    assert xrefs(parser.get_children(parser.find_individual("@I1@"))) == ["@I3@"]
+    assert xrefs(parser.get_children(parser.find_individual("@I2@"))) == ["@I3@"]
+    assert parser.get_parents(parser.find_individual("@I1@")) == []
+    assert parser.get_children(parser.find_individual("@I3@")) == []
+
+
+def test_relationships_follow_family_changes():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    family = parser.find_family("@F1@")
+    family.remove_child("@I3@")
+    assert parser.get_parents(parser.find_individual("@I3@")) == []
+    assert parser.get_children(parser.find_individual("@I1@")) == []
+    family.add_child("@I3@")
+    family.set_husband("@I3@")
+    assert xrefs(parser.get_parents(parser.find_individual("@I3@"))) == ["@I3@", "@I2@"]
+    assert parser.get_children(parser.find_individual("@I1@")) == []
+
+
+def test_relationships_after_removal():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    parser.remove_individual("@I1@")
+    assert xrefs(parser.get_parents(parser.find_individual("@I3@"))) == ["@I2@"]
+    parser.remove_family("@F1@")
+    assert parser.get_parents(parser.find_individual("@I3@")) == []
+    assert parser.get_children(parser.find_individual("@I2@")) == []
+    assert parser.find_individual("@I3@").find_sub_element("FAMC") == []
+
+
+def test_relationships_of_added_family():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    family = pickle.loads(pickle.dumps(parser.find_family("@F1@")))
+    parser.remove_family("@F1@")
+    parser.add_family(family)
+    assert xrefs(parser.get_parents(parser.find_individual("@I3@"))) == ["@I1@", "@I2@"]
+
+
+# Cousins @I5@ and @I6@ share the grandparents @I1@ and @I2@, and their child @I7@ has them twice as ancestors.
+def generations(relatives):
+    return [(individual.get_xref(), generation) for individual, generation in relatives]
+
+
+def test_ancestors():
+    parser = gedcom_parser.GedcomParser("test/samples/08_pedigree.ged")
+    parser.parse()
+    assert generations(parser.ancestors("@I7@")) == [
+        ("@I5@", 1),
+        ("@I6@", 1),
+        ("@I3@", 2),
+        ("@I4@", 2),
+        ("@I1@", 3),
+        ("@I2@", 3),
+    ]
+    assert generations(parser.ancestors("@I7@", max_generations=2)) == [
+        ("@I5@", 1),
+        ("@I6@", 1),
+        ("@I3@", 2),
+        ("@I4@", 2),
+    ]
+    assert generations(parser.ancestors("@I1@")) == []
+
+
+def test_descendants():
+    parser = gedcom_parser.GedcomParser("test/samples/08_pedigree.ged")
+    parser.parse()
+    assert generations(parser.descendants("@I1@")) == [
+        ("@I3@", 1),
+        ("@I4@", 1),
+        ("@I5@", 2),
+        ("@I6@", 2),
+        ("@I7@", 3),
+    ]
+    assert generations(parser.descendants("@I1@", max_generations=1)) == [("@I3@", 1), ("@I4@", 1)]
+    assert generations(parser.descendants("@I7@")) == []
+
+
+def test_traversal_follows_family_changes():
+    parser = gedcom_parser.GedcomParser("test/samples/08_pedigree.ged")
+    parser.parse()
+    parser.find_family("@F2@").remove_child("@I5@")
+    assert generations(parser.ancestors("@I7@")) == [("@I5@", 1), ("@I6@", 1), ("@I4@", 2), ("@I1@", 3), ("@I2@", 3)]
+
+
+def test_traversal_unknown_individual():
+    parser = gedcom_parser.GedcomParser("test/samples/08_pedigree.ged")
+    parser.parse()
+    with pytest.raises(KeyError):
+        parser.ancestors("@I99@")
+
+
+def relationship(parser, xref1, xref2):
+    result = parser.get_relationship(xref1, xref2)
+    return result["relationship"], result["generations"], xrefs(result["common_ancestors"])
+
+
+def test_get_relationship():
+    parser = gedcom_parser.GedcomParser("test/samples/08_pedigree.ged")
+    parser.parse()
+    assert relationship(parser, "@I5@", "@I6@") == ("1st cousin", (2, 2), ["@I1@", "@I2@"])
+    assert relationship(parser, "@I3@", "@I4@") == ("brother", (1, 1), ["@I1@", "@I2@"])
+    assert relationship(parser, "@I3@", "@I6@") == ("uncle", (1, 2), ["@I1@", "@I2@"])
+    assert relationship(parser, "@I6@", "@I3@") == ("nephew/niece", (2, 1), ["@I1@", "@I2@"])
+    assert relationship(parser, "@I7@", "@I1@") == ("great-grandchild", (3, 0), ["@I1@"])
+    assert relationship(parser, "@I3@", "@I7@") == ("grandfather", (0, 2), ["@I3@"])
+    assert relationship(parser, "@I7@", "@I7@") == ("self", (0, 0), ["@I7@"])
+    path = parser.get_relationship("@I5@", "@I6@")["path"]
+    assert xrefs(path) == ["@I5@", "@I3@", "@I1@", "@I4@", "@I6@"]
+
+
+def test_get_relationship_unrelated():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    assert parser.get_relationship("@I1@", "@I2@") is None
+    assert parser.get_relationship("@I1@", "@I3@")["relationship"] == "parent"
+    with pytest.raises(KeyError):
+        parser.get_relationship("@I1@", "@I99@")
+
+
+def test_get_relationship_follows_family_changes():
+    parser = gedcom_parser.GedcomParser("test/samples/08_pedigree.ged")
+    parser.parse()
+    assert relationship(parser, "@I5@", "@I6@")[0] == "1st cousin"
+    parser.find_family("@F2@").remove_child("@I5@")
+    assert parser.get_relationship("@I5@", "@I6@") is None
+    assert relationship(parser, "@I7@", "@I6@")[0] == "child"
+    parser.remove_individual("@I6@")
+    assert parser.get_relationship("@I7@", "@I4@") is None
+
+
+def test_get_relationship_name():
+    assert get_relationship_name(0, 5, "M") == "3rd great-grandfather"
+    assert get_relationship_name(1, 3, "F") == "great-aunt"
+    assert get_relationship_name(3, 1, "M") == "great-nephew"
+    assert get_relationship_name(4, 6) == "3rd cousin twice removed"
+    assert get_relationship_name(13, 12) == "11th cousin once removed"
+    assert get_relationship_name(5, 2) == "1st cousin 3 times removed"
@@ -1,4 +1,7 @@
 import json
+
+import pytest
+
 from ..src.pygedcom import gedcom_parser
 
 
@@ -17,6 +20,8 @@ def test_remove_individual():
     assert result["families"]["@F1@"]["marriage"]["date"]["year"] == "1925"
 
     parser.remove_individual("@I1@")
+    with pytest.raises(KeyError):
+        parser.find_individual("@I1@")
     result = json.loads(parser.export())
     assert len(result["individuals"]) == current_len - 1
     assert result["individuals"]["@I2@"]["name"] == "Jane /Travolta/"
@@ -52,3 +57,49 @@ def test_remove_family():
     assert result["individuals"]["@I1@"]["name"] == "John /Travolta/"
     assert result["individuals"]["@I2@"]["name"] == "Jane /Travolta/"
     assert result["families"] == {}
+
+
+def test_remove_individuals():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    individuals = parser.parse()["individuals"]
+    parser.remove_individuals({"@I1@", "@I3@"})
+    assert [individual.get_xref() for individual in individuals] == ["@I2@"]
+    with pytest.raises(KeyError):
+        parser.find_individual("@I3@")
+    family = parser.find_family("@F1@")
+    assert family.get_parents() == ["", "@I2@"]
+    assert family.get_children() == []
+    assert family.find_sub_element("HUSB") == []
+    assert family.find_sub_element("CHIL") == []
+    assert parser.get_children(parser.find_individual("@I2@")) == []
+    assert "@I1@" not in parser.export(format="gedcom")
+
+
+def test_remove_individuals_missing():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    with pytest.raises(KeyError, match="@I9@"):
+        parser.remove_individuals(["@I1@", "@I9@"])
+    assert len(parser.individuals) == 3
+    assert parser.find_family("@F1@").get_husband() == "@I1@"
+
+
+def test_remove_families():
+    parser = gedcom_parser.GedcomParser("test/samples/04_simple_date_formats.ged")
+    parser.parse()
+    families = [family.get_xref() for family in parser.families]
+    parser.remove_families(families)
+    assert parser.families == []
+    for individual in parser.individuals:
+        assert individual.find_sub_element("FAMS") == []
+    with pytest.raises(KeyError):
+        parser.remove_families(families[:1])
+
+
+def test_remove_family_unlisted_member():
+    parser = gedcom_parser.GedcomParser("test/samples/06_unlisted_family_member.ged")
+    parser.parse()
+    parser.remove_family("@F1@")
+    assert parser.find_individual("@I1@").find_sub_element("FAMS") == []
+    assert [element.get_value() for element in parser.find_individual("@I2@").find_sub_element("FAMS")] == ["@F2@"]
+    assert "@F1@" not in parser.export(format="gedcom")
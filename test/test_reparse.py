@@ -0,0 +1,70 @@
+from ..src.pygedcom import gedcom_parser
+
+SAMPLE = """0 HEAD
+1 CHAR UTF-8
+0 @I1@ INDI
+1 NAME John /Doe/
+0 @I2@ INDI
+1 NAME Jane /Doe/
+0 @I3@ INDI
+1 NAME Jim /Doe/
+0 @F1@ FAM
+1 HUSB @I1@
+1 WIFE @I2@
+1 CHIL @I3@
+0 TRLR
+"""
+
+
+def reparse_edited(tmp_path, old, new):
+    path = tmp_path / "tree.ged"
+    path.write_text(SAMPLE)
+    parser = gedcom_parser.GedcomParser(str(path))
+    elements = parser.reparse()
+    previous = {individual.get_xref(): individual for individual in parser.individuals}
+    path.write_text(SAMPLE.replace(old, new))
+    assert parser.reparse() == elements
+    expected = gedcom_parser.GedcomParser(str(path))
+    expected.parse()
+    assert parser.export(format="gedcom") == expected.export(format="gedcom")
+    assert parser.export() == expected.export()
+    return parser, previous
+
+
+def test_reparse_unchanged(tmp_path):
+    parser, previous = reparse_edited(tmp_path, "", "")
+    assert [individual.get_xref() for individual in parser.individuals] == ["@I1@", "@I2@", "@I3@"]
+    assert all(individual is previous[individual.get_xref()] for individual in parser.individuals)
+    assert parser.isTRLR
+
+
+def test_reparse_changed_record(tmp_path):
+    parser, previous = reparse_edited(tmp_path, "Jane /Doe/", "Janet /Doe/")
+    assert parser.find_individual("@I2@") is not previous["@I2@"]
+    assert parser.find_individual("@I2@").get_first_name() == "Janet"
+    assert parser.find_individual("@I1@") is previous["@I1@"]
+    assert [parent.get_xref() for parent in parser.get_parents(parser.find_individual("@I3@"))] == ["@I1@", "@I2@"]
+
+
+def test_reparse_added_record(tmp_path):
+    parser, previous = reparse_edited(tmp_path, "0 @F1@ FAM\n", "0 @I4@ INDI\n1 NAME Joe /Doe/\n0 @F1@ FAM\n")
+    assert [individual.get_xref() for individual in parser.individuals] == ["@I1@", "@I2@", "@I3@", "@I4@"]
+    assert parser.find_individual("@I4@").get_name() == "Joe /Doe/"
+
+
+def test_reparse_removed_record(tmp_path):
+    parser, previous = reparse_edited(tmp_path, "1 CHIL @I3@\n", "")
+    assert parser.find_individual("@I3@") is previous["@I3@"]
+    assert parser.get_parents(parser.find_individual("@I3@")) == []
+    assert parser.get_children(parser.find_individual("@I1@")) == []
+
+
+def test_reparse_removed_trailer(tmp_path):
+    parser, previous = reparse_edited(tmp_path, "0 TRLR\n", "")
+    assert not parser.isTRLR
+
+
+def test_reparse_duplicate_xref(tmp_path):
+    parser, previous = reparse_edited(tmp_path, "0 @I3@ INDI\n1 NAME Jim", "0 @I1@ INDI\n1 NAME Jim")
+    assert parser.find_individual("@I1@") is previous["@I1@"]
+    assert len(parser.individuals) == 3
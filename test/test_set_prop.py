@@ -20,3 +20,32 @@ def test_set_individual_sex():
     assert parser.individuals[0].get_sex() == "M"
     parser.individuals[0].set_sex("F")
     assert parser.individuals[0].get_sex() == "F"
+
+
+def test_set_individual_last_name_before_access():
+    parser = gedcom_parser.GedcomParser("test/samples/00_simple_individual_record.ged")
+    parser.parse()
+    parser.individuals[0].set_last_name("Smith")
+    assert parser.individuals[0].get_name() == "John /Smith/"
+    assert parser.individuals[0].get_first_name() == "John"
+    assert parser.individuals[0].find_sub_element("NAME")[0].get_value() == "John /Smith/"
+
+
+def test_family_remove_child_before_access():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    parser.families[0].remove_child("@I3@")
+    parser.families[0].remove_parent("@I1@")
+    assert parser.families[0].get_children() == []
+    assert parser.families[0].get_parents() == ["", "@I2@"]
+
+
+def test_sub_element_reference_kept_after_getter():
+    parser = gedcom_parser.GedcomParser("test/samples/01_simple_family_record.ged")
+    parser.parse()
+    family = parser.families[0]
+    date = family.find_sub_element("MARR")[0].find_sub_element("DATE")[0]
+    parser.export()
+    assert family.get_marriage().get_date() is date
+    date.set_value("02 FEB 1926")
+    assert "2 DATE 02 FEB 1926\n" in parser.export("gedcom")
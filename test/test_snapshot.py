@@ -0,0 +1,116 @@
+import os
+import shutil
+
+from ..src.pygedcom import gedcom_parser
+
+
+def copy_sample(tmp_path, name="20_complex_sample.ged"):
+    path = tmp_path / name
+    shutil.copy(os.path.join("test/samples", name), path)
+    return str(path)
+
+
+def parser_parents(parser, xref):
+    return [parent.get_xref() for parent in parser.get_parents(parser.find_individual(xref))]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = copy_sample(tmp_path)
+    parser = gedcom_parser.GedcomParser(path)
+    parser.parse()
+    assert parser.save_snapshot() == path + ".snapshot"
+    loaded = gedcom_parser.GedcomParser(path)
+    assert loaded.load_snapshot()
+    assert loaded.export() == parser.export()
+    assert loaded.export(format="gedcom") == parser.export(format="gedcom")
+    assert loaded.isTRLR == parser.isTRLR
+    child = loaded.find_individual(loaded.families[0].get_children()[0])
+    assert parser_parents(loaded, child.get_xref()) == parser_parents(parser, child.get_xref()) != []
+
+
+def test_snapshot_round_trip_samples(tmp_path):
+    for name in sorted(os.listdir("test/samples")):
+        path = copy_sample(tmp_path, name)
+        parser = gedcom_parser.GedcomParser(path)
+        parser.parse()
+        parser.save_snapshot()
+        loaded = gedcom_parser.GedcomParser(path)
+        assert loaded.load_snapshot()
+        assert [individual.get_name() for individual in loaded.individuals] == [
+            individual.get_name() for individual in parser.individuals
+        ]
+        assert loaded.export(format="gedcom") == parser.export(format="gedcom")
+        assert loaded.export() == parser.export()
+
+
+def test_snapshot_missing(tmp_path):
+    parser = gedcom_parser.GedcomParser(copy_sample(tmp_path))
+    assert not parser.load_snapshot()
+    assert parser.individuals == []
+
+
+def test_snapshot_stale(tmp_path):
+    path = copy_sample(tmp_path)
+    parser = gedcom_parser.GedcomParser(path)
+    parser.parse()
+    parser.save_snapshot()
+    with open(path, "r+b") as file:
+        content = file.read().replace(b"Software", b"SOFTWARE")
+        file.seek(0)
+        file.write(content)
+    os.utime(path, ns=(0, 0))
+    assert not gedcom_parser.GedcomParser(path).load_snapshot()
+
+
+def test_snapshot_touched(tmp_path):
+    path = copy_sample(tmp_path)
+    parser = gedcom_parser.GedcomParser(path)
+    parser.parse()
+    parser.save_snapshot()
+    os.utime(path, ns=(0, 0))
+    assert gedcom_parser.GedcomParser(path).load_snapshot()
+
+
+def test_snapshot_corrupted(tmp_path):
+    path = copy_sample(tmp_path)
+    parser = gedcom_parser.GedcomParser(path)
+    parser.parse()
+    snapshot = parser.save_snapshot()
+    with open(snapshot, "r+b") as file:
+        file.truncate(os.path.getsize(snapshot) // 2)
+    assert not gedcom_parser.GedcomParser(path).load_snapshot()
+
+
+def test_snapshot_cache_dir(tmp_path):
+    path = copy_sample(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    parser = gedcom_parser.GedcomParser(path)
+    parser.parse()
+    snapshot = parser.save_snapshot(cache_dir)
+    assert os.path.dirname(snapshot) == cache_dir
+    assert not os.path.exists(path + ".snapshot")
+    assert not gedcom_parser.GedcomParser(path).load_snapshot()
+    assert gedcom_parser.GedcomParser(path).load_snapshot(cache_dir)
+
+
+def test_parse_cached(tmp_path):
+    path = copy_sample(tmp_path)
+    parser = gedcom_parser.GedcomParser(path)
+    elements = parser.parse_cached()
+    assert os.path.exists(path + ".snapshot")
+    cached = gedcom_parser.GedcomParser(path)
+    assert cached.parse_cached()["individuals"][0].get_xref() == elements["individuals"][0].get_xref()
+    assert cached.export() == parser.export()
+
+
+def test_snapshot_edit_loaded(tmp_path):
+    path = copy_sample(tmp_path, "00_simple_individual_record.ged")
+    parser = gedcom_parser.GedcomParser(path)
+    parser.parse()
+    parser.save_snapshot()
+    loaded = gedcom_parser.GedcomParser(path)
+    loaded.load_snapshot()
+    individual = loaded.find_individual("@I1@")
+    individual.set_first_name("Jane")
+    assert individual.get_first_name() == "Jane"
+    assert "Jane /Doe/" in loaded.export(format="gedcom")
@@ -47,3 +47,49 @@ def test_verify_20():
     parser = gedcom_parser.GedcomParser("test/samples/20_complex_sample.ged")
     result = parser.verify()
     assert result["status"] == "ok"
+    assert result["errors"] == []
+    assert result["warnings"] == []
+
+
+def test_verify_errors_10():
+    parser = gedcom_parser.GedcomParser("test/samples/10_invalid_level.ged")
+    result = parser.verify()
+    assert result["errors"] == [{"line": 4, "message": "Invalid level on line 4: 3 DATE 01 JAN 1900"}]
+    assert result["warnings"] == [{"line": 6, "message": "Missing TRLR record at the end of the file"}]
+
+
+INVALID_SAMPLE = """0 HEAD
+1 CHAR UTF-8
+0 @I1@ INDI
+1 NAME John /Doe/
+X BIRT
+3 DATE 1900
+0 @I1@ INDI
+0 @I2 INDI
+1
+0 TRLR
+"""
+
+
+def test_verify_multiple_errors(tmp_path):
+    path = tmp_path / "invalid.ged"
+    path.write_text(INVALID_SAMPLE)
+    result = gedcom_parser.GedcomParser(str(path)).verify()
+    assert result["status"] == "error"
+    assert result["message"] == "Invalid level number on line 5: X BIRT"
+    assert result["errors"] == [
+        {"line": 5, "message": "Invalid level number on line 5: X BIRT"},
+        {"line": 6, "message": "Invalid level on line 6: 3 DATE 1900"},
+        {"line": 7, "message": "Duplicate xref @I1@ of line 3 on line 7: 0 @I1@ INDI"},
+        {"line": 8, "message": "Invalid xref on line 8: 0 @I2 INDI"},
+        {"line": 9, "message": "Missing tag on line 9: 1"},
+    ]
+    assert result["warnings"] == []
+
+
+def test_verify_max_errors(tmp_path):
+    path = tmp_path / "invalid.ged"
+    path.write_text(INVALID_SAMPLE)
+    result = gedcom_parser.GedcomParser(str(path)).verify(max_errors=2)
+    assert [error["line"] for error in result["errors"]] == [5, 6]
+    assert result["warnings"] == []